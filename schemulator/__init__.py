@@ -1,9 +1,31 @@
+from collections import OrderedDict, namedtuple
+from copy import deepcopy
 from importlib import import_module
+import inspect
+import re
+import threading
+from weakref import WeakKeyDictionary
 
 from django import forms
+from django.forms.formsets import BaseFormSet, formset_factory
+from django.forms.models import fields_for_model
+from django.utils import six
+from django.utils.functional import Promise
 
 from json_schema_toolkit.document import JSONDocument, JSONDocumentField
 import wtforms
+from wtforms.meta import DefaultMeta
+
+from schemulator.frozen import FrozenDict, freeze
+from schemulator.metrics import instrument
+from schemulator.spec import SLOTS, FieldSpec
+from schemulator.utils import class_name, encode_schema, field_signature, schema_fingerprint
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # Python 2
+    from collections import Mapping
 
 
 """ 
@@ -101,94 +123,662 @@ FORMATS = {
 }
 
 
-def wtfield_to_schema(field):
+# Slots of the FieldSpecs converted fields start from, as generated by the
+# json_schema_toolkit field classes, by class name and IP protocol
+_TOOLKIT_SPECS = {}
+
+# Slots set from the Django Forms field attributes named in KEYWORDS
+_KEYWORD_SLOTS = tuple((field_kw, SLOTS[jschema_kw]) for (field_kw, jschema_kw) in KEYWORDS.items())
+
+# Resolved classes, by default module and class name or dotted path
+_RESOLVED = {}
+
+# Base classes of the classes schemas name, by default module. WTForms
+# widgets share no base class, and only need to be callable.
+# {MODULE : BASE CLASS}
+RESOLVED_BASES = {
+    'django.forms': forms.Field,
+    'django.forms.widgets': forms.Widget,
+    'wtforms': wtforms.Field,
+}
+
+# Shared WTForms widget instances, by class name or dotted path
+_WTFORMS_WIDGETS = {}
+
+# Shared WTForms validator instances, by class name and arguments
+_WTFORMS_VALIDATORS = OrderedDict()
+
+# Compiled regular expressions, by pattern
+_PATTERNS = OrderedDict()
+
+# Validators and patterns kept at most, as schemas may hold any number of
+# distinct arguments: the least recently used one goes first. Fields keep
+# their validators when these are dropped.
+MAX_WTFORMS_VALIDATORS = 1024
+MAX_PATTERNS = 512
+
+_LRU_LOCK = threading.Lock()
+
+
+def _lru_get(cache, key):
+    """
+    Returns the value of key in an OrderedDict used as a LRU cache, and marks
+    it as the most recently used. Raises KeyError when there is none.
+    """
+    with _LRU_LOCK:
+        value = cache.pop(key)
+        cache[key] = value
+    return value
+
+
+def _lru_set(cache, key, value, size):
+    with _LRU_LOCK:
+        cache[key] = value
+        while len(cache) > size:
+            cache.popitem(last=False)
+
+
+# Labels of the conversion metrics, as (framework, field type)
+
+def _form_labels(schema, form, *args, **kwargs):
+    form_cls = form if isinstance(form, type) else form.__class__
+    return ('wtforms' if issubclass(form_cls, wtforms.form.BaseForm) else 'django', '')
+
+
+def _form_type_labels(form, schema, form_type=None):
+    return (form_type or 'django', '')
+
+
+def _field_labels(spec, field):
+    if isinstance(field, wtforms.Field):
+        return ('wtforms', field.type)
+    return ('django', field.__class__.__name__)
+
+
+def _wtfield_labels(field, schema):
+    return ('wtforms', field.field_class.__name__)
+
+
+def _django_field_labels(field, schema):
+    return ('django', field.__class__.__name__)
+
+
+def _is_callable_class(cls):
+    return any('__call__' in vars(base) for base in cls.__mro__)
+
+
+def resolve_class(name, module):
+    """
+    Returns the class called name in the given module or, when name is a
+    dotted path, the class it points to. Classes are only looked up once.
+
+    Schemas may name anything, so ValueError is raised unless it is a class
+    derived from the RESOLVED_BASES class of the module, or a callable class
+    for WTForms widgets.
+    """
+    try:
+        return _RESOLVED[(module, name)]
+    except KeyError:
+        pass
+
+    if '.' in name:
+        (module_name, cls_name) = name.rsplit('.', 1)
+    else:
+        (module_name, cls_name) = (module, name)
+
+    cls = getattr(import_module(module_name), cls_name)
+    if not isinstance(cls, type):
+        raise ValueError("'%s' is not a class" % name)
+    base = RESOLVED_BASES.get(module)
+    if base is not None and not issubclass(cls, base):
+        raise ValueError("'%s' is not a subclass of %s" % (name, base.__name__))
+    if module == 'wtforms.widgets' and not _is_callable_class(cls):
+        raise ValueError("'%s' is not a WTForms widget" % name)
+    _RESOLVED[(module, name)] = cls
+    return cls
+
+
+def _toolkit_spec(name, protocol=None):
+    """
+    Returns a new FieldSpec holding the keywords the json_schema_toolkit field
+    class called name generates on its own, such as its type, format or
+    pattern. Each class only generates its schema once.
+    """
+    try:
+        (slots, extra) = _TOOLKIT_SPECS[(name, protocol)]
+    except KeyError:
+        jschema_field = resolve_class(name, 'json_schema_toolkit.document')()
+        if protocol is not None:
+            jschema_field.protocol = protocol
+        template = FieldSpec.from_schema(jschema_field._generate_schema())
+        slots = dict((slot, getattr(template, slot)) for slot in set(SLOTS.values())
+                     if hasattr(template, slot))
+        extra = template.extra
+        _TOOLKIT_SPECS[(name, protocol)] = (slots, extra)
+
+    spec = FieldSpec(**slots)
+    if extra:
+        spec.extra = deepcopy(extra)
+    return spec
+
+
+def resolve_wtforms_widget(name):
+    """
+    Returns a WTForms widget instance. WTForms widgets hold no state, so a
+    single instance of each widget class is shared by all the fields.
+    """
+    try:
+        return _WTFORMS_WIDGETS[name]
+    except KeyError:
+        widget = resolve_class(name, 'wtforms.widgets')()
+        _WTFORMS_WIDGETS[name] = widget
+        return widget
+
+
+def compile_pattern(pattern):
+    """
+    Returns the compiled regular expression of a pattern. Each pattern is only
+    compiled once.
+    """
+    try:
+        return _lru_get(_PATTERNS, pattern)
+    except KeyError:
+        regex = re.compile(pattern)
+        _lru_set(_PATTERNS, pattern, regex, MAX_PATTERNS)
+        return regex
+
+
+def resolve_wtforms_validator(name, kwargs):
+    """
+    Returns a WTForms validator instance. WTForms validators hold no state but
+    their arguments, so a single instance is shared by all the fields
+    validated with the same arguments.
+    """
+    # Types are part of the key, as 1 and 1.0 give different messages
+    key = (name, tuple(sorted((kw, type(value), value) for (kw, value) in kwargs.items())))
+    try:
+        return _lru_get(_WTFORMS_VALIDATORS, key)
+    except KeyError:
+        pass
+
+    if name == 'Regexp':
+        kwargs = dict(kwargs, regex=compile_pattern(kwargs['regex']))
+    validator = resolve_class(name, 'wtforms.validators')(**kwargs)
+    _lru_set(_WTFORMS_VALIDATORS, key, validator, MAX_WTFORMS_VALIDATORS)
+    return validator
+
+
+def _call_arguments(cls, args, kwargs):
+    """
+    Returns the arguments a class would be instantiated with, by name,
+    including the default values of the ones left out.
+    """
+
+    init = cls.__init__
+    try:
+        argspec = inspect.getfullargspec(init)
+        varkw = argspec.varkw
+    except AttributeError:
+        # Python 2
+        argspec = inspect.getargspec(init)
+        varkw = argspec.keywords
+
+    arguments = inspect.getcallargs(init, None, *args, **kwargs)
+    arguments.pop(argspec.args[0])
+    if varkw:
+        arguments.update(arguments.pop(varkw))
+    return arguments
+
+
+_Label = namedtuple('_Label', 'text')
+
+
+class UnboundFieldView(wtforms.Field):
+    """
+    Exposes what wtfield_to_spec reads from a WTForms field, taken from the
+    UnboundField declared by a form class, without binding it.
+    """
+
+    def __new__(cls, *args, **kwargs):
+        # Fields instantiated without a form are unbound ones otherwise
+        return object.__new__(cls)
+
+    def __init__(self, name, unbound_field):
+        field_cls = unbound_field.field_class
+        arguments = _call_arguments(field_cls, unbound_field.args, unbound_field.kwargs)
+
+        self.name = name
+        self.type = field_cls.__name__
+        label = arguments.get('label')
+        if label is None:
+            label = name.replace('_', ' ').title()
+        self.label = _Label(label)
+        self.description = arguments.get('description', '')
+        self.default = arguments.get('default')
+        self.widget = arguments.get('widget') or field_cls.widget
+        self.validators = list(arguments.get('validators') or field_cls.validators)
+        if 'choices' in arguments:
+            self.choices = arguments['choices']
+
+        if self.type == 'FieldList':
+            self.unbound_field = arguments['unbound_field']
+            self.min_entries = arguments.get('min_entries', 0)
+            self.max_entries = arguments.get('max_entries')
+            self.meta = DefaultMeta()
+
+
+# Views of the fields of WTForms classes, by form class, along with the list
+# of unbound fields they were made from
+_UNBOUND_FIELD_VIEWS = WeakKeyDictionary()
+
+
+def unbound_field_views(form_cls):
     """
+    Returns the (name, UnboundFieldView) pairs of the fields of a WTForms
+    class, in the order its instances would have them.
+    """
+
+    if form_cls._unbound_fields is None:
+        # As WTForms does on the first instantiation of the class
+        fields = []
+        for name in dir(form_cls):
+            if not name.startswith('_'):
+                unbound_field = getattr(form_cls, name)
+                if hasattr(unbound_field, '_formfield'):
+                    fields.append((name, unbound_field))
+        fields.sort(key=lambda x: (x[1].creation_counter, x[0]))
+        form_cls._unbound_fields = fields
+
+    # Adding or removing fields resets the list of unbound fields
+    (unbound_fields, views) = _UNBOUND_FIELD_VIEWS.get(form_cls, (None, None))
+    if unbound_fields is not form_cls._unbound_fields:
+        unbound_fields = form_cls._unbound_fields
+        views = [(name, UnboundFieldView(name, unbound_field))
+                 for (name, unbound_field) in unbound_fields]
+        _UNBOUND_FIELD_VIEWS[form_cls] = (unbound_fields, views)
+
+    return views
+
+
+def wtfield_to_spec(field):
+    """
+    Returns the FieldSpec describing a WTForms field.
     """
     field_type = field.type  
+
+    if field_type == 'FieldList':
+        return fieldlist_to_spec(field)
         
-    mod = import_module('json_schema_toolkit.document', WTFIELDS[field_type])
     try:
-        jschema_field = getattr(mod, WTFIELDS[field_type])()
+        spec = _toolkit_spec(WTFIELDS[field_type])
     except AttributeError:
         raise AttributeError(field_type + " is currently unsupported.")
 
     # Setup of common JSON Schema keywords 
-    setattr(jschema_field, 'title', field.label.text)
-    setattr(jschema_field, 'description', field.description)
-    setattr(jschema_field, 'default', field.default)
+    spec.title = field.label.text
+    spec.description = field.description
+    spec.default = field.default
 
-    schema = jschema_field._generate_schema()
-
-    schema['__wtforms_field_cls'] = field_type
-    schema['__widget'] = field.widget.__class__.__name__
+    spec.wtforms_field_cls = field_type
+    spec.widget = class_name(field.widget.__class__, 'wtforms.widgets')
 
     if  field_type == 'SelectField' or \
         field_type == 'SelectMultipleField' or \
         field_type == 'RadioField':
-        schema['enum'] = field.choices 
+        spec.enum = field.choices 
 
     # Setup of jsonschema keywords depending on validators
     for validator in  field.validators:
         val = validator.__class__.__name__
         
         if val == 'Optional':
-            schema['optional']=True
+            spec.optional = True
         if val == 'Email':
-            schema['format']='email'
+            spec.format = 'email'
         if val == 'NumberRange':
-            if validator.min is not None: schema['minimum'] = validator.min
-            if validator.max is not None: schema['maximum'] = validator.max
+            if validator.min is not None: spec.minimum = validator.min
+            if validator.max is not None: spec.maximum = validator.max
         if val == 'Length':
-            if validator.min is not -1: schema['minLength'] = validator.min 
-            if validator.max is not -1: schema['maxLength'] = validator.max
+            if validator.min is not -1: spec.min_length = validator.min 
+            if validator.max is not -1: spec.max_length = validator.max
         if val == 'IPAddress':
-            if validator.ipv4: schema['format'] = 'ipv4'
-            if validator.ipv6: schema['format'] = 'ipv6' 
+            if validator.ipv4: spec.format = 'ipv4'
+            if validator.ipv6: spec.format = 'ipv6' 
         if val == 'URL' or  val == 'Regexp':
-            schema['pattern']=validator.regex.pattern
+            spec.pattern = validator.regex.pattern
 
-    return schema
+    return spec
 
 
-def field_to_schema(field):
+def wtfield_to_schema(field):
+    """
+    Returns the schema fragment describing a WTForms field.
     """
+    return wtfield_to_spec(field).to_schema()
+
+
+def fieldlist_to_spec(field):
+    """
+    Returns the FieldSpec describing a WTForms FieldList: an array whose items
+    are described by the schema of the repeated form or field.
+    """
+
+    entry = field.unbound_field.bind(form=None, name=field.name, _meta=field.meta)
+    if isinstance(entry, wtforms.FormField):
+        items = deepcopy(_items_schema(entry.form_class))
+    else:
+        items = field_to_schema(entry)
+
+    schema = {
+        'type': 'array',
+        'title': field.label.text,
+        'items': items,
+        '__wtforms_field_cls': 'FieldList',
+    }
+    if field.description: schema['description'] = field.description
+    if field.min_entries: schema['minItems'] = field.min_entries
+    if field.max_entries is not None: schema['maxItems'] = field.max_entries
+
+    return FieldSpec.from_schema(schema)
+
+
+@instrument('field_to_spec', _field_labels, 'fields')
+def field_to_spec(field):
+    """
+    Returns the FieldSpec describing a Django Forms or WTForms field.
     """
 
     if isinstance(field, wtforms.Field):
-        schema = wtfield_to_schema(field)
-        return schema
+        return wtfield_to_spec(field)
 
     field_type = field.__class__.__name__  
         
-    mod = import_module('json_schema_toolkit.document', FIELDS[field_type])
-    jschema_field = getattr(mod, FIELDS[field_type])()
-    
     # Special case for GenericIPAddressField, as protocol is not a field
     # attribute, and must be deduced from the validator.
+    protocol = None
     if field_type == "GenericIPAddressField":
         validator = str(field.validators[0]) 
-        value = 'ipv6' if 'ipv6' in validator else 'ipv4'
-        setattr(jschema_field, 'protocol', value)
-    
-    # Setup of JSON Schema keywords 
-    for (field_kw, jschema_kw) in KEYWORDS.items():
+        protocol = 'ipv6' if 'ipv6' in validator else 'ipv4'
+
+    spec = _toolkit_spec(FIELDS[field_type], protocol)
+
+    # Setup of JSON Schema keywords. As with the toolkit, keywords which are
+    # not always generated are left out when the attribute is None.
+    for (field_kw, slot) in _KEYWORD_SLOTS:
         if hasattr(field, field_kw):
             value = getattr(field, field_kw)
             # Special case, optional != required
-            if field_kw == "required": value = not value
-            setattr(jschema_field, jschema_kw, value)
-    
-    schema = jschema_field._generate_schema()
+            if field_kw == "required":
+                value = not value
+            elif value is None and not hasattr(spec, slot):
+                continue
+            setattr(spec, slot, value)
 
     # Set __django_form_field_cls keyword
-    schema['__django_form_field_cls'] = field_type
-    schema['__widget'] = field.widget.__class__.__name__
+    spec.django_field_cls = field_type
+    spec.widget = class_name(field.widget.__class__, 'django.forms.widgets')
+
+    return spec
+
+
+def field_to_schema(field):
+    """
+    Returns the schema fragment describing a Django Forms or WTForms field.
+    """
+    return field_to_spec(field).to_schema()
+
+
+def _schema_type(schema):
+    """
+    Returns the JSON type of a schema fragment. Nullable fragments may carry a
+    list of types, of which the one which is not 'null' is returned.
+    """
+    json_type = schema.get('type', 'string')
+    if isinstance(json_type, (list, tuple)):
+        json_type = [t for t in json_type if t != 'null'][0]
+    return json_type
+
+
+def infer_field_cls(schema):
+    """
+    Returns the name of the Django Forms field class that best describes a
+    schema fragment, without regard to the '__django_form_field_cls' keyword.
+    """
+    json_type = _schema_type(schema)
+
+    if 'enum' in schema:
+        return 'ChoiceField'
+    if 'format' in schema and json_type == 'string':
+        return FORMATS.get(schema['format'], 'CharField')
+    return TYPES[json_type]
+
+
+def infer_wtfield_cls(schema):
+    """
+    Returns the name of the WTForms field class that best describes a schema
+    fragment, without regard to the '__wtforms_field_cls' keyword.
+    """
+    json_type = _schema_type(schema)
+
+    if json_type == 'array':
+        return 'FieldList'
+    if 'enum' in schema:
+        return 'SelectField'
+    if 'format' in schema and json_type == 'string':
+        if schema['format'] == 'date-time':
+            return 'DateTimeField'
+        return 'StringField'
+
+    field_type = TYPES[json_type]
+    if field_type == 'CharField':
+        field_type = 'StringField'
+    return field_type
+
+
+# Values of schema keywords which are the same as leaving them out
+DEFAULT_VALUES = {
+    'null': (False,),
+    'optional': (False,),
+    'description': (None, ''),
+}
+
+
+def minify_spec(spec):
+    """
+    Returns a copy of a FieldSpec without the keywords that schema_to_field
+    and schema_to_wtfield would infer anyway.
+    """
+
+    schema = {}
+    for (keyword, value) in spec.to_schema().items():
+        if value is None and keyword != 'type':
+            continue
+        if keyword in DEFAULT_VALUES and value in DEFAULT_VALUES[keyword]:
+            continue
+        schema[keyword] = value
+
+    minified = FieldSpec.from_schema(schema)
+
+    # Field class hints are only kept when they could not be inferred, and
+    # widget hints when they are not the field class default widget.
+    field_type = minified.pop('__django_form_field_cls')
+    if field_type is not None:
+        if field_type != infer_field_cls(minified):
+            minified.django_field_cls = field_type
+        field_cls = getattr(forms, field_type, None)
+        if field_cls and minified.get('__widget') == field_cls.widget.__name__:
+            minified.pop('__widget')
+
+    field_type = minified.pop('__wtforms_field_cls')
+    if field_type is not None:
+        if field_type != infer_wtfield_cls(minified):
+            minified.wtforms_field_cls = field_type
+        field_cls = getattr(wtforms, field_type, None)
+        widget = getattr(field_cls, 'widget', None)
+        if widget and minified.get('__widget') == widget.__class__.__name__:
+            minified.pop('__widget')
+
+    return minified
+
+
+def minify_field_schema(schema):
+    """
+    Returns a copy of a schema fragment describing a field without the
+    keywords that schema_to_field and schema_to_wtfield would infer anyway.
+    """
+    return minify_spec(FieldSpec.from_schema(schema)).to_schema()
+
+
+class LazyProperties(Mapping):
+    """
+    Read-only mapping of field names to their schema fragments, where each
+    field is only converted the first time its fragment is read. dict() of it
+    gives the plain dictionary of properties.
+    """
+
+    def __init__(self, fields, minify=False):
+        self._fields = OrderedDict(fields)
+        self._minify = minify
+        self._converted = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._converted[name]
+        except KeyError:
+            pass
+
+        spec = field_to_spec(self._fields[name])
+        if self._minify:
+            spec = minify_spec(spec)
+        prop = self._converted[name] = spec.to_schema()
+        return prop
 
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def copy(self):
+        """
+        Returns the plain dictionary of properties, as dict.copy() would.
+        """
+        return dict(self)
+
+    def __repr__(self):
+        return 'LazyProperties(%r)' % list(self._fields)
+
+
+# Field schemas of form classes, by form class, then by field name, minify and
+# frozen, then by field signature. The fields of the class itself are also
+# kept by identity, under ('class', name, minify, frozen). Entries go away
+# with their form class.
+_FIELD_SCHEMAS = WeakKeyDictionary()
+
+# Field schemas kept at most for each field name, as forms may vary them by
+# request: the least recently computed one goes first.
+MAX_FIELD_VARIANTS = 8
+
+# Types of the values of field schemas which are never modified in place, as
+# well as tuples of them
+_IMMUTABLE_TYPES = six.integer_types + (type(None), float, six.text_type, str, Promise,
+                                        FrozenDict)
+
+
+def _immutable(value):
+    if isinstance(value, tuple):
+        return all(_immutable(v) for v in value)
+    return isinstance(value, _IMMUTABLE_TYPES)
+
+
+def _memo_entry(schema, frozen):
+    """
+    Returns the memo entry of a field schema: the schema, frozen with frozen,
+    and the keywords whose values must be copied along with it, as (keyword,
+    shallow) pairs, where shallow tells a copy of the value itself is enough.
+    """
+
+    if frozen:
+        return freeze(schema), ()
+
+    containers = []
+    for (keyword, value) in schema.items():
+        if not _immutable(value):
+            # Enums are lists of (value, label) tuples
+            shallow = isinstance(value, list) and all(_immutable(v) for v in value)
+            containers.append((keyword, shallow))
+    return schema, tuple(containers)
+
+
+def _copy_memo_entry(entry):
+    """
+    Returns the schema of a memo entry, copied unless it is frozen. Field
+    schemas are flat, so only the lists and dictionaries they hold are copied.
+    """
+
+    (schema, containers) = entry
+    if isinstance(schema, FrozenDict):
+        return schema
+
+    schema = dict(schema)
+    for (keyword, shallow) in containers:
+        value = schema[keyword]
+        schema[keyword] = list(value) if shallow else deepcopy(value)
     return schema
 
 
-def form_to_schema(form):
+def _memoized_field_schema(memo, name, field, minify=False, frozen=False, class_level=False):
+    """
+    Returns the schema fragment of a field, which is only computed when the
+    memo of its form class has none for the field signature. Fields of the
+    form class itself, given with class_level, are recognized by identity
+    instead, without computing their signature. Frozen schemas are returned
+    as they are, and others are copies.
+    """
+
+    if class_level:
+        class_key = ('class', name, minify, frozen)
+        (class_field, entry) = memo.get(class_key, (None, None))
+        if class_field is field:
+            return _copy_memo_entry(entry)
+
+    key = (name, minify, frozen)
+    variants = memo.get(key)
+    if variants is None:
+        variants = memo[key] = OrderedDict()
+
+    try:
+        signature = field_signature(field)
+        entry = variants.get(signature)
+    except TypeError:
+        # Attribute values which can not be hashed, such as sets
+        (signature, entry) = (None, None)
+
+    if entry is None:
+        spec = field_to_spec(field)
+        if minify:
+            spec = minify_spec(spec)
+        entry = _memo_entry(spec.to_schema(), frozen)
+        if signature is not None:
+            variants[signature] = entry
+            if len(variants) > MAX_FIELD_VARIANTS:
+                variants.popitem(last=False)
+
+    if class_level:
+        memo[class_key] = (field, entry)
+
+    return _copy_memo_entry(entry)
+
+
+def fields_to_schema(fields, minify=False, lazy=False, memo=None, frozen=False,
+                     class_level=False):
     """
+    Returns the JSON schema whose properties describe the given sequence of
+    (name, field) pairs. With lazy, properties are a LazyProperties mapping.
+    With memo, a dictionary kept by the caller, field schemas are reused from
+    it whenever the fields did not change, and are frozen ones with frozen.
+    class_level tells the fields are the ones of a form class, and are only
+    looked at again when they are replaced.
     """
 
     schema = {  
@@ -197,80 +787,263 @@ def form_to_schema(form):
         'description':'This is a JSON Schema describing a form',
         'properties':{}
     }
-    
-    if isinstance(form, wtforms.form.BaseForm):
-        for field in form:
 
-            field_schema = field_to_schema(field)
-            schema['properties'][field.name] = field_schema
+    if lazy:
+        schema['properties'] = LazyProperties(fields, minify)
+        return schema
+
+    # Loop through all form fields, get their JSON schema representation and
+    # add it to the schema properties
+    for (name, field) in fields:
+
+        # Field lists hold forms, whose schemas are already reused
+        if memo is not None and getattr(field, 'type', None) != 'FieldList':
+            schema['properties'][name] = _memoized_field_schema(memo, name, field, minify, frozen,
+                                                                class_level)
+            continue
+
+        spec = field_to_spec(field)
+        if minify:
+            spec = minify_spec(spec)
+        schema['properties'][name] = spec.to_schema()
+
+    return schema
+
+
+@instrument('form_to_schema', _form_labels)
+def form_to_schema(form, minify=False, fields=None, exclude=None, lazy=False,
+                   incremental=False, frozen=False):
+    """
+    Returns the JSON schema describing a Django Form or a WTForm, or their
+    class, which is converted without being instantiated. With minify,
+    keywords that can be inferred back when converting the schema to a form
+    are left out of the field schemas.
+
+    Only the fields named in fields, in that order, are converted when it is
+    given, and the fields named in exclude are left out. With lazy, each field
+    is only converted when its schema is read from the properties mapping.
+
+    With incremental, field schemas are kept by form class, and only the
+    fields which differ from the ones converted before are converted again,
+    for forms which change their fields on instantiation.
+
+    With frozen, the schema is read-only, as built by freeze().
+    """
+
+    if isinstance(form, BaseFormSet) or \
+       (isinstance(form, type) and issubclass(form, BaseFormSet)):
+        schema = formset_to_schema(form, minify, frozen)
+        return freeze(schema) if frozen else schema
+
+    if isinstance(form, type):
+        form_cls = form
+        if issubclass(form, wtforms.form.BaseForm):
+            form_fields = OrderedDict(unbound_field_views(form))
+        else:
+            form_fields = form.base_fields
     else:
-        # Loop through all form fields, get their JSON schema representation and
-        # add it to the schema properties
-        for (name, field) in form.fields.items():
+        form_cls = form.__class__
+        if isinstance(form, wtforms.form.BaseForm):
+            form_fields = form._fields
+        else:
+            form_fields = form.fields
+
+    if fields is not None:
+        names = fields
+    else:
+        names = form_fields.keys()
+    if exclude:
+        exclude = set(exclude)
+        names = [name for name in names if name not in exclude]
+
+    memo = None
+    if incremental and not lazy:
+        memo = _FIELD_SCHEMAS.get(form_cls)
+        if memo is None:
+            memo = _FIELD_SCHEMAS[form_cls] = {}
 
-            field_schema = field_to_schema(field)
-            schema['properties'][name] = field_schema
+    schema = fields_to_schema([(name, form_fields[name]) for name in names],
+                              minify, lazy, memo, frozen, isinstance(form, type))
+    return freeze(schema) if frozen else schema
 
+
+# Schemas of the items of formsets and field lists, by form class and then by
+# minify and frozen. Entries go away with their form class.
+_ITEM_SCHEMAS = WeakKeyDictionary()
+
+
+def _items_schema(form_cls, minify=False, frozen=False):
+    """
+    Returns the schema of a form class repeated by a formset or a field list.
+    It is computed once per form class, and must not be modified.
+    """
+
+    item_schemas = _ITEM_SCHEMAS.get(form_cls)
+    if item_schemas is None:
+        item_schemas = _ITEM_SCHEMAS[form_cls] = {}
+
+    schema = item_schemas.get((minify, frozen))
+    if schema is None:
+        schema = item_schemas[(minify, frozen)] = form_to_schema(form_cls, minify, frozen=frozen)
     return schema
 
 
-def schema_to_wtfield(schema):
+def formset_to_schema(formset, minify=False, frozen=False):
     """
-    Returns a WTForms Field when given a schema fragment. Returns a field which
-    is Unbound.
+    Returns the JSON schema describing a Django formset or formset class: an
+    array whose items are described by the schema of the formset form, and
+    whose options are kept in the '__formset' keyword. With frozen, the items
+    schema is a frozen one shared by all the formsets of the form.
     """
-    
+
+    if not isinstance(formset, type):
+        formset = formset.__class__
+
+    options = {
+        'extra': formset.extra,
+        'can_order': formset.can_order,
+        'can_delete': formset.can_delete,
+        'max_num': formset.max_num,
+        'validate_max': formset.validate_max,
+        # Django >= 1.7
+        'min_num': getattr(formset, 'min_num', 0),
+        'validate_min': getattr(formset, 'validate_min', False),
+    }
+
+    schema = {
+        '$schema':'http://json-schema.org/draft-04/schema#',
+        'title':'JSON Schema',
+        'description':'This is a JSON Schema describing a formset',
+        'type':'array',
+        # Copies of frozen schemas are the schemas themselves
+        'items':deepcopy(_items_schema(formset.form, minify, frozen)),
+        '__formset':options,
+    }
+    if options['validate_min']: schema['minItems'] = options['min_num']
+    if options['validate_max']: schema['maxItems'] = options['max_num']
+
+    return schema
+
+
+# Schemas of models, by model class and then by requested fields. Entries go
+# away with their model class, so reloaded classes are converted anew.
+_MODEL_SCHEMAS = WeakKeyDictionary()
+
+
+def model_to_schema(model, fields=None, exclude=None, minify=False, frozen=False):
+    """
+    Returns the JSON schema describing the ModelForm of a model, restricted to
+    the given fields and without the excluded ones, without instantiating any
+    form. The schema is only computed once per model class. Frozen schemas
+    are returned as they are, and others are copies.
+    """
+
+    key = (tuple(fields) if fields is not None else None,
+           tuple(exclude) if exclude is not None else None,
+           minify,
+           frozen)
+
+    model_schemas = _MODEL_SCHEMAS.get(model)
+    if model_schemas is None:
+        model_schemas = _MODEL_SCHEMAS[model] = {}
+
+    schema = model_schemas.get(key)
+    if schema is None:
+        form_fields = fields_for_model(model, fields, exclude)
+        schema = fields_to_schema([(name, field) for (name, field) in form_fields.items()
+                                   if field is not None], minify)
+        if frozen:
+            schema = freeze(schema)
+        model_schemas[key] = schema
+
+    # Copies of frozen schemas are the schemas themselves
+    return deepcopy(schema)
+
+
+def wtfield_arguments(spec):
+    """
+    Returns the name of the WTForms field class described by a FieldSpec, the
+    keyword arguments to instantiate it with, other than the widget and the
+    validators, and its validators as (validator class name, kwargs) pairs.
+    """
+
     kwargs = {}
     validators = []
 
     # This block sets the value of relevant field keyword arguments
-    if 'description' in schema: kwargs['description'] = schema['description']
-    if 'title' in schema: kwargs['label'] = schema['title']
-    if 'default' in schema: kwargs['default'] = schema['default']
-    if 'optional' in schema: validators.append(wtforms.validators.Optional())
-    if 'minLength' in schema: validators.append(wtforms.validators.Length(min=schema['minLength']))
-    if 'maxLength' in schema: validators.append(wtforms.validators.Length(max=schema['maxLength']))
-    if 'minimum' in schema: validators.append(wtforms.validators.NumberRange(min=schema['minimum']))
-    if 'maximum' in schema: validators.append(wtforms.validators.NumberRange(max=schema['maximum']))
-    if 'pattern' in schema: validators.append(wtforms.validators.Regexp(schema['pattern']))
+    if 'description' in spec: kwargs['description'] = spec['description']
+    if 'title' in spec: kwargs['label'] = spec['title']
+    if 'default' in spec: kwargs['default'] = spec['default']
+    if 'enum' in spec: kwargs['choices'] = spec['enum']
+    if 'minItems' in spec: kwargs['min_entries'] = spec['minItems']
+    if 'maxItems' in spec: kwargs['max_entries'] = spec['maxItems']
+    if spec.get('optional'): validators.append(('Optional', {}))
+
+    # Bounds are checked by a single validator each
+    length = {}
+    if 'minLength' in spec: length['min'] = spec['minLength']
+    if 'maxLength' in spec: length['max'] = spec['maxLength']
+    if length: validators.append(('Length', length))
+
+    number_range = {}
+    if 'minimum' in spec: number_range['min'] = spec['minimum']
+    if 'maximum' in spec: number_range['max'] = spec['maximum']
+    if number_range: validators.append(('NumberRange', number_range))
+
+    if 'pattern' in spec: validators.append(('Regexp', {'regex': spec['pattern']}))
+
+    if 'format' in spec and _schema_type(spec) == 'string':
+        if spec['format'] == 'ipv4':
+            validators.append(('IPAddress', {'ipv4': True}))
+        if spec['format'] =='ipv6': 
+            validators.append(('IPAddress', {'ipv6': True}))
+        if spec['format'] == 'email': 
+            validators.append(('Email', {}))
     
     # This block decides upon which form wtfield should be used.
-    if '__wtforms_field_cls' in schema:
-        field_type = schema['__wtforms_field_cls']
-    elif 'enum' in schema:
-        field_type = 'SelectField'
-        kwargs['choices'] = schema['enum']
-    elif 'format' in schema and schema['type'] == 'string':
-        field_type = 'StringField'
-        if schema['format'] == 'ipv4':
-            validators.append(wtforms.validators.IPAddress(ipv4=True))
-        if schema['format'] =='ipv6': 
-            validators.append(wtforms.validators.IPAddress(ipv6=True))
-        if schema['format'] == 'email': 
-            validators.append(wtforms.validators.Email())
-        if schema['format'] == 'date-time': 
-            field_type = 'DateTimeField'
+    if '__wtforms_field_cls' in spec:
+        field_type = spec['__wtforms_field_cls']
     else: 
-        field_type = TYPES[schema['type']]
-        if field_type=='CharField': field_type='StringField' 
-    
-    kwargs['validators']=validators
+        field_type = infer_wtfield_cls(spec)
 
-    if '__widget' in schema:
-        mod = import_module('wtforms.widgets', schema['__widget'])
-        widget = getattr(mod, schema['__widget'])() 
-        kwargs['widget'] = widget
+    return field_type, kwargs, validators
 
-    mod = import_module('wtforms', field_type)
-    form_field = getattr(mod, field_type)(**kwargs)
+
+@instrument('schema_to_wtfield', _wtfield_labels, 'fields')
+def schema_to_wtfield(schema):
+    """
+    Returns a WTForms Field when given a schema fragment or its FieldSpec.
+    Returns a field which is Unbound.
+    """
+
+    # Schema fragments and FieldSpecs are read alike
+    spec = schema
+    field_type, kwargs, validators = wtfield_arguments(spec)
+
+    kwargs['validators'] = [resolve_wtforms_validator(name, validator_kwargs)
+                            for (name, validator_kwargs) in validators]
+
+    if '__widget' in spec:
+        kwargs['widget'] = resolve_wtforms_widget(spec['__widget'])
+
+    # Field lists repeat a form, or a field, described by the items schema
+    args = ()
+    if field_type == 'FieldList':
+        items = spec['items']
+        if 'properties' in items:
+            args = (wtforms.FormField(_cached_form_class(items, 'wtforms')),)
+        else:
+            args = (schema_to_wtfield(items),)
+
+    form_field = resolve_class(field_type, 'wtforms')(*args, **kwargs)
 
     return form_field
 
 
-def schema_to_field(schema):
+def field_arguments(spec):
     """
-    Returns a Django Forms field when given a schema fragment describing a 
-    field: that is, any entry of the 'properties' keyword
+    Returns the name of the Django Forms field class described by a FieldSpec
+    and the keyword arguments to instantiate it with, other than the widget.
     """
 
     # This block sets the value of relevant field keyword arguments
@@ -278,8 +1051,8 @@ def schema_to_field(schema):
     kwargs = {}
 
     for (field_kw, jschema_kw) in KEYWORDS.items():
-        if jschema_kw in schema:
-            value = schema[jschema_kw]
+        if jschema_kw in spec:
+            value = spec[jschema_kw]
             if jschema_kw == "optional":
                 value = not value
             kwargs[field_kw]=value
@@ -288,33 +1061,120 @@ def schema_to_field(schema):
     # explicitly specified in a JSON schema via the '__django_form_field_cls'
     # keyword
 
-    if '__django_form_field_cls' in schema:
-        field_type = schema['__django_form_field_cls']
-    elif 'enum' in schema:
-        field_type = 'ChoiceField'
-    elif 'format' in schema and schema['type'] == 'string':
-        field_type = FORMATS[schema['format']]
-        # Special case for ipv6
-        if schema['format'] == 'ipv6': kwargs['protocol']='ipv6'
+    if '__django_form_field_cls' in spec:
+        field_type = spec['__django_form_field_cls']
     else: 
-        field_type = TYPES[schema['type']]
+        field_type = infer_field_cls(spec)
+
+    # Special case for ipv6
+    if field_type == 'GenericIPAddressField' and spec.get('format') == 'ipv6':
+        kwargs['protocol']='ipv6'
 
-    if '__widget' in schema:
-        mod = import_module('django.forms.widgets', schema['__widget'])
-        widget = getattr(mod, schema['__widget'])() 
-        kwargs['widget'] = widget
+    return field_type, kwargs
 
-    mod = import_module('django.forms', field_type)
-    form_field = getattr(mod, field_type)
+
+@instrument('schema_to_field', _django_field_labels, 'fields')
+def schema_to_field(schema):
+    """
+    Returns a Django Forms field when given a schema fragment describing a 
+    field: that is, any entry of the 'properties' keyword, or its FieldSpec.
+    """
+
+    # Schema fragments and FieldSpecs are read alike
+    spec = schema
+    field_type, kwargs = field_arguments(spec)
+
+    # Django Forms fields instantiate widgets given as a class themselves
+    if '__widget' in spec:
+        kwargs['widget'] = resolve_class(spec['__widget'], 'django.forms.widgets')
+
+    form_field = resolve_class(field_type, 'django.forms')
     field = form_field(**kwargs)
 
     return field
 
 
-def schema_to_form(schema, form_type=None):
+# Form and formset classes described by array schemas and their items, by
+# fingerprint of the schema and form type: the least recently used one goes
+# first
+_CACHED_CLASSES = OrderedDict()
+MAX_CACHED_CLASSES = 256
+
+
+def _cached_form_class(schema, form_type=None):
+    """
+    Returns the class schema_to_form_class gives a schema, which is only built
+    once for equal schemas, as long as it is among the MAX_CACHED_CLASSES most
+    recently used.
+    """
+
+    key = (schema_fingerprint(encode_schema(schema)), form_type)
+    try:
+        return _lru_get(_CACHED_CLASSES, key)
+    except KeyError:
+        pass
+
+    form_cls = schema_to_form_class(schema, form_type)
+    _lru_set(_CACHED_CLASSES, key, form_cls, MAX_CACHED_CLASSES)
+    return form_cls
+
+
+def _formset_class(schema, form_type=None):
     """
+    Returns the formset class described by an array schema.
     """
 
+    if form_type == 'wtforms':
+
+        class Form(wtforms.Form):
+            items = schema_to_wtfield(dict(schema, __wtforms_field_cls='FieldList'))
+
+        return Form
+
+    options = schema.get('__formset') or {
+        'min_num': schema.get('minItems', 0),
+        'validate_min': 'minItems' in schema,
+        'max_num': schema.get('maxItems'),
+        'validate_max': 'maxItems' in schema,
+    }
+    # Django < 1.7 formsets have no minimum number of forms
+    options = dict((k, v) for (k, v) in options.items()
+                   if v or k not in ('min_num', 'validate_min'))
+
+    return formset_factory(_cached_form_class(schema['items']), **options)
+
+
+def schema_to_formset(schema, form_type=None):
+    """
+    Returns the formset class described by an array schema, whose items
+    describe the form it repeats. By default it is a Django formset. WTForms
+    have no formsets, so for 'wtforms' it is a WTForm whose only field, items,
+    is a FieldList of the item form. Classes are only built once for equal
+    schemas, as long as they are among the MAX_CACHED_CLASSES most recently
+    used.
+    """
+
+    key = (schema_fingerprint(encode_schema(schema)), form_type, 'formset')
+    try:
+        return _lru_get(_CACHED_CLASSES, key)
+    except KeyError:
+        pass
+
+    formset_cls = _formset_class(schema, form_type)
+    _lru_set(_CACHED_CLASSES, key, formset_cls, MAX_CACHED_CLASSES)
+    return formset_cls
+
+
+def schema_to_form_class(schema, form_type=None):
+    """
+    Returns a form class whose fields are described by the properties of a
+    schema. By default the class is a Django Form, and a WTForm when form_type
+    is 'wtforms'. Array schemas give the formset class of schema_to_formset.
+    """
+
+    if schema.get('type') == 'array':
+        return schema_to_formset(schema, form_type)
+
     # Case for wtforms
     if form_type == 'wtforms':
 
@@ -325,16 +1185,73 @@ def schema_to_form(schema, form_type=None):
             field = schema_to_wtfield(prop)
             setattr(Form, name, field)
         
-        return Form()
+        return Form
 
-    # Case for Django Forms
-    form = forms.Form()
+    # Case for Django Forms. Fields are created in the order of the schema
+    # properties, which the declarative metaclass preserves.
+    fields = {}
+    for (name, prop) in schema['properties'].items():
+        fields[name] = schema_to_field(prop)
 
-    # loop along fields
+    return type('Form', (forms.Form,), fields)
+
+
+@instrument('schema_to_form', _form_type_labels)
+def schema_to_form(schema, form_type=None):
+    """
+    Returns a form whose fields are described by the properties of a schema.
+    By default the form is a Django Form, and a WTForm when form_type is
+    'wtforms'. Django Forms are bare forms.Form instances holding the fields,
+    so use schema_to_form_class to get a class to instantiate many times.
+    """
+
+    if form_type == 'wtforms' or schema.get('type') == 'array':
+        return schema_to_form_class(schema, form_type)()
+
+    # Case for Django Forms. Setting the fields on a bare form saves going
+    # through the declarative metaclass, and deep copying the fields.
+    form = forms.Form()
     for (name, prop) in schema['properties'].items():
-    
-        field = schema_to_field(prop)
-        form.fields[name] = field
+        form.fields[name] = schema_to_field(prop)
+
+    return form
+
+
+class JSONFormData(dict):
+    """
+    Exposes a dictionary of JSON field values through the getlist() interface
+    WTForms expects from form data, so that values go through the same
+    coercion and validation as submitted ones.
+    """
+
+    def getlist(self, key):
+        value = self.get(key)
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            value = [value]
+        # BooleanField only recognizes false values as strings
+        return ['false' if v is False else v for v in value]
+
+
+def bind_many(schema, payloads, form_type=None, cleaned=False):
+    """
+    Builds the form class described by a schema once, and yields a bound and
+    validated form for each of the payloads, which are dictionaries of field
+    values. With cleaned, (cleaned data, errors) pairs are yielded instead of
+    the forms.
+    """
+
+    form_cls = schema_to_form_class(schema, form_type)
 
-    return form 
+    for payload in payloads:
+        if form_type == 'wtforms':
+            form = form_cls(JSONFormData(payload))
+            form.validate()
+            result = (form.data, form.errors)
+        else:
+            form = form_cls(payload)
+            form.is_valid()
+            result = (form.cleaned_data, form.errors)
 
+        yield result if cleaned else form
@@ -0,0 +1,225 @@
+import argparse
+from itertools import islice
+import json
+import multiprocessing
+import os
+import sys
+
+
+"""
+Command line interface of schemulator:
+
+    python -m schemulator migrate [input] [output] [options]
+
+Without DJANGO_SETTINGS_MODULE, Django is set up with its default settings.
+"""
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _configure():
+    """
+    Sets Django up with its default settings when no settings module is
+    given.
+    """
+    from django.conf import settings
+    if not settings.configured and not os.environ.get('DJANGO_SETTINGS_MODULE'):
+        settings.configure()
+    try:
+        from django import setup
+    except ImportError:
+        # Django < 1.7
+        return
+    setup()
+
+
+def _read_keywords(prop):
+    """
+    Returns the keywords schemulator reads from the schema of a property, once
+    minified, along with their JSON encoding.
+    """
+    from schemulator import minify_field_schema
+    from schemulator.spec import SLOTS
+    from schemulator.utils import encode_schema
+
+    return dict((keyword, encode_schema(value))
+                for (keyword, value) in minify_field_schema(prop).items()
+                if keyword in SLOTS)
+
+
+def migrate_schema(schema, names=None, form_type=None, validate=True):
+    """
+    Returns an upgraded copy of a schema. With validate, the upgraded schema
+    must convert to a form which converts back to a schema with the same
+    properties, each keeping the keywords schemulator reads from it, or
+    ValueError is raised.
+    """
+    from schemulator import form_to_schema, schema_to_form
+    from schemulator.upgrades import upgrade
+
+    schema = upgrade(schema, names)
+    if validate and schema.get('type') != 'array':
+        form = schema_to_form(schema, form_type)
+        converted = form_to_schema(form)['properties']
+        properties = schema.get('properties', {})
+        if sorted(converted) != sorted(properties):
+            raise ValueError("Properties do not survive a round trip through a form")
+
+        # Forms may add keywords, such as the titles WTForms infers from names
+        for (name, prop) in sorted(properties.items()):
+            kept = _read_keywords(converted[name])
+            changed = sorted(keyword for (keyword, value) in _read_keywords(prop).items()
+                             if kept.get(keyword) != value)
+            if changed:
+                raise ValueError("Property '%s' does not survive a round trip through a form: "
+                                 "%s changed" % (name, ', '.join(changed)))
+    return schema
+
+
+def migrate_chunk(chunk):
+    """
+    Migrates the (line number, line) pairs of a chunk of JSONL input, and
+    returns the output lines and the (line number, error) of the lines which
+    could not be migrated.
+    """
+    from schemulator.utils import encode_schema
+
+    (lines, names, form_type, validate) = chunk
+    output = []
+    errors = []
+    for (number, line) in lines:
+        if not line.strip():
+            continue
+        try:
+            schema = migrate_schema(json.loads(line), names, form_type, validate)
+            output.append(encode_schema(schema) + '\n')
+        except Exception as error:
+            errors.append((number, '%s: %s' % (error.__class__.__name__, error)))
+    return output, errors
+
+
+def _chunks(lines, size, names, form_type, validate):
+    numbered = enumerate(lines, 1)
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield (chunk, names, form_type, validate)
+
+
+def migrate(input_file, output_file, names=None, form_type=None, validate=True,
+            processes=None, chunk_size=DEFAULT_CHUNK_SIZE, window=None, errors_file=None):
+    """
+    Migrates every schema of a JSONL input file to a JSONL output file, in
+    order, and returns the number of (migrated, failed) schemas. Failures are
+    reported to errors_file and left out of the output.
+
+    Chunks of chunk_size lines are migrated by a pool of processes, with at
+    most window chunks in flight, so memory use does not depend on the size
+    of the input.
+    """
+
+    if errors_file is None:
+        errors_file = sys.stderr
+
+    chunks = _chunks(input_file, chunk_size, names, form_type, validate)
+    counts = [0, 0]
+
+    def write(result):
+        (output, errors) = result
+        output_file.writelines(output)
+        for (number, message) in errors:
+            errors_file.write('line %d: %s\n' % (number, message))
+        counts[0] += len(output)
+        counts[1] += len(errors)
+
+    if processes == 1:
+        for chunk in chunks:
+            write(migrate_chunk(chunk))
+        return tuple(counts)
+
+    pool = multiprocessing.Pool(processes, initializer=_configure)
+    if window is None:
+        window = 2 * (processes or multiprocessing.cpu_count())
+    try:
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.apply_async(migrate_chunk, (chunk,)))
+            if len(pending) >= window:
+                write(pending.pop(0).get())
+        for result in pending:
+            write(result.get())
+    finally:
+        pool.close()
+        pool.join()
+
+    return tuple(counts)
+
+
+def _open(path, mode):
+    if path == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+    return open(path, mode)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m schemulator')
+    commands = parser.add_subparsers(dest='command')
+
+    command = commands.add_parser('migrate', help="Upgrade the schemas of a JSONL file")
+    command.add_argument('input', nargs='?', default='-',
+                         help="JSONL file of schemas, one per line. Defaults to stdin")
+    command.add_argument('output', nargs='?', default='-',
+                         help="JSONL file to write the upgraded schemas to. Defaults to stdout")
+    command.add_argument('--transforms',
+                         help="Comma separated names of the transforms to apply. Defaults to all of them")
+    command.add_argument('--form-type', choices=('django', 'wtforms'), default='django',
+                         help="Forms the schemas are validated with")
+    command.add_argument('--no-validate', dest='validate', action='store_false',
+                         help="Do not check the schemas round-trip through a form")
+    command.add_argument('--processes', type=int,
+                         help="Number of worker processes. Defaults to the number of CPUs")
+    command.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                         help="Schemas migrated by a worker at a time")
+    command.add_argument('--list', action='store_true',
+                         help="List the available transforms and exit")
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    _configure()
+
+    from schemulator.upgrades import UPGRADES
+
+    if args.list:
+        for (name, transform) in UPGRADES.items():
+            sys.stdout.write('%s\t%s\n' % (name, (transform.__doc__ or '').strip().split('\n')[0]))
+        return 0
+
+    names = None
+    if args.transforms:
+        names = args.transforms.split(',')
+        unknown = [name for name in names if name not in UPGRADES]
+        if unknown:
+            parser.error("Unknown transforms: %s" % ', '.join(unknown))
+
+    form_type = 'wtforms' if args.form_type == 'wtforms' else None
+
+    input_file = _open(args.input, 'r')
+    output_file = _open(args.output, 'w')
+    try:
+        (migrated, failed) = migrate(input_file, output_file, names, form_type,
+                                     args.validate, args.processes, args.chunk_size)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    sys.stderr.write('%d schemas migrated, %d failed\n' % (migrated, failed))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+from collections import OrderedDict, namedtuple
+import json
+import time
+import zlib
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.utils.encoding import force_bytes
+from django.utils.text import compress_string
+
+from schemulator import _lru_get, _lru_set, form_to_schema
+from schemulator.frozen import freeze
+from schemulator.metrics import CACHE_REQUESTS
+from schemulator.utils import (SCHEMA_VERSION, encode_schema, form_fingerprint,
+                               schema_fingerprint)
+
+
+"""
+Storage of encoded form_to_schema output in the Django cache framework, so
+that every process sharing a cache backend converts each form only once.
+
+Relevant settings:
+
+    SCHEMULATOR_CACHE           Cache alias to use. Defaults to 'default'.
+    SCHEMULATOR_CACHE_PREFIX    Prefix of every key. Defaults to 'schemulator'.
+    SCHEMULATOR_CACHE_TIMEOUT   Expiry of stored schemas. Defaults to the
+                                timeout of the cache backend.
+"""
+
+# Seconds a recomputation lock is held at most, and seconds other processes
+# wait for the lock holder to store the schema before computing it themselves.
+LOCK_TIMEOUT = 10
+LOCK_WAIT = 5
+LOCK_POLL_INTERVAL = 0.05
+
+# The encoded schema of a form, as bytes, in each of the supported content
+# codings, along with its fingerprint
+SchemaVariants = namedtuple('SchemaVariants', 'fingerprint identity gzip deflate')
+
+# Frozen schemas decoded by this process, by cache key, so that cache hits are
+# not decoded again. The least recently used one goes first.
+_DECODED_SCHEMAS = OrderedDict()
+MAX_DECODED_SCHEMAS = 256
+
+
+def get_cache_backend(alias=None):
+    """
+    Returns the cache backend configured for schemulator.
+    """
+    if alias is None:
+        alias = getattr(settings, 'SCHEMULATOR_CACHE', 'default')
+
+    try:
+        from django.core.cache import caches
+    except ImportError:
+        # Django < 1.7
+        from django.core.cache import get_cache
+        return get_cache(alias)
+    return caches[alias]
+
+
+def _prefix():
+    return '%s:%s' % (getattr(settings, 'SCHEMULATOR_CACHE_PREFIX', 'schemulator'),
+                      SCHEMA_VERSION)
+
+
+def namespace_version(cache):
+    """
+    Returns the current version of the schemulator namespace in a cache.
+    """
+    key = _prefix() + ':namespace'
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, None)
+        version = cache.get(key, 1)
+    return version
+
+
+def invalidate(alias=None):
+    """
+    Moves the schemulator namespace of a cache to a new version, which
+    orphans every schema stored so far.
+    """
+    cache = get_cache_backend(alias)
+    key = _prefix() + ':namespace'
+    namespace_version(cache)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # The version key was evicted in between
+        cache.add(key, 1, None)
+        return cache.incr(key)
+
+
+def schema_key(cache, fingerprint):
+    """
+    Returns the key under which the schema with a given fingerprint is stored.
+    """
+    return '%s:v%s:%s' % (_prefix(), namespace_version(cache), fingerprint)
+
+
+def get_or_compute(cache, key, compute, timeout=DEFAULT_TIMEOUT):
+    """
+    Returns the value stored in cache under key, computing and storing it when
+    it is missing. Only the process holding the recomputation lock computes
+    the value; the others wait for it to be stored.
+    """
+
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = key + ':lock'
+    deadline = time.time() + LOCK_WAIT
+
+    while not cache.add(lock_key, 1, LOCK_TIMEOUT):
+        time.sleep(LOCK_POLL_INTERVAL)
+        value = cache.get(key)
+        if value is not None:
+            return value
+        if time.time() >= deadline:
+            # The lock holder is too slow or has died: compute the value
+            # without storing it, the lock holder will.
+            return compute()
+
+    try:
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.set(key, value, timeout)
+    finally:
+        cache.delete(lock_key)
+
+    return value
+
+
+def get_encoded_schema(form, alias=None):
+    """
+    Returns the canonical JSON encoding of form_to_schema(form), from the
+    cache whenever possible.
+    """
+    return _get_encoded_schema(form, alias)[1]
+
+
+def _get_encoded_schema(form, alias=None):
+    """
+    Returns the cache key of the encoded schema of a form, and the encoded
+    schema.
+    """
+
+    cache = get_cache_backend(alias)
+    timeout = getattr(settings, 'SCHEMULATOR_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+    key = schema_key(cache, form_fingerprint(form))
+
+    computed = []
+
+    def compute():
+        computed.append(True)
+        return encode_schema(form_to_schema(form))
+
+    encoded = get_or_compute(cache, key, compute, timeout)
+    CACHE_REQUESTS.inc(('django', 'miss' if computed else 'hit'))
+    return key, encoded
+
+
+def cached_form_to_schema(form, alias=None, frozen=False):
+    """
+    Same as form_to_schema(form, frozen=frozen), but the schema is taken from
+    the cache whenever possible. Frozen schemas are only decoded once per
+    process and cache key, and are then returned by reference.
+    """
+
+    (key, encoded) = _get_encoded_schema(form, alias)
+    if not frozen:
+        return json.loads(encoded)
+
+    try:
+        return _lru_get(_DECODED_SCHEMAS, key)
+    except KeyError:
+        schema = freeze(json.loads(encoded))
+        _lru_set(_DECODED_SCHEMAS, key, schema, MAX_DECODED_SCHEMAS)
+        return schema
+
+
+def compress_variants(encoded):
+    """
+    Returns the SchemaVariants of an encoded schema.
+    """
+    identity = force_bytes(encoded)
+    return SchemaVariants(fingerprint=schema_fingerprint(identity),
+                          identity=identity,
+                          gzip=compress_string(identity),
+                          deflate=zlib.compress(identity))
+
+
+def get_schema_variants(form, alias=None):
+    """
+    Returns the SchemaVariants of form_to_schema(form). They are compressed
+    once per form fingerprint, and stored together in the cache.
+    """
+
+    cache = get_cache_backend(alias)
+    timeout = getattr(settings, 'SCHEMULATOR_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+    key = schema_key(cache, form_fingerprint(form)) + ':variants'
+    computed = []
+
+    def compute():
+        computed.append(True)
+        return compress_variants(encode_schema(form_to_schema(form)))
+
+    variants = get_or_compute(cache, key, compute, timeout)
+    CACHE_REQUESTS.inc(('django', 'miss' if computed else 'hit'))
+    return variants
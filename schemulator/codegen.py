@@ -0,0 +1,157 @@
+from decimal import Decimal
+import keyword
+import py_compile
+import re
+
+from schemulator import field_arguments, wtfield_arguments
+from schemulator.spec import FieldSpec
+
+
+"""
+Generation of Python modules declaring the form classes described by schemas,
+as an alternative to building them with schema_to_form at run time.
+"""
+
+IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+HEADER = '''\
+# -*- coding: utf-8 -*-
+#
+# Generated by django-schemulator. Do not edit: regenerate it instead.
+'''
+
+
+def _check_identifier(name):
+    if not IDENTIFIER.match(name) or keyword.iskeyword(name):
+        raise ValueError("'%s' is not a valid Python identifier" % name)
+
+
+class _Source(str):
+    """
+    Python source which is written as it is instead of as a literal.
+    """
+
+
+class _ModuleWriter(object):
+    """
+    Keeps track of the imports needed by the generated code.
+    """
+
+    def __init__(self):
+        self.imports = set()
+
+    def literal(self, value):
+        """
+        Returns the Python source of a value found in a schema.
+        """
+        if isinstance(value, _Source):
+            return value
+        if isinstance(value, Decimal):
+            self.imports.add('import decimal')
+            return 'decimal.Decimal(%r)' % str(value)
+        if isinstance(value, (list, tuple)):
+            items = ', '.join(self.literal(v) for v in value)
+            if isinstance(value, tuple):
+                return '(%s,)' % items if len(value) == 1 else '(%s)' % items
+            return '[%s]' % items
+        if isinstance(value, dict):
+            return '{%s}' % ', '.join('%s: %s' % (self.literal(k), self.literal(v))
+                                      for (k, v) in sorted(value.items()))
+        if value is None or isinstance(value, (bool, int, float)) or \
+           isinstance(value, type(u'')) or isinstance(value, type('')):
+            return repr(value)
+        try:
+            # Python 2 long integers
+            if isinstance(value, long):
+                return repr(value)
+        except NameError:
+            pass
+        raise ValueError("%r can not be written as a Python literal" % (value,))
+
+    def reference(self, name, module):
+        """
+        Returns the Python source referring to the class called name in
+        module, or to the dotted path name.
+        """
+        if '.' in name:
+            (module, name) = name.rsplit('.', 1)
+        self.imports.add('import ' + module)
+        return module + '.' + name
+
+    def call(self, callable_src, kwargs):
+        args = ', '.join('%s=%s' % (kw, self.literal(value))
+                         for (kw, value) in sorted(kwargs.items()))
+        return '%s(%s)' % (callable_src, args)
+
+
+def _django_field_source(writer, spec):
+    field_type, kwargs = field_arguments(spec)
+    if '__widget' in spec:
+        kwargs['widget'] = _Source(writer.reference(spec['__widget'], 'django.forms.widgets'))
+    return writer.call(writer.reference(field_type, 'django.forms'), kwargs)
+
+
+def _wtforms_field_source(writer, spec):
+    field_type, kwargs, validators = wtfield_arguments(spec)
+    if field_type == 'FieldList':
+        raise ValueError("Field lists are not supported by code generation")
+    kwargs['validators'] = _Source('[%s]' % ', '.join(
+        writer.call(writer.reference(name, 'wtforms.validators'), validator_kwargs)
+        for (name, validator_kwargs) in validators))
+    if '__widget' in spec:
+        kwargs['widget'] = _Source(writer.call(writer.reference(spec['__widget'], 'wtforms.widgets'), {}))
+    return writer.call(writer.reference(field_type, 'wtforms'), kwargs)
+
+
+def schemas_to_source(schemas, form_type=None):
+    """
+    Returns the source of a Python module declaring a form class for each of
+    the schemas, which is a dictionary or a sequence of (class name, schema)
+    pairs. The classes are Django Forms, or WTForms when form_type is
+    'wtforms', with the same fields schema_to_form would give them.
+    """
+
+    if hasattr(schemas, 'items'):
+        schemas = sorted(schemas.items())
+    else:
+        schemas = list(schemas)
+
+    writer = _ModuleWriter()
+    if form_type == 'wtforms':
+        base = writer.reference('Form', 'wtforms')
+        field_source = _wtforms_field_source
+    else:
+        base = writer.reference('Form', 'django.forms')
+        field_source = _django_field_source
+
+    classes = []
+    for (cls_name, schema) in schemas:
+        _check_identifier(cls_name)
+        lines = ['class %s(%s):' % (cls_name, base)]
+        for (name, prop) in schema['properties'].items():
+            _check_identifier(name)
+            lines.append('    %s = %s' % (name, field_source(writer, FieldSpec.from_schema(prop))))
+        if len(lines) == 1:
+            lines.append('    pass')
+        classes.append('\n'.join(lines))
+
+    # Field names must not hide the modules the class bodies refer to
+    modules = set(imp.split()[1].split('.')[0] for imp in writer.imports)
+    for (cls_name, schema) in schemas:
+        clashes = modules.intersection(schema['properties'])
+        if clashes:
+            raise ValueError("Fields of %s hide the modules %s" % (cls_name, ', '.join(sorted(clashes))))
+
+    return '%s\n%s\n\n\n%s\n' % (HEADER, '\n'.join(sorted(writer.imports)),
+                                 '\n\n\n'.join(classes))
+
+
+def write_module(path, schemas, form_type=None):
+    """
+    Writes the module declaring the form classes described by the schemas to
+    path, and byte-compiles it.
+    """
+    source = schemas_to_source(schemas, form_type)
+    with open(path, 'wb') as module:
+        module.write(source.encode('utf-8'))
+    py_compile.compile(path, doraise=True)
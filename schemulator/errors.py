@@ -0,0 +1,210 @@
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.utils import six
+try:
+    from django.forms.utils import ErrorDict, ErrorList
+except ImportError:
+    # Django < 1.7
+    from django.forms.util import ErrorDict, ErrorList
+
+from jsonschema import Draft4Validator
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # Python 2
+    from collections import Mapping
+
+
+"""
+Translation of jsonschema validation errors into Django Forms or WTForms
+errors.
+"""
+
+# Names of the field holding the forms of array schemas: the default prefix
+# of Django formsets, and the FieldList of the WTForms built by
+# schema_to_formset
+# {FORM TYPE : NAME}
+ARRAY_FIELD_NAMES = {
+    None: 'form',
+    'wtforms': 'items',
+}
+
+
+def _required(prop):
+    # Draft 3 flags, as form_to_schema marks fields which are not required
+    if 'optional' in prop:
+        return not prop['optional']
+    return prop.get('required', True) is not False
+
+
+def _enum_values(choices):
+    """
+    Returns the values of the (value, label) choices of an enum, including
+    the ones of Django option groups.
+    """
+    values = []
+    for choice in choices:
+        if isinstance(choice, (list, tuple)) and len(choice) == 2:
+            (value, label) = choice
+            if isinstance(label, (list, tuple)):
+                values.extend(_enum_values(label))
+            else:
+                values.append(value)
+        else:
+            values.append(choice)
+    return values
+
+
+def validation_schema(schema):
+    """
+    Returns the draft 4 equivalent of a schema made by form_to_schema, which
+    data can be validated against: properties are listed as required unless
+    they are optional, enums hold the values of their choices, and fields
+    which accept null have it among their types. Objects which already list
+    their required properties keep their list.
+    """
+
+    schema = dict(schema)
+
+    properties = schema.get('properties')
+    if isinstance(properties, Mapping):
+        schema['properties'] = dict((name, validation_schema(prop))
+                                    for (name, prop) in properties.items())
+        if not isinstance(schema.get('required'), (list, tuple)):
+            required = sorted(name for (name, prop) in properties.items() if _required(prop))
+            if required:
+                schema['required'] = required
+
+    # Draft 3 flags are only read by the object holding the property
+    if isinstance(schema.get('required'), bool):
+        del schema['required']
+
+    if isinstance(schema.get('items'), Mapping):
+        schema['items'] = validation_schema(schema['items'])
+
+    if schema.get('enum') is not None:
+        schema['enum'] = _enum_values(schema['enum'])
+
+    json_type = schema.get('type')
+    if schema.get('null') and isinstance(json_type, six.string_types):
+        schema['type'] = [json_type, 'null']
+        if schema.get('enum') is not None:
+            schema['enum'] = schema['enum'] + [None]
+
+    return schema
+
+
+def _field_index(schema):
+    """
+    Returns the index of the fields of a schema: a dictionary of the property
+    names of objects, or of None for the items of arrays, to the index of the
+    fields they hold in turn.
+    """
+    index = {}
+    properties = schema.get('properties')
+    if isinstance(properties, Mapping):
+        for (name, prop) in properties.items():
+            index[name] = _field_index(prop)
+    if isinstance(schema.get('items'), Mapping):
+        index[None] = _field_index(schema['items'])
+    return index
+
+
+class ErrorMapper(object):
+    """
+    Translates the errors found by jsonschema when validating data against a
+    schema into the errors of the form described by that schema: a dictionary
+    of field names to lists of messages. Errors which do not concern a field
+    are listed under NON_FIELD_ERRORS.
+
+    Fields of the forms held by arrays are named as WTForms FieldLists and
+    Django formsets name them, such as 'items-0-name', and the forms of array
+    schemas are named after ARRAY_FIELD_NAMES.
+
+    By default, errors are given as a Django Forms ErrorDict, and as a plain
+    dictionary when form_type is 'wtforms'.
+    """
+
+    def __init__(self, schema, form_type=None):
+        self.schema = schema
+        self.form_type = form_type
+        self.index = _field_index(schema)
+        if schema.get('type') == 'array':
+            self.index = {ARRAY_FIELD_NAMES.get(form_type): self.index}
+            self._prefix = [ARRAY_FIELD_NAMES.get(form_type)]
+        else:
+            self._prefix = []
+        self._validator = None
+
+    def field_for(self, path):
+        """
+        Returns the name of the field at a path of the data, or
+        NON_FIELD_ERRORS when it is no field's.
+        """
+
+        index = self.index
+        parts = []
+        for part in self._prefix + list(path):
+            key = None if isinstance(part, six.integer_types) else part
+            if key not in index:
+                break
+            index = index[key]
+            parts.append(six.text_type(part))
+
+        if len(parts) <= len(self._prefix):
+            return NON_FIELD_ERRORS
+        return '-'.join(parts)
+
+    def map(self, errors):
+        """
+        Returns the form errors equivalent to an iterable of jsonschema errors.
+        """
+
+        form_errors = {}
+        # Properties still missing from the objects with required errors, by
+        # path. jsonschema reports them one by one, in the order of the list.
+        missing = {}
+
+        for error in errors:
+            path = list(error.path)
+            if error.validator == 'required' and isinstance(error.instance, Mapping):
+                key = tuple(path)
+                if key not in missing:
+                    missing[key] = [name for name in error.validator_value
+                                    if name not in error.instance]
+                if missing[key]:
+                    path.append(missing[key].pop(0))
+
+            name = self.field_for(path)
+            if name in form_errors:
+                form_errors[name].append(error.message)
+            else:
+                form_errors[name] = [error.message]
+
+        if self.form_type == 'wtforms':
+            return form_errors
+        return ErrorDict((name, ErrorList(messages))
+                         for (name, messages) in form_errors.items())
+
+    def map_many(self, batches):
+        """
+        Returns the form errors equivalent to each iterable of jsonschema
+        errors in batches.
+        """
+        return [self.map(errors) for errors in batches]
+
+    def validate(self, data):
+        """
+        Validates data against the validation_schema of the schema, and returns
+        the form errors found.
+        """
+        if self._validator is None:
+            self._validator = Draft4Validator(validation_schema(self.schema))
+        return self.map(self._validator.iter_errors(data))
+
+    def validate_many(self, payloads):
+        """
+        Yields the form errors of each of the payloads.
+        """
+        for data in payloads:
+            yield self.validate(data)
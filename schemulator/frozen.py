@@ -0,0 +1,89 @@
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # Python 2
+    from collections import Mapping
+
+
+"""
+Read-only schemas, which can be shared by any number of callers without being
+copied.
+"""
+
+
+class FrozenDict(dict):
+    """
+    A dictionary which can not be modified once built. It is hashable, and
+    copying it returns the dictionary itself. Being a dict, it is encoded to
+    JSON as any other dictionary.
+    """
+
+    __slots__ = ('_hash',)
+
+    def __new__(cls, *args, **kwargs):
+        # Items are set once and for all here, so calling __init__ again can
+        # not change them
+        self = dict.__new__(cls)
+        dict.__init__(self, *args, **kwargs)
+        return self
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("'%s' object does not support item assignment" % self.__class__.__name__)
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+    # Python 3.9 in-place union
+    __ior__ = _immutable
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, dict.__repr__(self))
+
+
+def freeze(value):
+    """
+    Returns a read-only version of a schema, or of any value found in one:
+    mappings become FrozenDicts and lists become tuples.
+    """
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenDict((k, freeze(v)) for (k, v) in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """
+    Returns a modifiable copy of a frozen schema: FrozenDicts become dicts and
+    tuples become lists.
+    """
+    if isinstance(value, Mapping):
+        return dict((k, thaw(v)) for (k, v) in value.items())
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    return value
@@ -0,0 +1,144 @@
+from collections import namedtuple
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from schemulator import schema_to_form_class
+
+
+"""
+Loading of form classes from a directory of JSON schema files.
+"""
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+_Entry = namedtuple('_Entry', 'mtime size digest form_cls')
+
+
+class SchemaDirectory(object):
+    """
+    The form classes described by the JSON schema files of a directory, by
+    file name without extension. Classes are Django Forms, or WTForms when
+    form_type is 'wtforms'.
+
+    reload() only rebuilds the classes of the files which changed. When
+    interval is given, reading a class reloads the directory first if the
+    last reload attempt is older than interval seconds. Such reloads do not
+    raise: when one fails, the previous classes are kept, the error is logged
+    and kept as last_error, and the next attempt waits for interval again.
+    """
+
+    def __init__(self, path, form_type=None, pattern='*.json', interval=None):
+        self.path = path
+        self.form_type = form_type
+        self.pattern = pattern
+        self.interval = interval
+        self.forms = {}
+        self.last_error = None
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._last_reload = 0
+        self.reload()
+
+    def reload(self):
+        """
+        Rebuilds the form classes of the files whose modification time or size
+        changed and whose content did too, and forgets the classes of removed
+        files. The new set of classes replaces the previous one at once, and
+        only if every file could be loaded.
+
+        Returns the names of the (changed, removed) form classes.
+        """
+        with self._lock:
+            return self._locked_reload()
+
+    def _reload_if_due(self):
+        """
+        Reloads the directory unless the last reload attempt is more recent
+        than interval seconds, such as one made by another thread while this
+        one waited for the lock.
+        """
+        with self._lock:
+            if time.time() - self._last_reload > self.interval:
+                self._locked_reload()
+
+    def _locked_reload(self):
+        # Failed attempts count too, so that a broken file is not read again
+        # by every lookup
+        self._last_reload = time.time()
+        try:
+            (changed, removed) = self._reload()
+        except Exception as error:
+            self.last_error = error
+            raise
+        self.last_error = None
+        return changed, removed
+
+    def _reload(self):
+        entries = {}
+        changed = []
+
+        for filename in sorted(os.listdir(self.path)):
+            if not fnmatch.fnmatch(filename, self.pattern):
+                continue
+
+            name = os.path.splitext(filename)[0]
+            path = os.path.join(self.path, filename)
+            stat = os.stat(path)
+            entry = self._entries.get(name)
+
+            if entry and (entry.mtime, entry.size) == (stat.st_mtime, stat.st_size):
+                entries[name] = entry
+                continue
+
+            with open(path, 'rb') as schema_file:
+                content = schema_file.read()
+            digest = hashlib.sha1(content).hexdigest()
+
+            if entry and entry.digest == digest:
+                # Touched, but not modified
+                entries[name] = entry._replace(mtime=stat.st_mtime, size=stat.st_size)
+                continue
+
+            schema = json.loads(content.decode('utf-8'))
+            form_cls = schema_to_form_class(schema, self.form_type)
+            entries[name] = _Entry(stat.st_mtime, stat.st_size, digest, form_cls)
+            changed.append(name)
+
+        removed = sorted(set(self._entries) - set(entries))
+
+        self._entries = entries
+        self.forms = dict((name, entry.form_cls) for (name, entry) in entries.items())
+
+        return changed, removed
+
+    def get(self, name, default=None):
+        """
+        Returns the form class loaded from the file called name.
+        """
+        if self.interval is not None and time.time() - self._last_reload > self.interval:
+            try:
+                self._reload_if_due()
+            except Exception:
+                logger.exception("Reloading the schemas of %s failed", self.path)
+        return self.forms.get(name, default)
+
+    def __getitem__(self, name):
+        form_cls = self.get(name)
+        if form_cls is None:
+            raise KeyError(name)
+        return form_cls
+
+    def __contains__(self, name):
+        return name in self.forms
+
+    def __iter__(self):
+        return iter(self.forms)
+
+    def __len__(self):
+        return len(self.forms)
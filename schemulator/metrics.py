@@ -0,0 +1,226 @@
+from collections import OrderedDict
+from functools import wraps
+import threading
+from timeit import default_timer
+
+
+"""
+Counters and histograms of the conversions made by schemulator, exported in
+the Prometheus text exposition format. Values are kept by each process.
+
+Relevant settings:
+
+    SCHEMULATOR_METRICS     Conversions which are counted and timed: False
+                            for none, 'forms' (or True) for the conversions
+                            of forms, and 'fields' for those of their fields
+                            too. Defaults to False. Cache requests are always
+                            counted.
+"""
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Upper bounds of the duration histogram buckets, in seconds
+DURATION_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Metrics by name, in order of declaration
+REGISTRY = OrderedDict()
+
+# Instrumentation levels of the SCHEMULATOR_METRICS values
+# {SETTING : LEVEL}
+LEVELS = {None: 0, False: 0, True: 1, 'forms': 1, 'fields': 2}
+
+# Current instrumentation level, None until the setting is read
+_level = None
+
+
+def configure(level=None):
+    """
+    Sets what is instrumented, given as a SCHEMULATOR_METRICS value, or reads
+    the setting again when level is None. Returns the new level.
+    """
+    global _level
+    if level is None:
+        from django.conf import settings
+        level = getattr(settings, 'SCHEMULATOR_METRICS', False)
+    if level not in LEVELS:
+        raise ValueError("Unknown metrics level %r" % (level,))
+    _level = LEVELS[level]
+    return _level
+
+
+def _escape(value):
+    return (u'%s' % value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    return '{%s}' % ','.join('%s="%s"' % (name, _escape(value))
+                             for (name, value) in zip(names, values))
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value)
+
+
+class Metric(object):
+    """
+    Values of a metric by label values, which are given as a tuple in the
+    order of labelnames.
+    """
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY[name] = self
+
+    def reset(self):
+        with self._lock:
+            self._values = {}
+
+    def samples(self):
+        """
+        Yields the (name, labels, value) samples of the metric.
+        """
+        raise NotImplementedError
+
+    def render(self):
+        lines = ['# HELP %s %s' % (self.name, self.documentation),
+                 '# TYPE %s %s' % (self.name, self.kind)]
+        for (name, labels, value) in self.samples():
+            lines.append('%s%s %s' % (name, labels, _format_value(value)))
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+
+    kind = 'counter'
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels=()):
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        for (labels, value) in values:
+            yield (self.name, _format_labels(self.labelnames, labels), value)
+
+
+class Histogram(Metric):
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DURATION_BUCKETS):
+        super(Histogram, self).__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets) + (float('inf'),)
+
+    def observe(self, value, labels=()):
+        with self._lock:
+            # [bucket counts, sum]
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * len(self.buckets), 0.0]
+            for (i, bound) in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+
+    def count(self, labels=()):
+        state = self._values.get(labels)
+        return sum(state[0]) if state else 0
+
+    def samples(self):
+        bucket_labelnames = self.labelnames + ('le',)
+        with self._lock:
+            values = sorted((labels, (list(counts), total))
+                            for (labels, (counts, total)) in self._values.items())
+        for (labels, (counts, total)) in values:
+            cumulative = 0
+            for (bound, count) in zip(self.buckets, counts):
+                cumulative += count
+                yield (self.name + '_bucket',
+                       _format_labels(bucket_labelnames, labels + (_format_value(bound),)),
+                       cumulative)
+            formatted = _format_labels(self.labelnames, labels)
+            yield (self.name + '_sum', formatted, total)
+            yield (self.name + '_count', formatted, cumulative)
+
+
+CONVERSIONS = Counter('schemulator_conversions_total',
+                      'Conversions made, by operation, framework and field type.',
+                      ('operation', 'framework', 'field_type'))
+
+CONVERSION_ERRORS = Counter('schemulator_conversion_errors_total',
+                            'Conversions which raised an exception, by operation.',
+                            ('operation',))
+
+CONVERSION_DURATION = Histogram('schemulator_conversion_duration_seconds',
+                                'Duration of the conversions, by operation, framework and field type.',
+                                ('operation', 'framework', 'field_type'))
+
+CACHE_REQUESTS = Counter('schemulator_cache_requests_total',
+                         'Encoded schemas and rendered forms requested from a cache, by cache and result.',
+                         ('cache', 'result'))
+
+
+def instrument(operation, labels, level='forms'):
+    """
+    Decorates a conversion function so that its calls are counted and timed
+    under operation, when SCHEMULATOR_METRICS is level or above. labels is
+    called with the result and the arguments of each call, and returns its
+    (framework, field type) labels.
+    """
+
+    level = LEVELS[level]
+
+    def decorator(func):
+
+        @wraps(func)
+        def instrumented(*args, **kwargs):
+            if (_level if _level is not None else configure()) < level:
+                return func(*args, **kwargs)
+
+            start = default_timer()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                CONVERSION_ERRORS.inc((operation,))
+                raise
+            duration = default_timer() - start
+
+            label_values = (operation,) + tuple(labels(result, *args, **kwargs))
+            CONVERSIONS.inc(label_values)
+            CONVERSION_DURATION.observe(duration, label_values)
+            return result
+
+        return instrumented
+
+    return decorator
+
+
+def render():
+    """
+    Returns all the metrics in the Prometheus text exposition format.
+    """
+    return '\n'.join(metric.render() for metric in REGISTRY.values()) + '\n'
+
+
+def reset():
+    """
+    Resets all the metrics.
+    """
+    for metric in REGISTRY.values():
+        metric.reset()
@@ -0,0 +1,163 @@
+from schemulator import form_to_schema
+from schemulator.utils import encode_schema, schema_fingerprint
+
+
+"""
+Export of many forms at once as the 'components' section of an OpenAPI 3
+document.
+"""
+
+# Keywords of field schemas which are kept as they are in OpenAPI schemas
+OPENAPI_KEYWORDS = (
+    'type',
+    'format',
+    'pattern',
+    'title',
+    'description',
+    'default',
+    'minLength',
+    'maxLength',
+    'minimum',
+    'maximum',
+    'enum',
+    'minItems',
+    'maxItems',
+)
+
+REF_PREFIX = '#/components/schemas/'
+
+
+def field_schema_to_openapi(schema, hints=False):
+    """
+    Returns the OpenAPI schema object equivalent to the schema fragment of a
+    field. The schemulator specific keywords are kept as 'x-' extensions when
+    hints is set, and left out otherwise.
+    """
+
+    openapi = {}
+    for keyword in OPENAPI_KEYWORDS:
+        value = schema.get(keyword)
+        if value is not None:
+            openapi[keyword] = value
+
+    # Nullable fields carry a list of types in JSON schema
+    json_type = openapi.get('type')
+    if isinstance(json_type, (list, tuple)):
+        openapi['type'] = [t for t in json_type if t != 'null'][0]
+        openapi['nullable'] = True
+    elif schema.get('null'):
+        openapi['nullable'] = True
+
+    # OpenAPI enums only list values, not (value, label) choices
+    if 'enum' in openapi:
+        openapi['enum'] = [c[0] if isinstance(c, (list, tuple)) else c
+                           for c in openapi['enum']]
+
+    # Arrays of field lists hold the schema of a form or of a field
+    if 'items' in schema:
+        items = schema['items']
+        if 'properties' in items:
+            openapi['items'] = _object_to_openapi(items, hints)
+        else:
+            openapi['items'] = field_schema_to_openapi(items, hints)
+
+    if hints:
+        for (keyword, value) in schema.items():
+            if keyword.startswith('__'):
+                openapi['x-' + keyword[2:].replace('_', '-')] = value
+
+    return openapi
+
+
+def form_to_openapi(form, hints=False):
+    """
+    Returns the OpenAPI schema object describing a Django Form, formset or
+    WTForm, or their class. Formsets are arrays of the object of their form.
+    """
+
+    schema = form_to_schema(form)
+    if 'properties' in schema:
+        return _object_to_openapi(schema, hints)
+
+    # The title and description of formset schemas are generic ones
+    openapi = field_schema_to_openapi(schema, hints)
+    openapi.pop('title', None)
+    openapi.pop('description', None)
+    return openapi
+
+
+def _object_to_openapi(schema, hints=False):
+    properties = {}
+    required = []
+    for (name, prop) in schema['properties'].items():
+        properties[name] = field_schema_to_openapi(prop, hints)
+        if not prop.get('optional'):
+            required.append(name)
+
+    openapi = {'type': 'object', 'properties': properties}
+    if required:
+        openapi['required'] = sorted(required)
+    return openapi
+
+
+def _properties(openapi):
+    # Formsets are described by the properties of their items
+    if openapi.get('type') == 'array':
+        openapi = openapi['items']
+    return openapi['properties']
+
+
+def _form_name(form):
+    if isinstance(form, type):
+        return form.__name__
+    return form.__class__.__name__
+
+
+def forms_to_components(forms, hints=False):
+    """
+    Returns the 'components' section of an OpenAPI document describing many
+    forms. forms is either a dictionary of component names to forms, or a
+    sequence of forms which are then named after their class.
+
+    Field schemas used by more than one form are only described once, as a
+    component of their own which the forms refer to.
+    """
+
+    if not hasattr(forms, 'items'):
+        forms = dict((_form_name(form), form) for form in forms)
+
+    schemas = {}
+    for (name, form) in sorted(forms.items()):
+        schemas[name] = form_to_openapi(form, hints)
+
+    # Count the occurrences of every field schema by its canonical encoding
+    encoded_props = []
+    occurrences = {}
+    for (name, schema) in sorted(schemas.items()):
+        properties = _properties(schema)
+        for (prop_name, prop) in sorted(properties.items()):
+            encoded = encode_schema(prop)
+            encoded_props.append((properties, prop_name, encoded))
+            if encoded in occurrences:
+                occurrences[encoded][1] += 1
+            else:
+                occurrences[encoded] = [prop_name, 1]
+
+    # Hoist the shared ones into components of their own, named after the
+    # first property they describe
+    for (properties, prop_name, encoded) in encoded_props:
+        (first_name, count) = occurrences[encoded]
+        if count > 1:
+            shared_name = '%s_%s' % (first_name, schema_fingerprint(encoded)[:8])
+            schemas.setdefault(shared_name, properties[prop_name])
+            properties[prop_name] = {'$ref': REF_PREFIX + shared_name}
+
+    return {'components': {'schemas': schemas}}
+
+
+def forms_to_components_json(forms, hints=False):
+    """
+    Same as forms_to_components, but returns the canonical JSON encoding of
+    the document, ready to be stored and served as it is.
+    """
+    return encode_schema(forms_to_components(forms, hints))
@@ -0,0 +1,154 @@
+from collections import OrderedDict
+import json
+import zlib
+
+import wtforms
+
+from schemulator import form_to_schema, unbound_field_views
+from schemulator.utils import encode_schema, schema_fingerprint
+
+
+"""
+Splitting of the properties of large schemas into pages, which clients fetch
+and cache independently of each other.
+
+Page boundaries depend on the property names and their order only, so
+adding, changing or removing a property changes the page holding it and
+leaves the others, and their fingerprints, as they were. Properties are
+taken in an explicit order: the one given, the one of an OrderedDict of
+properties, or the sorted names, as the order of plain dictionaries may
+change whenever they grow.
+"""
+
+# Properties per page on average, at least and at most
+AVERAGE_PAGE_SIZE = 64
+MIN_PAGE_SIZE = 16
+MAX_PAGE_SIZE = 256
+
+
+def _split(names, average_size, min_size, max_size):
+    """
+    Yields the lists of property names of each page.
+    """
+    page = []
+    for name in names:
+        page.append(name)
+        checksum = zlib.crc32(name.encode('utf-8')) & 0xffffffff
+        if (len(page) >= min_size and checksum % average_size == 0) or len(page) >= max_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def _property_order(properties, order=None):
+    """
+    Returns the names of properties in order: the given one, the one of an
+    OrderedDict, or sorted.
+    """
+
+    if order is not None:
+        order = list(order)
+        if sorted(order) != sorted(properties):
+            raise ValueError("The order must name each property once")
+        return order
+    if isinstance(properties, OrderedDict):
+        return list(properties)
+    return sorted(properties)
+
+
+def _field_order(form):
+    """
+    Returns the names of the fields of a Django Form or a WTForm, or of their
+    class, in order.
+    """
+    if isinstance(form, type):
+        if issubclass(form, wtforms.form.BaseForm):
+            return [name for (name, field) in unbound_field_views(form)]
+        return list(form.base_fields)
+    if isinstance(form, wtforms.form.BaseForm):
+        return list(form._fields)
+    return list(form.fields)
+
+
+class SchemaPages(object):
+    """
+    The pages of a schema. The header is the schema itself, with the ordered
+    fingerprints of its pages as 'pages' instead of its properties. Each page
+    holds some of the properties, and their order as 'order'. Properties are
+    taken in the given order, which names each of them once, or else in the
+    order of an OrderedDict of properties, or sorted.
+
+    Page fingerprints are the fingerprints of their encoding, and the header
+    fingerprint changes whenever any page does. Array schemas, such as the
+    ones of formsets, have no properties and raise ValueError.
+    """
+
+    def __init__(self, schema, average_size=AVERAGE_PAGE_SIZE,
+                 min_size=MIN_PAGE_SIZE, max_size=MAX_PAGE_SIZE, order=None):
+        if 'properties' not in schema:
+            raise ValueError("Only schemas with properties can be paginated, "
+                             "not '%s' ones" % schema.get('type', 'untyped'))
+        properties = schema['properties']
+        names = _property_order(properties, order)
+
+        # {FINGERPRINT : ENCODED PAGE}
+        self.pages = OrderedDict()
+        for names in _split(names, average_size, min_size, max_size):
+            encoded = encode_schema({
+                'order': names,
+                'properties': dict((name, properties[name]) for name in names),
+            })
+            self.pages[schema_fingerprint(encoded)] = encoded
+
+        self.header = dict((k, v) for (k, v) in schema.items() if k != 'properties')
+        self.header['pages'] = list(self.pages)
+        self.encoded_header = encode_schema(self.header)
+        self.fingerprint = schema_fingerprint(self.encoded_header)
+
+    def page(self, fingerprint):
+        """
+        Returns the encoding of the page with the given fingerprint.
+        """
+        return self.pages[fingerprint]
+
+    def __len__(self):
+        return len(self.pages)
+
+
+def paginate_schema(schema, average_size=AVERAGE_PAGE_SIZE,
+                    min_size=MIN_PAGE_SIZE, max_size=MAX_PAGE_SIZE, order=None):
+    """
+    Returns the SchemaPages of a schema, whose properties are taken in order
+    when it is given.
+    """
+    return SchemaPages(schema, average_size, min_size, max_size, order)
+
+
+def paginate_form(form, average_size=AVERAGE_PAGE_SIZE,
+                  min_size=MIN_PAGE_SIZE, max_size=MAX_PAGE_SIZE):
+    """
+    Returns the SchemaPages of the schema of a Django Form or a WTForm, or of
+    their class, whose properties are in the order of the form fields.
+    """
+    schema = form_to_schema(form)
+    if 'properties' not in schema:
+        return SchemaPages(schema)
+    return SchemaPages(schema, average_size, min_size, max_size, _field_order(form))
+
+
+def join_pages(header, pages):
+    """
+    Returns the schema split into a header and its pages, which are decoded
+    documents or their encoding, given in the order of the header.
+    """
+
+    schema = dict((k, v) for (k, v) in header.items() if k != 'pages')
+    properties = OrderedDict()
+    for page in pages:
+        if not isinstance(page, dict):
+            page = json.loads(page)
+        for name in page['order']:
+            properties[name] = page['properties'][name]
+    schema['properties'] = properties
+    return schema
@@ -0,0 +1,218 @@
+from collections import OrderedDict
+import datetime
+import decimal
+import pickle
+import weakref
+
+from django.utils import six
+
+from schemulator import _lru_get, _lru_set, _schema_type, bind_many, resolve_class
+from schemulator.codegen import _check_identifier
+from schemulator.utils import encode_schema, schema_fingerprint
+
+
+"""
+Record classes described by schemas, to hold the cleaned data of their forms
+in less memory than dictionaries.
+
+Records have a slot per property and nothing else. Their constructor and
+_make() are generated for each class, so that filling a record does not
+loop over its fields. Records pickle the fingerprint of their schema rather
+than the schema itself, so they can only be unpickled once their class was
+built with schema_to_record.
+"""
+
+# Python types of the values of JSON types, and of formats which forms clean
+# to something else than their JSON type
+# {JSON TYPE : PYTHON TYPE}
+PYTHON_TYPES = {
+    'boolean': bool,
+    'integer': int,
+    'number': float,
+    'string': six.text_type,
+    'array': list,
+    'object': dict,
+}
+
+# {FORMAT : PYTHON TYPE}
+PYTHON_FORMATS = {
+    'date': datetime.date,
+    'date-time': datetime.datetime,
+    'time': datetime.time,
+    'decimal': decimal.Decimal,
+}
+
+# Python types of the values of field classes whose schema does not tell them
+# apart from text or numbers, by name of the class or of one of its bases
+# {FIELD CLASS NAME : PYTHON TYPE}
+PYTHON_FIELD_TYPES = {
+    'DecimalField': decimal.Decimal,
+    'DateField': datetime.date,
+    'DateTimeField': datetime.datetime,
+    'SplitDateTimeField': datetime.datetime,
+    'TimeField': datetime.time,
+}
+
+# Keywords naming the field class of a property, and the module its name is
+# relative to
+# {KEYWORD : MODULE}
+FIELD_CLASS_KEYWORDS = OrderedDict([
+    ('__django_form_field_cls', 'django.forms'),
+    ('__wtforms_field_cls', 'wtforms'),
+])
+
+MAX_RECORD_CLASSES = 256
+
+TEMPLATE = '''\
+def __init__(self{arguments}):
+    {init}
+
+@classmethod
+def _make(cls, data):
+    get = data.get
+    self = new(cls)
+    {make}
+    return self
+'''
+
+# Record classes, by fingerprint of their schema and name: the most recently
+# used ones, and any other which is still alive, to unpickle records with
+_RECORD_CLASSES = OrderedDict()
+_LIVE_RECORD_CLASSES = weakref.WeakValueDictionary()
+
+
+def _field_class_names(name, module):
+    """
+    Returns the names of a field class and of its bases, or only its own when
+    it can not be imported.
+    """
+    try:
+        cls = resolve_class(name, module)
+    except (ImportError, AttributeError, ValueError):
+        return [name.rsplit('.', 1)[-1]]
+    return [base.__name__ for base in cls.__mro__]
+
+
+def python_type(schema):
+    """
+    Returns the Python type of the values of a property, once cleaned: the
+    one of its field class when it is given, of its format, or of its type.
+    """
+    for (keyword, module) in FIELD_CLASS_KEYWORDS.items():
+        if keyword in schema:
+            for name in _field_class_names(schema[keyword], module):
+                if name in PYTHON_FIELD_TYPES:
+                    return PYTHON_FIELD_TYPES[name]
+    if schema.get('format') in PYTHON_FORMATS:
+        return PYTHON_FORMATS[schema['format']]
+    return PYTHON_TYPES.get(_schema_type(schema), object)
+
+
+class Record(object):
+    """
+    Base class of the record classes of schemas.
+    """
+
+    __slots__ = ()
+
+    # Names of the fields, in order, and their Python types
+    _fields = ()
+    _types = {}
+
+    # Schema the class is built from, and its key among record classes
+    _schema = None
+    _key = None
+
+    def _asdict(self):
+        """
+        Returns an OrderedDict of the field values.
+        """
+        return OrderedDict((name, getattr(self, name)) for name in self._fields)
+
+    def __iter__(self):
+        return (getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other):
+        return self.__class__ is other.__class__ and tuple(self) == tuple(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (_unpickle_record, self._key + (tuple(self),))
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__,
+                           ', '.join('%s=%r' % (name, getattr(self, name)) for name in self._fields))
+
+
+def _record_class(schema, name, key):
+    _check_identifier(name)
+    fields = tuple(str(field) for field in schema['properties'])
+    for field in fields:
+        _check_identifier(field)
+        if field.startswith('_'):
+            raise ValueError("Field names can not start with an underscore: '%s'" % field)
+
+    source = TEMPLATE.format(
+        arguments=''.join(', %s=None' % field for field in fields),
+        init='\n    '.join('self.%s = %s' % (field, field) for field in fields) or 'pass',
+        make='\n    '.join('self.%s = get(%r)' % (field, field) for field in fields),
+    )
+    namespace = {'new': object.__new__}
+    exec(source, namespace)
+
+    return type(str(name), (Record,), {
+        '__slots__': fields,
+        '__init__': namespace['__init__'],
+        '_make': namespace['_make'],
+        '_fields': fields,
+        '_schema': schema,
+        '_key': key,
+        '_types': OrderedDict((field, python_type(schema['properties'][field]))
+                              for field in fields),
+    })
+
+
+def schema_to_record(schema, name='Record'):
+    """
+    Returns a record class with a field for each property of a schema. Its
+    _make() classmethod builds a record from the cleaned data of a form, or
+    any other dictionary of field values. Classes are only built once for
+    equal schemas, as long as they are among the MAX_RECORD_CLASSES most
+    recently used or still alive.
+    """
+
+    key = (schema_fingerprint(encode_schema(schema)), name)
+    try:
+        return _lru_get(_RECORD_CLASSES, key)
+    except KeyError:
+        pass
+
+    record_cls = _LIVE_RECORD_CLASSES.get(key)
+    if record_cls is None:
+        record_cls = _LIVE_RECORD_CLASSES[key] = _record_class(schema, name, key)
+    _lru_set(_RECORD_CLASSES, key, record_cls, MAX_RECORD_CLASSES)
+    return record_cls
+
+
+def _unpickle_record(fingerprint, name, values):
+    record_cls = _LIVE_RECORD_CLASSES.get((fingerprint, name))
+    if record_cls is None:
+        raise pickle.UnpicklingError("No record class '%s' was built for the schema %s"
+                                     % (name, fingerprint))
+    return record_cls(*values)
+
+
+def bind_records(schema, payloads, form_type=None, name='Record'):
+    """
+    Same as bind_many(schema, payloads, form_type, cleaned=True), but yields
+    (record, errors) pairs, where the record holds the cleaned data of valid
+    payloads, and is None for the others.
+    """
+
+    make = schema_to_record(schema, name)._make
+    for (data, errors) in bind_many(schema, payloads, form_type, cleaned=True):
+        yield (None if errors else make(data)), errors
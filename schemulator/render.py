@@ -0,0 +1,93 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.utils import translation
+from django.utils.encoding import force_text
+from django.utils.safestring import mark_safe
+
+from schemulator.cache import get_cache_backend, get_or_compute, schema_key
+from schemulator.metrics import CACHE_REQUESTS
+from schemulator.utils import form_fingerprint
+
+
+"""
+Storage of the HTML of rendered Django Forms in the Django cache framework.
+
+The HTML of unbound forms is rendered once per form fingerprint, rendering
+method, locale and widget attributes. Bound forms, and forms given initial
+values when instantiated, are rendered as they are: their HTML holds the data
+of a single user, which the shared cache must not, and rendering their rows
+apart is slower than rendering them whole.
+"""
+
+# Rendering methods of Django Forms
+RENDER_METHODS = ('as_p', 'as_table', 'as_ul')
+
+
+def render_key(form, method):
+    """
+    Returns the part of the cache key of a rendered form which does not
+    depend on its fields: the rendering method, the locale, and the
+    attributes of the form and of its widgets.
+    """
+
+    parts = [form.prefix, form.auto_id, form.label_suffix,
+             getattr(form, 'required_css_class', None),
+             getattr(form, 'error_css_class', None)]
+    for (name, field) in form.fields.items():
+        parts.append((name, sorted(field.widget.attrs.items()), field.localize,
+                      field.show_hidden_initial))
+
+    digest = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+    return '%s:%s:%s' % (method, translation.get_language(), digest)
+
+
+def is_cacheable(form):
+    """
+    Returns whether the HTML of a form may be shared: it is unbound, and was
+    not given initial values when instantiated.
+    """
+    return not form.is_bound and not form.initial
+
+
+def _compute(form, method):
+    return force_text(getattr(form, method)())
+
+
+def get_rendered_form(form, method='as_p', alias=None):
+    """
+    Returns the HTML of an unbound Django Form, from the cache whenever
+    possible. Raises ValueError for forms which are not is_cacheable.
+    """
+
+    if method not in RENDER_METHODS:
+        raise ValueError("Unknown rendering method '%s'" % method)
+    if not is_cacheable(form):
+        raise ValueError("Only the HTML of unbound forms without initial values is cached")
+
+    cache = get_cache_backend(alias)
+    timeout = getattr(settings, 'SCHEMULATOR_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+    key = '%s:html:%s' % (schema_key(cache, form_fingerprint(form)), render_key(form, method))
+    computed = []
+
+    def compute():
+        computed.append(True)
+        return _compute(form, method)
+
+    html = get_or_compute(cache, key, compute, timeout)
+    CACHE_REQUESTS.inc(('html', 'miss' if computed else 'hit'))
+    return html
+
+
+def render_form(form, method='as_p', alias=None):
+    """
+    Same as getattr(form, method)() for a Django Form, but the HTML of forms
+    which are is_cacheable is taken from the cache whenever possible.
+    """
+
+    if method not in RENDER_METHODS:
+        raise ValueError("Unknown rendering method '%s'" % method)
+    if not is_cacheable(form):
+        return getattr(form, method)()
+    return mark_safe(get_rendered_form(form, method, alias))
@@ -0,0 +1,196 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+
+from schemulator import form_to_schema
+from schemulator.metrics import CACHE_REQUESTS
+from schemulator.utils import SCHEMA_VERSION, encode_schema, form_fingerprint
+
+
+"""
+Store of encoded schemas in a memory mapped file, shared by all the processes
+which map it, such as the workers of a preforking server.
+
+The file holds a header, a fixed size open addressing table of slots, and a
+data region schemas are appended to:
+
+    header  magic, slot count, data region size, data region bytes used,
+            generation
+    slot    SHA1 digest of the key, offset and length of the encoded schema
+
+Writers hold an exclusive lock on the file, and fill a slot's digest last, so
+readers never need to lock anything. When the table or the data region is
+full, the writer empties the store, and bumps the generation before and after
+doing so. Readers copy schemas out, and only keep copies made while the
+generation was even and unchanged.
+"""
+
+MAGIC = b'SCHEMSH2'
+HEADER = struct.Struct('<8sIQQQ')
+SLOT = struct.Struct('<20sQQ')
+EMPTY_DIGEST = b'\0' * 20
+
+# Default capacity of a store
+DEFAULT_SLOTS = 4096
+DEFAULT_DATA_SIZE = 64 * 1024 * 1024
+
+
+class SharedSchemaStore(object):
+    """
+    Encoded schemas stored in the memory mapped file at path, by fingerprint.
+    The file is created, with room for the given number of schemas and bytes,
+    by the first process opening it. Reads return copies of the encodings, so
+    that they remain valid once the store is emptied or closed.
+
+    Storing a schema into a full store empties it first, so that the schemas
+    in use are stored again as they are next requested. Schemas larger than
+    the data region are never stored: put() then returns False and
+    get_encoded_schema() falls back to converting the form.
+    """
+
+    def __init__(self, path, slots=DEFAULT_SLOTS, data_size=DEFAULT_DATA_SIZE):
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                size = HEADER.size + slots * SLOT.size + data_size
+                os.ftruncate(self._fd, size)
+                os.write(self._fd, HEADER.pack(MAGIC, slots, data_size, 0, 0))
+            self._map = mmap.mmap(self._fd, os.fstat(self._fd).st_size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+        (magic, self.slots, self.data_size) = HEADER.unpack_from(self._map, 0)[:3]
+        if magic != MAGIC:
+            raise ValueError("%s is not a schemulator shared schema store" % path)
+        self._data_start = HEADER.size + self.slots * SLOT.size
+
+    def _digest(self, fingerprint):
+        # Schemas of other schemulator versions are left out of reach
+        return hashlib.sha1(('%s:%s' % (SCHEMA_VERSION, fingerprint)).encode('utf-8')).digest()
+
+    def _probe(self, digest):
+        """
+        Yields the slot offsets to look at for a digest, in order.
+        """
+        start = struct.unpack_from('<Q', digest)[0] % self.slots
+        for i in range(self.slots):
+            yield HEADER.size + ((start + i) % self.slots) * SLOT.size
+
+    def _generation(self):
+        return HEADER.unpack_from(self._map, 0)[4]
+
+    def _lookup(self, digest):
+        for slot in self._probe(digest):
+            (slot_digest, offset, length) = SLOT.unpack_from(self._map, slot)
+            if slot_digest == digest:
+                start = self._data_start + offset
+                return self._map[start:start + length]
+            if slot_digest == EMPTY_DIGEST:
+                return None
+        return None
+
+    def get(self, fingerprint):
+        """
+        Returns the encoded schema stored under a fingerprint, as bytes, or
+        None.
+        """
+        digest = self._digest(fingerprint)
+        generation = self._generation()
+        if generation % 2:
+            # Being emptied
+            return None
+        encoded = self._lookup(digest)
+        if self._generation() != generation:
+            # Emptied while copying
+            return None
+        return encoded
+
+    def _reset(self):
+        """
+        Empties the store. Only called with the file locked.
+        """
+        generation = self._generation()
+        HEADER.pack_into(self._map, 0, MAGIC, self.slots, self.data_size, 0, generation + 1)
+        self._map[HEADER.size:self._data_start] = b'\0' * (self._data_start - HEADER.size)
+        HEADER.pack_into(self._map, 0, MAGIC, self.slots, self.data_size, 0, generation + 2)
+
+    def put(self, fingerprint, encoded):
+        """
+        Stores an encoded schema under a fingerprint, emptying the store first
+        when it is full. Returns False when the schema is larger than the data
+        region.
+        """
+        if not isinstance(encoded, bytes):
+            encoded = encoded.encode('utf-8')
+        if len(encoded) > self.data_size:
+            return False
+        digest = self._digest(fingerprint)
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            slot = self._free_slot(digest)
+            if slot is True:
+                # Stored by another process in the meantime
+                return True
+            (used, generation) = HEADER.unpack_from(self._map, 0)[3:]
+            if slot is None or used + len(encoded) > self.data_size:
+                self._reset()
+                slot = self._free_slot(digest)
+                (used, generation) = HEADER.unpack_from(self._map, 0)[3:]
+
+            start = self._data_start + used
+            self._map[start:start + len(encoded)] = encoded
+            HEADER.pack_into(self._map, 0, MAGIC, self.slots, self.data_size,
+                             used + len(encoded), generation)
+            # The digest is written last, once the slot is complete
+            SLOT.pack_into(self._map, slot, EMPTY_DIGEST, used, len(encoded))
+            self._map[slot:slot + 20] = digest
+            return True
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _free_slot(self, digest):
+        """
+        Returns the offset of the slot to store a digest in, True when it is
+        stored already, or None when the table is full.
+        """
+        for slot in self._probe(digest):
+            slot_digest = SLOT.unpack_from(self._map, slot)[0]
+            if slot_digest == digest:
+                return True
+            if slot_digest == EMPTY_DIGEST:
+                return slot
+        return None
+
+    def get_encoded_schema(self, form):
+        """
+        Returns the canonical JSON encoding of form_to_schema(form), as bytes,
+        from the store, converting the form and storing it first when missing.
+        """
+        fingerprint = form_fingerprint(form)
+        encoded = self.get(fingerprint)
+        if encoded is not None:
+            CACHE_REQUESTS.inc(('shm', 'hit'))
+            return encoded
+
+        CACHE_REQUESTS.inc(('shm', 'miss'))
+        encoded = encode_schema(form_to_schema(form)).encode('utf-8')
+        self.put(fingerprint, encoded)
+        return encoded
+
+    def warm(self, forms):
+        """
+        Stores the schemas of many forms at once, typically from the master
+        process before workers are forked.
+        """
+        for form in forms:
+            self.get_encoded_schema(form)
+
+    def close(self):
+        self._map.close()
+        os.close(self._fd)
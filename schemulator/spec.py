@@ -0,0 +1,140 @@
+"""
+Intermediate representation of form fields, shared by the conversions in both
+directions.
+"""
+
+# JSON schema keywords held by FieldSpec, and the slot holding each of them
+# {JSON_SCHEMA : SLOT}
+
+SPEC_KEYWORDS = (
+    ("type", "type"),
+    ("format", "format"),
+    ("pattern", "pattern"),
+    ("title", "title"),
+    ("description", "description"),
+    ("default", "default"),
+    ("optional", "optional"),
+    ("null", "null"),
+    ("minLength", "min_length"),
+    ("maxLength", "max_length"),
+    ("minimum", "minimum"),
+    ("maximum", "maximum"),
+    ("enum", "enum"),
+    ("__django_form_field_cls", "django_field_cls"),
+    ("__wtforms_field_cls", "wtforms_field_cls"),
+    ("__widget", "widget"),
+)
+
+SLOTS = dict(SPEC_KEYWORDS)
+
+# Stands for slots which were never set
+_MISSING = object()
+
+
+class FieldSpec(object):
+    """
+    Normalized description of a form field, as found in an entry of the
+    'properties' keyword of a schema.
+
+    Slots which were never set stand for keywords absent from the schema.
+    Keywords without a slot are kept in the 'extra' dictionary. For reading,
+    a FieldSpec behaves like the schema fragment it describes, so it can be
+    used wherever such a dictionary is expected.
+    """
+
+    __slots__ = tuple(slot for (keyword, slot) in SPEC_KEYWORDS) + ('extra',)
+
+    def __init__(self, **kwargs):
+        self.extra = None
+        for (slot, value) in kwargs.items():
+            setattr(self, slot, value)
+
+    @classmethod
+    def from_schema(cls, schema):
+        """
+        Returns the FieldSpec of a schema fragment describing a field.
+        """
+        if isinstance(schema, cls):
+            return schema
+
+        spec = cls()
+        for (keyword, value) in schema.items():
+            slot = SLOTS.get(keyword)
+            if slot is not None:
+                setattr(spec, slot, value)
+            else:
+                if spec.extra is None:
+                    spec.extra = {}
+                spec.extra[keyword] = value
+        return spec
+
+    def to_schema(self):
+        """
+        Returns the schema fragment describing the field.
+        """
+        schema = {}
+        for (keyword, slot) in SPEC_KEYWORDS:
+            value = getattr(self, slot, _MISSING)
+            if value is not _MISSING:
+                schema[keyword] = value
+        if self.extra:
+            schema.update(self.extra)
+        return schema
+
+    def copy(self):
+        spec = FieldSpec()
+        for (keyword, slot) in SPEC_KEYWORDS:
+            value = getattr(self, slot, _MISSING)
+            if value is not _MISSING:
+                setattr(spec, slot, value)
+        if self.extra:
+            spec.extra = dict(self.extra)
+        return spec
+
+    def get(self, keyword, default=None):
+        slot = SLOTS.get(keyword)
+        if slot is not None:
+            return getattr(self, slot, default)
+        if self.extra:
+            return self.extra.get(keyword, default)
+        return default
+
+    def __getitem__(self, keyword):
+        value = self.get(keyword, _MISSING)
+        if value is _MISSING:
+            raise KeyError(keyword)
+        return value
+
+    def __contains__(self, keyword):
+        return self.get(keyword, _MISSING) is not _MISSING
+
+    def __setitem__(self, keyword, value):
+        slot = SLOTS.get(keyword)
+        if slot is not None:
+            setattr(self, slot, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[keyword] = value
+
+    def pop(self, keyword, default=None):
+        value = self.get(keyword, default)
+        slot = SLOTS.get(keyword)
+        if slot is not None:
+            if getattr(self, slot, _MISSING) is not _MISSING:
+                delattr(self, slot)
+        elif self.extra:
+            self.extra.pop(keyword, None)
+        return value
+
+    def __eq__(self, other):
+        if not isinstance(other, FieldSpec):
+            return NotImplemented
+        return self.to_schema() == other.to_schema()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self):
+        return 'FieldSpec(%r)' % self.to_schema()
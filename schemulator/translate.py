@@ -0,0 +1,268 @@
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+from django import forms
+import wtforms
+
+from schemulator.utils import field_signature
+
+
+"""
+Direct translation between Django Forms and WTForms, without going through an
+intermediate JSON schema.
+"""
+
+# Dictionaries for field classes translation
+# {SOURCE : TARGET}
+
+DJANGO_TO_WTFORMS = {
+    "BooleanField":"BooleanField",
+    "CharField":"StringField",
+    "ChoiceField":"SelectField",
+    "DateField":"DateField",
+    "DateTimeField":"DateTimeField",
+    "DecimalField":"DecimalField",
+    "EmailField":"StringField",
+    "FloatField":"FloatField",
+    "IntegerField":"IntegerField",
+    "IPAddressField":"StringField",
+    "GenericIPAddressField":"StringField",
+    "MultipleChoiceField":"SelectMultipleField",
+    "RegexField":"StringField",
+    "SlugField":"StringField",
+    "TimeField":"StringField",
+    "URLField":"StringField",
+}
+
+# Django widgets which are expressed as a field class in WTForms
+DJANGO_WIDGETS_TO_WTFORMS = {
+    "Textarea":"TextAreaField",
+    "RadioSelect":"RadioField",
+    "PasswordInput":"PasswordField",
+    "HiddenInput":"HiddenField",
+}
+
+WTFORMS_TO_DJANGO = {
+    "BooleanField":"BooleanField",
+    "DateField":"DateField",
+    "DateTimeField":"DateTimeField",
+    "DecimalField":"DecimalField",
+    "FloatField":"FloatField",
+    "HiddenField":"CharField",
+    "IntegerField":"IntegerField",
+    "PasswordField":"CharField",
+    "RadioField":"ChoiceField",
+    "SelectField":"ChoiceField",
+    "SelectMultipleField":"MultipleChoiceField",
+    "StringField":"CharField",
+    "TextAreaField":"CharField",
+    "TextField":"CharField",
+}
+
+# WTForms field classes which are expressed as a widget in Django Forms
+WTFORMS_TO_DJANGO_WIDGETS = {
+    "HiddenField":"HiddenInput",
+    "PasswordField":"PasswordInput",
+    "RadioField":"RadioSelect",
+    "TextAreaField":"Textarea",
+}
+
+# Translated form classes, by source form class, then by target and the names
+# and signatures of the fields. Entries go away with their source form class.
+_TRANSLATED = WeakKeyDictionary()
+
+# Translated classes kept at most for each source form class, as forms may
+# vary their fields by request: the least recently built one goes first.
+MAX_TRANSLATED_VARIANTS = 8
+
+
+def field_to_wtfield(field):
+    """
+    Returns an unbound WTForms field equivalent to a Django Forms field.
+    """
+
+    field_type = field.__class__.__name__
+    try:
+        wtfield_type = DJANGO_TO_WTFORMS[field_type]
+    except KeyError:
+        raise AttributeError(field_type + " is currently unsupported.")
+
+    widget_type = field.widget.__class__.__name__
+    if widget_type in DJANGO_WIDGETS_TO_WTFORMS:
+        wtfield_type = DJANGO_WIDGETS_TO_WTFORMS[widget_type]
+
+    kwargs = {
+        'label': field.label,
+        'description': field.help_text,
+        'default': field.initial,
+    }
+    validators = []
+
+    if not field.required:
+        validators.append(wtforms.validators.Optional())
+
+    min_length = getattr(field, 'min_length', None)
+    max_length = getattr(field, 'max_length', None)
+    if min_length is not None or max_length is not None:
+        validators.append(wtforms.validators.Length(
+            min=-1 if min_length is None else min_length,
+            max=-1 if max_length is None else max_length))
+
+    min_value = getattr(field, 'min_value', None)
+    max_value = getattr(field, 'max_value', None)
+    if min_value is not None or max_value is not None:
+        validators.append(wtforms.validators.NumberRange(min=min_value,
+                                                         max=max_value))
+
+    if field_type == 'EmailField':
+        validators.append(wtforms.validators.Email())
+    elif field_type == 'URLField':
+        validators.append(wtforms.validators.URL())
+    elif field_type == 'IPAddressField':
+        validators.append(wtforms.validators.IPAddress(ipv4=True))
+    elif field_type == 'GenericIPAddressField':
+        # Special case, as protocol is not a field attribute, and must be
+        # deduced from the validator.
+        validator = str(field.validators[0])
+        if 'ipv46' in validator:
+            validators.append(wtforms.validators.IPAddress(ipv4=True, ipv6=True))
+        elif 'ipv6' in validator:
+            validators.append(wtforms.validators.IPAddress(ipv4=False, ipv6=True))
+        else:
+            validators.append(wtforms.validators.IPAddress(ipv4=True))
+    else:
+        # Regex based fields, such as SlugField or RegexField
+        for validator in field.validators:
+            regex = getattr(validator, 'regex', None)
+            if regex is not None:
+                validators.append(wtforms.validators.Regexp(regex))
+
+    if hasattr(field, 'choices'):
+        kwargs['choices'] = list(field.choices)
+
+    kwargs['validators'] = validators
+
+    return getattr(wtforms, wtfield_type)(**kwargs)
+
+
+def wtfield_to_field(field):
+    """
+    Returns a Django Forms field equivalent to a WTForms field.
+    """
+
+    field_type = field.type
+    try:
+        django_field_type = WTFORMS_TO_DJANGO[field_type]
+    except KeyError:
+        raise AttributeError(field_type + " is currently unsupported.")
+
+    kwargs = {
+        'label': field.label.text,
+        'help_text': field.description,
+        'initial': field.default,
+        'required': True,
+    }
+
+    if field_type in WTFORMS_TO_DJANGO_WIDGETS:
+        kwargs['widget'] = getattr(forms.widgets,
+                                   WTFORMS_TO_DJANGO_WIDGETS[field_type])
+
+    if hasattr(field, 'choices'):
+        kwargs['choices'] = field.choices
+
+    for validator in field.validators:
+        val = validator.__class__.__name__
+
+        if val == 'Optional':
+            kwargs['required'] = False
+        if val == 'Length':
+            if validator.min != -1: kwargs['min_length'] = validator.min
+            if validator.max != -1: kwargs['max_length'] = validator.max
+        if val == 'NumberRange':
+            if validator.min is not None: kwargs['min_value'] = validator.min
+            if validator.max is not None: kwargs['max_value'] = validator.max
+        if val == 'Email':
+            django_field_type = 'EmailField'
+        if val == 'URL':
+            django_field_type = 'URLField'
+        if val == 'IPAddress':
+            django_field_type = 'GenericIPAddressField'
+            if validator.ipv4 and validator.ipv6:
+                kwargs['protocol'] = 'both'
+            elif validator.ipv6:
+                kwargs['protocol'] = 'IPv6'
+            else:
+                kwargs['protocol'] = 'IPv4'
+        if val == 'Regexp' and django_field_type == 'CharField':
+            django_field_type = 'RegexField'
+            kwargs['regex'] = validator.regex
+
+    # Length and value bounds only apply to some of the field classes
+    if django_field_type in ('GenericIPAddressField', 'BooleanField',
+                             'ChoiceField', 'MultipleChoiceField'):
+        kwargs.pop('min_length', None)
+        kwargs.pop('max_length', None)
+    if django_field_type not in ('IntegerField', 'FloatField', 'DecimalField'):
+        kwargs.pop('min_value', None)
+        kwargs.pop('max_value', None)
+
+    return getattr(forms, django_field_type)(**kwargs)
+
+
+def _field_key(field):
+    """
+    Returns what the translation of a field depends on.
+    """
+    if isinstance(field, wtforms.Field):
+        return field_signature(field)
+    # Regular expressions of RegexField and SlugField validators are
+    # translated too
+    patterns = tuple(getattr(getattr(v, 'regex', None), 'pattern', None)
+                     for v in field.validators)
+    return field_signature(field) + (patterns,)
+
+
+def translate_form(form, target='wtforms'):
+    """
+    Takes a Django Form or a WTForm and returns an equivalent form of the
+    target framework, either 'wtforms' or 'django'. The translated form class
+    is cached, so it is only built once per source form class and fields.
+    """
+
+    if target not in ('wtforms', 'django'):
+        raise ValueError("Unknown target '%s'" % target)
+
+    if isinstance(form, wtforms.form.BaseForm):
+        if target == 'wtforms':
+            return form
+        fields = [(field.name, field) for field in form]
+        translate_field = wtfield_to_field
+        base = forms.Form
+    else:
+        if target == 'django':
+            return form
+        fields = list(form.fields.items())
+        translate_field = field_to_wtfield
+        base = wtforms.Form
+
+    try:
+        key = (target, tuple((name, _field_key(field)) for (name, field) in fields))
+        variants = _TRANSLATED.get(form.__class__)
+        if variants is None:
+            variants = _TRANSLATED[form.__class__] = OrderedDict()
+        form_cls = variants.get(key)
+    except TypeError:
+        # Attribute values which can not be hashed, such as sets
+        (key, form_cls) = (None, None)
+
+    if form_cls is None:
+        attrs = {}
+        for (name, field) in fields:
+            attrs[name] = translate_field(field)
+        form_cls = type(form.__class__.__name__, (base,), attrs)
+        if key is not None:
+            variants[key] = form_cls
+            if len(variants) > MAX_TRANSLATED_VARIANTS:
+                variants.popitem(last=False)
+
+    return form_cls()
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from copy import deepcopy
+
+
+"""
+Upgrade transforms of schemas stored by previous versions of schemulator, or
+written by hand following other conventions.
+
+Transforms take a schema and return it upgraded. They are applied in order of
+registration, and must leave schemas they have nothing to do with as they
+are, so that upgrading a schema twice is the same as upgrading it once.
+"""
+
+# {NAME : TRANSFORM}
+UPGRADES = OrderedDict()
+
+# Modules whose widget classes are referred to by their bare name in schemas
+WIDGET_MODULES = (
+    'django.forms.widgets',
+    'django.forms',
+    'wtforms.widgets',
+    'wtforms.widgets.core',
+    'wtforms.widgets.html5',
+)
+
+
+def register(name):
+    """
+    Decorator registering a transform under name.
+    """
+    def decorator(transform):
+        UPGRADES[name] = transform
+        return transform
+    return decorator
+
+
+@register('required-to-optional')
+def required_to_optional(schema):
+    """
+    Replaces draft-03 'required' flags of properties, and the draft-04
+    'required' list of the schema, with 'optional' flags.
+    """
+
+    properties = schema.get('properties', {})
+
+    required = schema.pop('required', None)
+    if isinstance(required, (list, tuple)):
+        for (name, prop) in properties.items():
+            prop.setdefault('optional', name not in required)
+
+    for prop in properties.values():
+        if isinstance(prop.get('required'), bool):
+            prop.setdefault('optional', not prop.pop('required'))
+
+    return schema
+
+
+@register('widget-names')
+def widget_names(schema):
+    """
+    Replaces the dotted paths of built-in widgets in '__widget' keywords with
+    their bare class name.
+    """
+    for prop in schema.get('properties', {}).values():
+        widget = prop.get('__widget')
+        if widget and '.' in widget:
+            (module, name) = widget.rsplit('.', 1)
+            if module in WIDGET_MODULES:
+                prop['__widget'] = name
+    return schema
+
+
+def upgrade(schema, names=None):
+    """
+    Returns an upgraded copy of a schema, with all the registered transforms
+    or the ones named in names applied, in order of registration.
+    """
+    if names is None:
+        names = list(UPGRADES)
+    else:
+        order = dict((name, i) for (i, name) in enumerate(UPGRADES))
+        names = sorted(names, key=lambda name: order[name])
+
+    schema = deepcopy(schema)
+    for name in names:
+        schema = UPGRADES[name](schema)
+    return schema
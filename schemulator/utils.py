@@ -0,0 +1,244 @@
+import hashlib
+from importlib import import_module
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.forms.formsets import BaseFormSet
+from django.utils import six
+from django.utils.encoding import force_text
+from django.utils.functional import Promise
+import wtforms
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # Python 2
+    from collections import Mapping
+
+
+"""
+Helpers shared by the schemulator caching layers: canonical encoding of
+schemas and cheap fingerprints of forms.
+"""
+
+# Bumped whenever the schemas produced by form_to_schema change shape, so any
+# previously cached encoding is left behind.
+SCHEMA_VERSION = 1
+
+# Attributes of Django Forms fields read by field_to_schema
+FIELD_ATTRS = (
+    'label',
+    'help_text',
+    'initial',
+    'required',
+    'max_length',
+    'min_length',
+    'min_value',
+    'max_value',
+    'choices',
+)
+
+# Attributes of WTForms validators read by wtfield_to_schema
+VALIDATOR_ATTRS = ('min', 'max', 'ipv4', 'ipv6')
+
+
+# Types of the values _stable returns as they are
+_LITERALS = frozenset(six.integer_types + (type(None), bool, float, six.text_type, bytes))
+
+# Names given to classes in schemas, by class and default module
+_CLASS_NAMES = {}
+
+# Dotted paths of the classes of objects which are neither classes nor
+# functions, by class
+_INSTANCE_PATHS = {}
+
+
+def class_name(cls, module):
+    """
+    Returns the name of a class as found in schemas: its bare name when it
+    can be found in the given module, its dotted path otherwise.
+    """
+    try:
+        return _CLASS_NAMES[(cls, module)]
+    except KeyError:
+        pass
+
+    name = cls.__name__
+    if getattr(import_module(module), name, None) is not cls:
+        name = cls.__module__ + '.' + name
+    _CLASS_NAMES[(cls, module)] = name
+    return name
+
+
+def _dotted_path(value):
+    """
+    Returns the dotted path of a class or function, or of the class of any
+    other object.
+    """
+    try:
+        return _INSTANCE_PATHS[value.__class__]
+    except KeyError:
+        pass
+
+    if hasattr(value, '__module__') and hasattr(value, '__name__'):
+        return '%s.%s' % (value.__module__, value.__name__)
+    cls = value.__class__
+    path = _INSTANCE_PATHS[cls] = '%s.%s' % (cls.__module__, cls.__name__)
+    return path
+
+
+def _stable(value):
+    """
+    Returns a representation of value made of literals and tuples only, which
+    does not depend on object identity, so that it can be safely encoded and
+    hashed across processes. Values JSON can not encode, such as callables,
+    are represented by their dotted path.
+    """
+    if value.__class__ in _LITERALS:
+        return value
+    if isinstance(value, Promise):
+        return force_text(value)
+    if isinstance(value, (list, tuple)):
+        # Choices are long sequences of literal pairs
+        return tuple([v if v.__class__ in _LITERALS else _stable(v) for v in value])
+    if isinstance(value, dict):
+        return tuple(sorted((k, _stable(v)) for (k, v) in value.items()))
+    if isinstance(value, six.string_types + six.integer_types + (float,)):
+        # Subclasses, such as safe strings, are encoded as their base class
+        return value
+    try:
+        # Dates, times, decimals and other mappings, as schemas hold them
+        return _stable(_ENCODER.default(value))
+    except TypeError:
+        return _dotted_path(value)
+
+
+def _encode_signature(signature):
+    """
+    Returns the canonical encoding of a signature made of _stable values.
+    """
+    return json.dumps(signature, separators=(',', ':'), default=force_text)
+
+
+def field_signature(field):
+    """
+    Returns a tuple of everything field_to_schema reads from a Django Forms or
+    WTForms field. Two fields with the same signature have the same schema.
+    """
+
+    if isinstance(field, wtforms.Field):
+        validators = []
+        for validator in field.validators:
+            params = [getattr(validator, attr, None) for attr in VALIDATOR_ATTRS]
+            regex = getattr(validator, 'regex', None)
+            params.append(getattr(regex, 'pattern', regex))
+            validators.append((_dotted_path(validator), _stable(params)))
+
+        signature = (field.type,
+                     class_name(field.widget.__class__, 'wtforms.widgets'),
+                     _stable(field.label.text),
+                     _stable(field.description),
+                     _stable(field.default),
+                     _stable(getattr(field, 'choices', None)),
+                     tuple(validators))
+        if field.type == 'FieldList':
+            signature += (field.min_entries, field.max_entries,
+                          _entry_signature(field.name, field.unbound_field))
+        return signature
+
+    return (_dotted_path(field),
+            class_name(field.widget.__class__, 'django.forms.widgets'),
+            _stable([getattr(field, attr, None) for attr in FIELD_ATTRS]),
+            tuple([_dotted_path(v) for v in field.validators]))
+
+
+def _entry_signature(name, unbound_field):
+    """
+    Returns the signature of the entries of a WTForms FieldList, given the
+    UnboundField it repeats: the fingerprint of the form class of FormFields,
+    and the signature of the field otherwise.
+    """
+
+    if issubclass(unbound_field.field_class, wtforms.FormField):
+        form_cls = unbound_field.kwargs.get('form_class') or unbound_field.args[0]
+        return ('FormField', form_fingerprint(form_cls))
+
+    from schemulator import UnboundFieldView
+    return field_signature(UnboundFieldView(name, unbound_field))
+
+
+def form_fingerprint(form):
+    """
+    Returns a hex digest identifying the schema a Django Form, formset or
+    WTForm, or their class, converts to, without converting it.
+    """
+
+    if isinstance(form, BaseFormSet) or \
+       (isinstance(form, type) and issubclass(form, BaseFormSet)):
+        return _formset_fingerprint(form if isinstance(form, type) else form.__class__)
+
+    if isinstance(form, type):
+        cls = form
+        if issubclass(form, wtforms.form.BaseForm):
+            from schemulator import unbound_field_views
+            fields = unbound_field_views(form)
+        else:
+            fields = form.base_fields.items()
+    else:
+        cls = form.__class__
+        if isinstance(form, wtforms.form.BaseForm):
+            fields = [(field.name, field) for field in form]
+        else:
+            fields = form.fields.items()
+
+    parts = [cls.__module__, cls.__name__]
+    for (name, field) in fields:
+        parts.append(name)
+        parts.append(_encode_signature(field_signature(field)))
+
+    return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _formset_fingerprint(formset_cls):
+    # The schema of a formset only depends on its options and on its form
+    parts = [formset_cls.__module__, formset_cls.__name__, form_fingerprint(formset_cls.form)]
+    for option in ('extra', 'can_order', 'can_delete', 'max_num', 'validate_max',
+                   'min_num', 'validate_min'):
+        parts.append(_encode_signature(_stable(getattr(formset_cls, option, None))))
+
+    return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+class SchemaJSONEncoder(DjangoJSONEncoder):
+    """
+    Encodes lazy translation strings, which Django Forms labels often are, and
+    mappings which are not dictionaries, such as LazyProperties, on top of what
+    DjangoJSONEncoder already knows about.
+    """
+    def default(self, o):
+        if isinstance(o, Promise):
+            return force_text(o)
+        if isinstance(o, Mapping):
+            return dict(o)
+        return super(SchemaJSONEncoder, self).default(o)
+
+
+_ENCODER = SchemaJSONEncoder()
+
+
+def encode_schema(schema):
+    """
+    Returns the canonical JSON encoding of a schema: sorted keys and no
+    insignificant whitespace, so equal schemas encode to equal strings.
+    """
+    return json.dumps(schema, cls=SchemaJSONEncoder, sort_keys=True,
+                      separators=(',', ':'))
+
+
+def schema_fingerprint(encoded):
+    """
+    Returns a hex digest of an encoded schema.
+    """
+    if not isinstance(encoded, bytes):
+        encoded = encoded.encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
@@ -0,0 +1,134 @@
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+
+from schemulator.cache import get_schema_variants
+from schemulator.metrics import CONTENT_TYPE, render
+
+
+"""
+Optional Django views, to be routed from a project's URLconf:
+
+    url(r'^metrics$', 'schemulator.views.metrics'),
+"""
+
+JSON_CONTENT_TYPE = 'application/json'
+
+# Pages are named after their content, so they never change
+PAGE_MAX_AGE = 365 * 24 * 60 * 60
+
+# Content codings schemas are stored in, by order of preference
+PREFERRED_CODINGS = ('gzip', 'deflate')
+
+
+def metrics(request):
+    """
+    Returns the schemulator metrics of the process serving the request, in
+    the Prometheus text exposition format.
+    """
+    return HttpResponse(render(), content_type=CONTENT_TYPE)
+
+
+def _etag_matches(request, etag):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+    return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+
+
+def schema_pages(request, pages, fingerprint=None):
+    """
+    Returns the header of a SchemaPages, or its page with the given
+    fingerprint. Meant to be called by a project's views, as in:
+
+        def survey_schema(request, fingerprint=None):
+            return schema_pages(request, SURVEY_PAGES, fingerprint)
+
+    Responses carry the fingerprint as their ETag, and pages may be cached by
+    clients for good.
+    """
+
+    if fingerprint is None:
+        (fingerprint, content) = (pages.fingerprint, pages.encoded_header)
+    else:
+        try:
+            content = pages.page(fingerprint)
+        except KeyError:
+            raise Http404("No such schema page")
+
+    etag = '"%s"' % fingerprint
+    if _etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content, content_type=JSON_CONTENT_TYPE)
+
+    response['ETag'] = etag
+    if fingerprint != pages.fingerprint:
+        response['Cache-Control'] = 'public, max-age=%d' % PAGE_MAX_AGE
+    return response
+
+
+def _accepted_codings(header):
+    """
+    Returns the qualities of the content codings listed in an
+    Accept-Encoding header, by coding.
+    """
+    qualities = {}
+    for part in header.split(','):
+        params = part.split(';')
+        coding = params[0].strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params[1:]:
+            (name, _, value) = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+def choose_coding(header):
+    """
+    Returns the preferred content coding accepted by an Accept-Encoding
+    header, or 'identity'.
+    """
+    qualities = _accepted_codings(header)
+    (best, best_quality) = ('identity', 0.0)
+    for coding in PREFERRED_CODINGS:
+        quality = qualities.get(coding, qualities.get('*', 0.0))
+        if quality > best_quality:
+            (best, best_quality) = (coding, quality)
+    return best
+
+
+def cached_schema(request, form, alias=None):
+    """
+    Returns the JSON response of the schema of a form, taken from the cache
+    already compressed in the coding preferred by the client, so that no
+    middleware needs to compress it again. Meant to be called by a project's
+    views, as in:
+
+        def signup_schema(request):
+            return cached_schema(request, SignupForm())
+    """
+
+    variants = get_schema_variants(form, alias)
+    coding = choose_coding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+
+    # Each coding of the schema is a different representation
+    if coding == 'identity':
+        etag = '"%s"' % variants.fingerprint
+    else:
+        etag = '"%s-%s"' % (variants.fingerprint, coding)
+
+    if _etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(getattr(variants, coding), content_type=JSON_CONTENT_TYPE)
+        if coding != 'identity':
+            response['Content-Encoding'] = coding
+
+    response['ETag'] = etag
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
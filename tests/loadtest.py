@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+"""
+Load testing of the schema endpoints of the test project.
+
+Serves tests/urls.py from a threaded WSGI server running in its own process,
+so that it does not compete with the clients for the interpreter, and drives
+it with many concurrent clients sending a weighted mix of requests, then reports the
+latency percentiles and throughput of each endpoint:
+
+    python tests/loadtest.py --clients 32 --duration 30 --mix schema=1,cached=8,validate=1
+
+With --url, an already running server is targeted instead, such as one
+started with 'python tests/loadtest.py --serve 8000', or the project served
+by a production WSGI server. Clients run as threads of a single process, so
+use several client processes, or machines, to load large servers.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from timeit import default_timer
+
+try:
+    from http.client import HTTPException
+    from socketserver import ThreadingMixIn
+    from urllib.error import HTTPError, URLError
+    from urllib.request import Request, urlopen
+except ImportError:
+    # Python 2
+    from httplib import HTTPException
+    from SocketServer import ThreadingMixIn
+    from urllib2 import HTTPError, Request, URLError, urlopen
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Payloads posted to the validate endpoint, by form name
+PAYLOADS = {
+    'signup': {'username': 'jane', 'email': 'jane@example.com', 'age': 30,
+               'newsletter': True, 'country': 'fr'},
+    'survey': dict(('question_%d' % i, 'Answer %d' % i) for i in range(0, 200, 3)),
+}
+
+DEFAULT_MIX = 'schema=1,cached=1,validate=1'
+
+# Seconds a request may wait for the server before it counts as failed
+DEFAULT_TIMEOUT = 10.0
+
+# Failures of a request which do not stop its client: error statuses,
+# refused or reset connections, timeouts and truncated responses
+REQUEST_ERRORS = (HTTPError, URLError, HTTPException, socket.error)
+
+
+class ThreadedWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class QuietHandler(WSGIRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(port=0):
+    """
+    Serves the test project on localhost from a background thread, and
+    returns the server.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+    from django.core.wsgi import get_wsgi_application
+
+    server = make_server('127.0.0.1', port, get_wsgi_application(),
+                         server_class=ThreadedWSGIServer, handler_class=QuietHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def spawn_server(port=0):
+    """
+    Serves the test project on localhost from a child process, and returns
+    the process and the base URL of the server.
+    """
+    process = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--serve', str(port)],
+                               stdout=subprocess.PIPE)
+    line = process.stdout.readline().decode('utf-8')
+    if not line.startswith('Serving on '):
+        process.kill()
+        process.wait()
+        raise RuntimeError("The server did not start")
+    return process, line[len('Serving on '):].strip()
+
+
+def stop_server(process):
+    process.terminate()
+    process.wait()
+    process.stdout.close()
+
+
+def parse_mix(mix):
+    """
+    Returns the (endpoint, weight) pairs of a mix such as 'schema=3,cached=1'.
+    """
+    pairs = []
+    for part in mix.split(','):
+        (endpoint, _, weight) = part.partition('=')
+        if endpoint.strip() not in ('schema', 'cached', 'validate'):
+            raise ValueError("Unknown endpoint '%s'" % endpoint)
+        pairs.append((endpoint.strip(), float(weight or 1)))
+    return pairs
+
+
+def make_request(base_url, endpoint, name):
+    url = '%s/%s/%s' % (base_url, endpoint, name)
+    if endpoint == 'validate':
+        return Request(url, json.dumps(PAYLOADS[name]).encode('utf-8'),
+                       {'Content-Type': 'application/json'})
+    return Request(url, headers={'Accept-Encoding': 'gzip'})
+
+
+def client(base_url, mix, names, deadline, seed, results, timeout=DEFAULT_TIMEOUT):
+    """
+    Sends requests until the deadline, and records their (endpoint, latency,
+    succeeded) in results. Requests failing in any of the REQUEST_ERRORS ways
+    are recorded as failed.
+    """
+    rand = random.Random(seed)
+    endpoints = [endpoint for (endpoint, weight) in mix]
+    total = sum(weight for (endpoint, weight) in mix)
+    cumulative = []
+    for (endpoint, weight) in mix:
+        cumulative.append((cumulative[-1] if cumulative else 0) + weight / total)
+
+    while default_timer() < deadline:
+        draw = rand.random()
+        endpoint = endpoints[-1]
+        for (candidate, bound) in zip(endpoints, cumulative):
+            if draw < bound:
+                endpoint = candidate
+                break
+
+        request = make_request(base_url, endpoint, rand.choice(names))
+        start = default_timer()
+        try:
+            response = urlopen(request, timeout=timeout)
+            body = response.read()
+            # Python 2 returns truncated bodies without raising IncompleteRead
+            length = response.info().get('Content-Length')
+            succeeded = length is None or len(body) == int(length)
+        except REQUEST_ERRORS:
+            succeeded = False
+        results.append((endpoint, default_timer() - start, succeeded))
+
+
+def percentile(sorted_values, fraction):
+    """
+    Returns the nearest-rank percentile of a sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    index = int(math.ceil(fraction * len(sorted_values))) - 1
+    return sorted_values[min(max(index, 0), len(sorted_values) - 1)]
+
+
+def report(results, elapsed, out=sys.stdout):
+    by_endpoint = {}
+    for (endpoint, latency, succeeded) in results:
+        by_endpoint.setdefault(endpoint, []).append((latency, succeeded))
+
+    rows = [('endpoint', 'requests', 'errors', 'p50 ms', 'p99 ms', 'req/s')]
+    for endpoint in sorted(by_endpoint) + ['all']:
+        if endpoint == 'all':
+            samples = [(latency, succeeded) for (_, latency, succeeded) in results]
+        else:
+            samples = by_endpoint[endpoint]
+        latencies = sorted(latency for (latency, _) in samples)
+        errors = len([s for s in samples if not s[1]])
+        rows.append((endpoint, str(len(samples)), str(errors),
+                     '%.2f' % (percentile(latencies, 0.5) * 1000),
+                     '%.2f' % (percentile(latencies, 0.99) * 1000),
+                     '%.1f' % (len(samples) / elapsed)))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        out.write('  '.join(value.rjust(width) for (value, width) in zip(row, widths)) + '\n')
+
+
+def run(base_url, clients, duration, mix, names, seed=0, timeout=DEFAULT_TIMEOUT):
+    """
+    Drives base_url with concurrent clients for duration seconds, and returns
+    the recorded (endpoint, latency, succeeded) and the time elapsed.
+    """
+    results = []
+    start = default_timer()
+    deadline = start + duration
+    threads = [threading.Thread(target=client,
+                                args=(base_url, mix, names, deadline, seed + i, results,
+                                      timeout))
+               for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, default_timer() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--url', help="Base URL of a running server to target")
+    parser.add_argument('--serve', type=int, metavar='PORT',
+                        help="Only serve the test project on PORT")
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds")
+    parser.add_argument('--warmup', type=float, default=1.0,
+                        help="Seconds of load not reported on, to fill the caches")
+    parser.add_argument('--mix', default=DEFAULT_MIX,
+                        help="Weights of the endpoints, such as '%s'" % DEFAULT_MIX)
+    parser.add_argument('--forms', default=','.join(sorted(PAYLOADS)),
+                        help="Names of the forms requested")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help="Seconds a request may take before it counts as failed")
+    args = parser.parse_args(argv)
+
+    if args.serve is not None:
+        server = start_server(args.serve)
+        sys.stdout.write('Serving on http://127.0.0.1:%d\n' % server.server_port)
+        sys.stdout.flush()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            return
+
+    mix = parse_mix(args.mix)
+    names = args.forms.split(',')
+
+    process = None
+    base_url = args.url
+    if base_url is None:
+        (process, base_url) = spawn_server()
+    base_url = base_url.rstrip('/')
+
+    try:
+        if args.warmup:
+            run(base_url, args.clients, args.warmup, mix, names, args.seed, args.timeout)
+        (results, elapsed) = run(base_url, args.clients, args.duration, mix, names, args.seed,
+                                 args.timeout)
+    finally:
+        if process is not None:
+            stop_server(process)
+
+    report(results, elapsed)
+
+
+if __name__ == '__main__':
+    main()
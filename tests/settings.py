@@ -47,7 +47,7 @@ MIDDLEWARE_CLASSES = (
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 )
 
-ROOT_URLCONF = 'schemulator.urls'
+ROOT_URLCONF = 'tests.urls'
 
 WSGI_APPLICATION = 'schemulator.wsgi.application'
 
@@ -0,0 +1,68 @@
+from django.test import TestCase
+from django import forms
+import wtforms
+
+from schemulator import bind_many, schema_to_form, schema_to_form_class
+
+
+schema = {
+    '$schema':'http://json-schema.org/draft-04/schema#',
+    'title':'JSON Schema',
+    'description':'This is a JSON Schema describing a form',
+    'properties':{
+        'name':{
+            'type': 'string',
+            'title': 'Name',
+            'maxLength': 10,
+        },
+        'age':{
+            'type': 'integer',
+            'title': 'Age',
+            'minimum': 0,
+            'optional': True,
+        },
+    }
+}
+
+payloads = [
+    {'name': 'Alice', 'age': 30},
+    {'name': 'Bob'},
+    {'name': 'A name which is too long', 'age': -1},
+]
+
+
+class BindManyTestCase(TestCase):
+
+    def test_schema_to_form_class(self):
+        form_cls = schema_to_form_class(schema)
+        self.assertTrue(issubclass(form_cls, forms.Form))
+        self.assertEqual(sorted(form_cls.base_fields), ['age', 'name'])
+
+        form_cls = schema_to_form_class(schema, form_type='wtforms')
+        self.assertTrue(issubclass(form_cls, wtforms.Form))
+
+    def test_schema_to_form(self):
+        # Single forms are built without going through a class of their own
+        form = schema_to_form(schema)
+        self.assertIs(form.__class__, forms.Form)
+        self.assertEqual(sorted(form.fields), ['age', 'name'])
+        self.assertEqual(form.fields['name'].max_length, 10)
+
+    def test_django_forms(self):
+        bound_forms = list(bind_many(schema, payloads))
+        self.assertEqual([f.is_bound for f in bound_forms], [True] * 3)
+        self.assertEqual([f.is_valid() for f in bound_forms], [True, True, False])
+        self.assertEqual(len(set(f.__class__ for f in bound_forms)), 1)
+        self.assertEqual(sorted(bound_forms[2].errors), ['age', 'name'])
+
+    def test_django_cleaned_data(self):
+        results = list(bind_many(schema, payloads, cleaned=True))
+        self.assertEqual(results[0], ({'name': 'Alice', 'age': 30}, {}))
+        self.assertEqual(results[1][0]['age'], None)
+        self.assertIn('name', results[2][1])
+
+    def test_wtforms(self):
+        results = list(bind_many(schema, payloads, form_type='wtforms', cleaned=True))
+        self.assertEqual(results[0], ({'name': 'Alice', 'age': 30}, {}))
+        self.assertEqual(results[1][1], {})
+        self.assertEqual(sorted(results[2][1]), ['age', 'name'])
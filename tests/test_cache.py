@@ -0,0 +1,157 @@
+import datetime
+from gzip import GzipFile
+from io import BytesIO
+import zlib
+
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django import forms
+
+from schemulator import form_to_schema
+from schemulator import cache as schema_cache
+from schemulator.metrics import CACHE_REQUESTS
+from schemulator.utils import _stable, encode_schema, form_fingerprint
+from schemulator.views import cached_schema, choose_coding
+
+
+class CacheTestForm(forms.Form):
+    text_field = forms.CharField(label="Text Field",
+                                 help_text="This is a text field",
+                                 max_length=100)
+    integer_field = forms.IntegerField(label="Integer Field",
+                                       min_value=0,
+                                       required=False)
+
+
+class CacheTestCase(TestCase):
+
+    def setUp(self):
+        self.cache = schema_cache.get_cache_backend()
+        self.cache.clear()
+        self.calls = []
+        self.form_to_schema = schema_cache.form_to_schema
+
+        def counting_form_to_schema(form):
+            self.calls.append(form)
+            return form_to_schema(form)
+
+        schema_cache.form_to_schema = counting_form_to_schema
+
+    def tearDown(self):
+        schema_cache.form_to_schema = self.form_to_schema
+        self.cache.clear()
+
+    def test_cached_schema(self):
+        form = CacheTestForm()
+        self.assertEqual(schema_cache.cached_form_to_schema(form),
+                         form_to_schema(form))
+
+    def test_schema_computed_once(self):
+        CACHE_REQUESTS.reset()
+        schema_cache.cached_form_to_schema(CacheTestForm())
+        schema_cache.cached_form_to_schema(CacheTestForm())
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(CACHE_REQUESTS.value(('django', 'miss')), 1)
+        self.assertEqual(CACHE_REQUESTS.value(('django', 'hit')), 1)
+
+    def test_fingerprint_changes_with_fields(self):
+        form = CacheTestForm()
+        fingerprint = form_fingerprint(form)
+        form.fields['text_field'].required = False
+        self.assertNotEqual(form_fingerprint(form), fingerprint)
+        self.assertEqual(form_fingerprint(CacheTestForm()), fingerprint)
+
+    def test_fingerprint_of_objects(self):
+        class Default(object):
+            pass
+
+        def today():
+            return datetime.date.today()
+
+        def form_cls(initial, widget=forms.TextInput):
+            return type('ObjectTestForm', (forms.Form,), {
+                'field': forms.CharField(initial=initial, widget=widget)})
+
+        # Objects are told apart by their class, not their address
+        self.assertEqual(_stable(Default()), 'tests.test_cache.Default')
+        self.assertEqual(_stable(today), 'tests.test_cache.today')
+        self.assertEqual(form_fingerprint(form_cls(Default())), form_fingerprint(form_cls(Default())))
+        self.assertEqual(form_fingerprint(form_cls(today)), form_fingerprint(form_cls(today)))
+        self.assertNotEqual(form_fingerprint(form_cls(today)), form_fingerprint(form_cls(Default())))
+
+        # Values schemas hold are told apart by their value
+        self.assertNotEqual(form_fingerprint(form_cls(datetime.date(2020, 1, 1))),
+                            form_fingerprint(form_cls(datetime.date(2020, 1, 2))))
+
+        # Widgets are named as in schemas
+        TextInput = type('TextInput', (forms.TextInput,), {})
+        self.assertNotEqual(form_fingerprint(form_cls(None, TextInput)),
+                            form_fingerprint(form_cls(None)))
+
+    def test_invalidate(self):
+        schema_cache.cached_form_to_schema(CacheTestForm())
+        schema_cache.invalidate()
+        schema_cache.cached_form_to_schema(CacheTestForm())
+        self.assertEqual(len(self.calls), 2)
+
+    def test_locked_key_waits_then_computes(self):
+        form = CacheTestForm()
+        key = schema_cache.schema_key(self.cache, form_fingerprint(form))
+        self.cache.add(key + ':lock', 1)
+
+        lock_wait = schema_cache.LOCK_WAIT
+        schema_cache.LOCK_WAIT = 0.1
+        try:
+            schema = schema_cache.cached_form_to_schema(form)
+        finally:
+            schema_cache.LOCK_WAIT = lock_wait
+
+        self.assertEqual(schema, form_to_schema(form))
+        # The lock holder is the one expected to store the schema
+        self.assertIsNone(self.cache.get(key))
+
+
+class SchemaVariantsTestCase(TestCase):
+
+    def setUp(self):
+        self.cache = schema_cache.get_cache_backend()
+        self.cache.clear()
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_variants(self):
+        form = CacheTestForm()
+        variants = schema_cache.get_schema_variants(form)
+        encoded = encode_schema(form_to_schema(form)).encode('utf-8')
+        self.assertEqual(variants.identity, encoded)
+        self.assertEqual(zlib.decompress(variants.deflate), encoded)
+        self.assertEqual(GzipFile(fileobj=BytesIO(variants.gzip)).read(), encoded)
+        self.assertEqual(schema_cache.get_schema_variants(CacheTestForm()), variants)
+
+    def test_choose_coding(self):
+        self.assertEqual(choose_coding(''), 'identity')
+        self.assertEqual(choose_coding('gzip, deflate'), 'gzip')
+        self.assertEqual(choose_coding('deflate'), 'deflate')
+        self.assertEqual(choose_coding('gzip;q=0.5, deflate'), 'deflate')
+        self.assertEqual(choose_coding('gzip;q=0, *'), 'deflate')
+        self.assertEqual(choose_coding('br'), 'identity')
+
+    def test_cached_schema_view(self):
+        factory = RequestFactory()
+        variants = schema_cache.get_schema_variants(CacheTestForm())
+
+        response = cached_schema(factory.get('/', HTTP_ACCEPT_ENCODING='gzip, deflate'),
+                                 CacheTestForm())
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.content, variants.gzip)
+
+        response = cached_schema(factory.get('/'), CacheTestForm())
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, variants.identity)
+        self.assertEqual(response['ETag'], '"%s"' % variants.fingerprint)
+
+        response = cached_schema(factory.get('/', HTTP_IF_NONE_MATCH=response['ETag']),
+                                 CacheTestForm())
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,70 @@
+import os
+import shutil
+import tempfile
+
+from django.test import TestCase
+from django import forms
+import wtforms
+
+from schemulator import form_to_schema
+from schemulator.codegen import schemas_to_source, write_module
+
+
+class DjangoTestForm(forms.Form):
+    text_field = forms.CharField(label="Text Field",
+                                 help_text="This is a text field",
+                                 required=False,
+                                 max_length=100)
+    text_area_field = forms.CharField(label="Text Area Field",
+                                      widget=forms.widgets.Textarea)
+    choice_field = forms.ChoiceField(label="Choice Field",
+                                     choices=[("1", "One"), ("2", "Two")])
+    integer_field = forms.IntegerField(label="Integer Field",
+                                       initial=10,
+                                       min_value=0)
+
+
+class WTFormsTestForm(wtforms.Form):
+    string_field = wtforms.StringField("String Field",
+                                       validators=[wtforms.validators.Length(min=10, max=50),
+                                                   wtforms.validators.Optional()])
+    text_area_field = wtforms.TextAreaField("Text Area Field")
+
+
+def load(source):
+    namespace = {}
+    exec(source, namespace)
+    return namespace
+
+
+class CodegenTestCase(TestCase):
+
+    def test_django_module(self):
+        schema = form_to_schema(DjangoTestForm())
+        source = schemas_to_source({'GeneratedForm': schema})
+        form_cls = load(source)['GeneratedForm']
+        self.assertTrue(issubclass(form_cls, forms.Form))
+        self.assertEqual(form_to_schema(form_cls()), schema)
+
+    def test_wtforms_module(self):
+        schema = form_to_schema(WTFormsTestForm())
+        source = schemas_to_source([('GeneratedForm', schema)], form_type='wtforms')
+        form_cls = load(source)['GeneratedForm']
+        self.assertTrue(issubclass(form_cls, wtforms.Form))
+        self.assertEqual(form_to_schema(form_cls()), schema)
+
+    def test_invalid_names(self):
+        schema = {'properties': {'not valid': {'type': 'string'}}}
+        self.assertRaises(ValueError, schemas_to_source, {'GeneratedForm': schema})
+        schema = {'properties': {'django': {'type': 'string'}}}
+        self.assertRaises(ValueError, schemas_to_source, {'GeneratedForm': schema})
+
+    def test_write_module(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'generated_forms.py')
+            write_module(path, {'GeneratedForm': form_to_schema(DjangoTestForm())})
+            with open(path) as module:
+                self.assertIn('class GeneratedForm(django.forms.Form):', module.read())
+        finally:
+            shutil.rmtree(directory)
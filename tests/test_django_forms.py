@@ -1,9 +1,15 @@
+import timeit
+
 from django.test import TestCase
 from django import forms
 
 from jsonschema import validate, Draft4Validator, ValidationError
 
+import schemulator
 from schemulator import form_to_schema, field_to_schema, schema_to_form, schema_to_field
+from schemulator import metrics
+from schemulator.metrics import CONVERSIONS
+from schemulator.utils import encode_schema, form_fingerprint
 
 
 # These are FIELDS to test within the form and their equivalent representation
@@ -256,6 +262,15 @@ class TestForm(forms.Form):
 # An instance of TestForm to work with
 test_form = TestForm()
 
+
+class UserTestForm(TestForm):
+
+    def __init__(self, staff=False, *args, **kwargs):
+        super(UserTestForm, self).__init__(*args, **kwargs)
+        if not staff:
+            del self.fields['url_field']
+            self.fields['text_field'].required = True
+
 def dict_in_dict(d, subset_d):
     """
     Checks if the items in a dictionary are all contained within some other
@@ -273,6 +288,94 @@ class FormToSchemaTestCase(TestCase):
         schema = form_to_schema(test_form)
         self.assertIsNone(Draft4Validator.check_schema(schema))
 
+    def test_projection(self):
+        schema = form_to_schema(test_form, fields=['text_field', 'email_field', 'url_field'],
+                                exclude=['url_field'])
+        self.assertEqual(sorted(schema['properties']), ['email_field', 'text_field'])
+        self.assertTrue(dict_in_dict(schema['properties']['text_field'], text_field_js))
+
+    def test_lazy_properties(self):
+        schema = form_to_schema(test_form, lazy=True)
+        properties = schema['properties']
+        self.assertEqual(sorted(properties), sorted(test_form.fields))
+        self.assertEqual(properties._converted, {})
+
+        self.assertTrue(dict_in_dict(properties['email_field'], email_field_js))
+        self.assertEqual(list(properties._converted), ['email_field'])
+        self.assertEqual(dict(properties), form_to_schema(test_form)['properties'])
+
+    def test_encode_lazy_properties(self):
+        schema = form_to_schema(test_form, lazy=True)
+        self.assertEqual(encode_schema(schema), encode_schema(form_to_schema(test_form)))
+        properties = schema['properties'].copy()
+        self.assertIsInstance(properties, dict)
+        self.assertEqual(properties, form_to_schema(test_form)['properties'])
+
+    def test_form_class(self):
+        self.assertEqual(form_to_schema(TestForm), form_to_schema(test_form))
+        self.assertEqual(form_to_schema(TestForm, fields=['email_field']),
+                         form_to_schema(test_form, fields=['email_field']))
+        self.assertEqual(form_fingerprint(TestForm), form_fingerprint(TestForm()))
+
+    def test_incremental(self):
+        def conversions():
+            return sum(CONVERSIONS.value(('field_to_spec', 'django', field.__class__.__name__))
+                       for field in test_form.fields.values())
+
+        metrics.configure('fields')
+        self.addCleanup(metrics.configure)
+
+        for staff in (False, True):
+            self.assertEqual(form_to_schema(UserTestForm(staff), incremental=True),
+                             form_to_schema(UserTestForm(staff)))
+
+        # Only the fields which changed are converted again
+        before = conversions()
+        schema = form_to_schema(UserTestForm(staff=True), incremental=True)
+        self.assertEqual(conversions(), before)
+        form = UserTestForm(staff=True)
+        form.fields['email_field'].max_length = 50
+        schema = form_to_schema(form, incremental=True)
+        self.assertEqual(conversions(), before + 1)
+        self.assertEqual(schema['properties']['email_field']['maxLength'], 50)
+
+        # Schemas are copies of the memoized ones
+        schema['properties']['text_field']['title'] = 'Changed'
+        schema = form_to_schema(UserTestForm(staff=True), incremental=True)
+        self.assertEqual(schema['properties']['text_field']['title'], 'Text Field')
+
+    def test_incremental_hits(self):
+        form = UserTestForm(staff=True)
+        schema = form_to_schema(form, incremental=True)
+        self.assertEqual(form_to_schema(form, incremental=True), schema)
+
+        # Memo hits are cheaper than converting the fields again. Timings
+        # alternate, so that load spikes hit both alike.
+        timings = {True: [], False: []}
+        for i in range(7):
+            for incremental in (True, False):
+                timings[incremental].append(timeit.timeit(
+                    lambda: form_to_schema(form, incremental=incremental), number=20))
+        self.assertLess(min(timings[True]), min(timings[False]))
+
+        # Fields of the form class are recognized without their signature
+        form_to_schema(UserTestForm, incremental=True)
+        signature = schemulator.field_signature
+        calls = []
+        schemulator.field_signature = lambda field: calls.append(field) or signature(field)
+        try:
+            self.assertEqual(form_to_schema(UserTestForm, incremental=True),
+                             form_to_schema(UserTestForm))
+        finally:
+            schemulator.field_signature = signature
+        self.assertEqual(calls, [])
+
+        # Choices are copied along with their schema
+        schema = form_to_schema(UserTestForm, incremental=True)
+        schema['properties']['choice_field']['enum'].append(('x', 'X'))
+        self.assertNotIn(('x', 'X'), form_to_schema(UserTestForm, incremental=True)
+                         ['properties']['choice_field']['enum'])
+
     def test_boolean_field(self):
         field_schema = field_to_schema(boolean_field)
         self.assertTrue(dict_in_dict(field_schema, boolean_field_js))
@@ -419,6 +522,23 @@ class SchemaToFormTestCase(TestCase):
         tffi = [i[1].__class__.__name__ for i in sorted(test_form.fields.items())]
         self.assertEquals(rffi, tffi)
 
+    def test_minified_form_to_schema_to_form(self):
+        """
+        Translates a form to a minified schema and back to a form and checks
+        that nothing was lost on the way.
+        """
+        schema = form_to_schema(test_form)
+        minified_schema = form_to_schema(test_form, minify=True)
+        self.assertLess(len(str(minified_schema)), len(str(schema)))
+        for prop in minified_schema['properties'].values():
+            self.assertNotIn('null', prop)
+            self.assertNotEqual(prop.get('optional'), False)
+        self.assertNotIn('__django_form_field_cls', minified_schema['properties']['text_field'])
+        self.assertIn('__widget', minified_schema['properties']['text_area_field'])
+
+        recovered_form = schema_to_form(minified_schema)
+        self.assertEqual(form_to_schema(recovered_form), schema)
+
     def test_boolean_field(self):
         field = schema_to_field(boolean_field_js)
         self.assertTrue(dict_in_dict(field_to_schema(field), boolean_field_js))
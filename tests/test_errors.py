@@ -0,0 +1,130 @@
+from django.test import TestCase
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.forms.formsets import formset_factory
+from django.forms.util import ErrorDict
+from django import forms
+import wtforms
+
+from jsonschema import Draft4Validator
+
+from schemulator import form_to_schema
+from schemulator.errors import ErrorMapper, validation_schema
+
+
+schema = {
+    '$schema':'http://json-schema.org/draft-04/schema#',
+    'title':'JSON Schema',
+    'description':'This is a JSON Schema describing a form',
+    'required': ['name'],
+    'additionalProperties': False,
+    'properties':{
+        'name':{
+            'type': 'string',
+            'maxLength': 5,
+        },
+        'age':{
+            'type': 'integer',
+            'minimum': 0,
+            'maximum': 150,
+        },
+    }
+}
+
+
+class OrderForm(forms.Form):
+    name = forms.CharField(label="Name", max_length=5)
+    quantity = forms.IntegerField(label="Quantity", required=False, min_value=1)
+    size = forms.ChoiceField(label="Size", choices=[('s', 'Small'), ('m', 'Medium')])
+
+
+OrderFormSet = formset_factory(OrderForm, max_num=2, validate_max=True)
+
+
+class ItemWTForm(wtforms.Form):
+    name = wtforms.StringField(validators=[wtforms.validators.Length(max=5)])
+
+
+class BasketWTForm(wtforms.Form):
+    items = wtforms.FieldList(wtforms.FormField(ItemWTForm), max_entries=2)
+    tags = wtforms.FieldList(wtforms.StringField(validators=[wtforms.validators.Optional()]))
+
+
+class ErrorMapperTestCase(TestCase):
+
+    def setUp(self):
+        self.mapper = ErrorMapper(schema)
+
+    def test_field_errors(self):
+        errors = Draft4Validator(schema).iter_errors({'name': 'Too long', 'age': -1})
+        form_errors = self.mapper.map(errors)
+        self.assertIsInstance(form_errors, ErrorDict)
+        self.assertEqual(sorted(form_errors), ['age', 'name'])
+        self.assertEqual(len(form_errors['age']), 1)
+
+    def test_required_and_non_field_errors(self):
+        form_errors = self.mapper.validate({'age': 10, 'unknown': True})
+        self.assertEqual(sorted(form_errors), [NON_FIELD_ERRORS, 'name'])
+
+    def test_wtforms_errors(self):
+        mapper = ErrorMapper(schema, form_type='wtforms')
+        form_errors = mapper.validate({'name': 'Bob', 'age': 200})
+        self.assertEqual(type(form_errors), dict)
+        self.assertEqual(list(form_errors), ['age'])
+
+    def test_validate_many(self):
+        payloads = [{'name': 'Bob'}, {'name': 'Alice', 'age': 'ten'}, {}]
+        results = list(self.mapper.validate_many(payloads))
+        self.assertEqual([sorted(r) for r in results], [[], ['age'], ['name']])
+
+    def test_required_errors(self):
+        errors = Draft4Validator(schema).iter_errors({})
+        self.assertEqual(list(self.mapper.map(errors)), ['name'])
+
+        other = dict(schema, required=['age', 'name'])
+        errors = list(Draft4Validator(other).iter_errors({}))
+        form_errors = ErrorMapper(other).map(errors)
+        self.assertEqual(sorted(form_errors), ['age', 'name'])
+        self.assertEqual(form_errors['name'], [errors[1].message])
+
+
+class FormSchemaErrorsTestCase(TestCase):
+
+    def test_validation_schema(self):
+        validated = validation_schema(form_to_schema(OrderForm))
+        self.assertEqual(validated['required'], ['name', 'size'])
+        self.assertEqual(validated['properties']['size']['enum'], ['s', 'm'])
+        self.assertEqual(validation_schema({'properties': {'flag': {'type': 'boolean', 'null': True,
+                                                                    'enum': [True]}}})
+                         ['properties']['flag'], {'type': ['boolean', 'null'], 'null': True,
+                                                  'enum': [True, None]})
+
+    def test_form_schema(self):
+        mapper = ErrorMapper(form_to_schema(OrderForm))
+        self.assertEqual(mapper.validate({'name': 'Bob', 'size': 's'}), {})
+        self.assertEqual(sorted(mapper.validate({'quantity': 2})), ['name', 'size'])
+
+        form_errors = mapper.validate({'name': 'Robert', 'size': 'xl', 'quantity': 0})
+        self.assertEqual(sorted(form_errors), ['name', 'quantity', 'size'])
+
+    def test_formset_schema(self):
+        mapper = ErrorMapper(form_to_schema(OrderFormSet))
+        self.assertEqual(mapper.validate([{'name': 'Bob', 'size': 's'}]), {})
+
+        form_errors = mapper.validate([{'name': 'Bob', 'size': 's'}, {'name': 'Robert'}])
+        self.assertEqual(sorted(form_errors), ['form-1-name', 'form-1-size'])
+
+        form_errors = mapper.validate([{'name': 'Bob', 'size': 's'}] * 3)
+        self.assertEqual(list(form_errors), [NON_FIELD_ERRORS])
+
+        mapper = ErrorMapper(form_to_schema(OrderFormSet), 'wtforms')
+        self.assertEqual(list(mapper.validate([{'size': 's'}])), ['items-0-name'])
+
+    def test_field_list_schema(self):
+        mapper = ErrorMapper(form_to_schema(BasketWTForm), 'wtforms')
+        self.assertEqual(mapper.validate({'items': [{'name': 'Bob'}], 'tags': []}), {})
+
+        form_errors = mapper.validate({'items': [{'name': 'Robert'}, {}], 'tags': ['a', 1]})
+        self.assertEqual(sorted(form_errors), ['items-0-name', 'items-1-name', 'tags-1'])
+
+        form_errors = mapper.validate({'items': [{'name': 'Bob'}] * 3, 'tags': []})
+        self.assertEqual(list(form_errors), ['items'])
@@ -0,0 +1,154 @@
+from django.forms.formsets import formset_factory
+from django.test import TestCase
+from django import forms
+import wtforms
+
+import schemulator
+from schemulator import (form_to_schema, minify_field_schema, schema_to_form,
+                         schema_to_form_class, schema_to_formset)
+from schemulator.cache import cached_form_to_schema
+from schemulator.utils import form_fingerprint
+
+
+class ItemForm(forms.Form):
+    name = forms.CharField(label="Name", max_length=50)
+    quantity = forms.IntegerField(label="Quantity", min_value=1)
+
+
+ItemFormSet = formset_factory(ItemForm, extra=2, can_delete=True, max_num=10,
+                              validate_max=True)
+
+
+class ItemWTForm(wtforms.Form):
+    name = wtforms.StringField(label="Name",
+                               validators=[wtforms.validators.Length(max=50)])
+
+
+class OrderWTForm(wtforms.Form):
+    items = wtforms.FieldList(wtforms.FormField(ItemWTForm), label="Items",
+                              min_entries=1, max_entries=5)
+    tags = wtforms.FieldList(wtforms.StringField("Tag"), label="Tags")
+
+
+def order_form_with(item_form_cls):
+    class OrderWTForm(wtforms.Form):
+        items = wtforms.FieldList(wtforms.FormField(item_form_cls), label="Items",
+                                  min_entries=1, max_entries=5)
+    return OrderWTForm
+
+
+class FormsetTestCase(TestCase):
+
+    def test_formset_to_schema(self):
+        schema = form_to_schema(ItemFormSet())
+        self.assertEqual(schema['type'], 'array')
+        self.assertEqual(schema['maxItems'], 10)
+        self.assertNotIn('minItems', schema)
+        self.assertEqual(schema['__formset']['extra'], 2)
+        self.assertTrue(schema['__formset']['can_delete'])
+        self.assertEqual(schema['items'], form_to_schema(ItemForm()))
+        # Formset classes give the same schema as their instances
+        self.assertEqual(form_to_schema(ItemFormSet), schema)
+
+    def test_schema_to_formset(self):
+        schema = form_to_schema(ItemFormSet())
+        formset_cls = schema_to_formset(schema)
+        self.assertIs(schema_to_form_class(schema), formset_cls)
+        self.assertEqual(formset_cls.extra, 2)
+        self.assertEqual(formset_cls.max_num, 10)
+        self.assertTrue(formset_cls.can_delete)
+
+        formset = schema_to_form(schema)
+        self.assertEqual(len(formset.forms), 2)
+        self.assertEqual(form_to_schema(formset), schema)
+
+        formset = formset_cls({
+            'form-TOTAL_FORMS': '1',
+            'form-INITIAL_FORMS': '0',
+            'form-MAX_NUM_FORMS': '10',
+            'form-0-name': 'Apple',
+            'form-0-quantity': '0',
+        })
+        self.assertFalse(formset.is_valid())
+        self.assertIn('quantity', formset.errors[0])
+
+    def test_array_schema_without_options(self):
+        schema = {'type': 'array', 'maxItems': 3, 'items': form_to_schema(ItemForm())}
+        formset_cls = schema_to_formset(schema)
+        self.assertEqual(formset_cls.max_num, 3)
+        self.assertTrue(formset_cls.validate_max)
+
+    def test_field_list_to_schema(self):
+        schema = form_to_schema(OrderWTForm())
+        items = schema['properties']['items']
+        self.assertEqual(items['type'], 'array')
+        self.assertEqual(items['title'], 'Items')
+        self.assertEqual((items['minItems'], items['maxItems']), (1, 5))
+        self.assertEqual(items['items'], form_to_schema(ItemWTForm()))
+        self.assertEqual(schema['properties']['tags']['items']['type'], 'string')
+        self.assertNotIn('__wtforms_field_cls',
+                         minify_field_schema(items))
+        self.assertEqual(form_to_schema(OrderWTForm), schema)
+
+    def test_schema_to_field_list(self):
+        schema = form_to_schema(OrderWTForm())
+        form = schema_to_form(schema, 'wtforms')
+        self.assertEqual(form.items.type, 'FieldList')
+        self.assertEqual(len(form.items.entries), 1)
+        self.assertEqual(form.items.max_entries, 5)
+        self.assertEqual(form.items.entries[0].form.name.type, 'StringField')
+        self.assertEqual(form_to_schema(form), schema)
+
+        # Item form classes are shared by field lists with the same items
+        other = schema_to_form(schema, 'wtforms')
+        self.assertIs(other.items.unbound_field.args[0], form.items.unbound_field.args[0])
+
+    def test_wtforms_formset(self):
+        schema = {'type': 'array', 'maxItems': 10, 'items': form_to_schema(ItemWTForm())}
+        form = schema_to_form(schema, 'wtforms')
+        self.assertEqual(form.items.type, 'FieldList')
+        self.assertEqual(form.items.max_entries, 10)
+
+    def test_bounded_classes(self):
+        schema = {'type': 'array', 'items': form_to_schema(ItemForm())}
+        formset_cls = schema_to_formset(schema)
+        max_classes = schemulator.MAX_CACHED_CLASSES
+        schemulator.MAX_CACHED_CLASSES = 4
+        try:
+            for i in range(10):
+                schema_to_formset(dict(schema, maxItems=i + 1))
+            self.assertEqual(len(schemulator._CACHED_CLASSES), 4)
+            # Dropped classes are built again
+            self.assertIsNot(schema_to_formset(schema), formset_cls)
+            self.assertIs(schema_to_formset(schema), schema_to_formset(schema))
+        finally:
+            schemulator.MAX_CACHED_CLASSES = max_classes
+
+    def test_formset_fingerprint(self):
+        fingerprint = form_fingerprint(ItemFormSet)
+        self.assertEqual(form_fingerprint(ItemFormSet()), fingerprint)
+        other = formset_factory(ItemForm, extra=2, can_delete=True, max_num=20,
+                                validate_max=True)
+        other.__name__ = ItemFormSet.__name__
+        self.assertNotEqual(form_fingerprint(other), fingerprint)
+
+    def test_cached_formset_schema(self):
+        self.assertEqual(cached_form_to_schema(ItemFormSet()), form_to_schema(ItemFormSet))
+
+    def test_field_list_fingerprint(self):
+        class OtherItemWTForm(wtforms.Form):
+            name = wtforms.StringField(label="Name",
+                                       validators=[wtforms.validators.Length(max=80)])
+        OtherItemWTForm.__name__ = ItemWTForm.__name__
+
+        first = order_form_with(ItemWTForm)
+        second = order_form_with(OtherItemWTForm)
+        self.assertNotEqual(form_fingerprint(first), form_fingerprint(second))
+        self.assertNotEqual(form_fingerprint(first()), form_fingerprint(second()))
+        self.assertEqual(form_fingerprint(first), form_fingerprint(order_form_with(ItemWTForm)))
+
+        tags = wtforms.FieldList(wtforms.StringField("Tag"), label="Tags")
+        other_tags = wtforms.FieldList(wtforms.StringField("Label"), label="Tags")
+        first = type('TagsWTForm', (wtforms.Form,), {'tags': tags})
+        second = type('TagsWTForm', (wtforms.Form,), {'tags': other_tags})
+        self.assertNotEqual(form_fingerprint(first), form_fingerprint(second))
@@ -0,0 +1,108 @@
+from copy import copy, deepcopy
+import pickle
+
+from django.contrib.auth.models import User
+from django.forms.formsets import formset_factory
+from django.test import TestCase
+from django import forms
+
+from schemulator import form_to_schema, model_to_schema, schema_to_form
+import schemulator.cache
+from schemulator.cache import cached_form_to_schema, get_cache_backend, schema_key
+from schemulator.frozen import FrozenDict, freeze, thaw
+from schemulator.utils import encode_schema, form_fingerprint
+
+
+class FrozenTestForm(forms.Form):
+    text_field = forms.CharField(label="Text Field", max_length=100)
+    choice_field = forms.ChoiceField(label="Choice Field",
+                                     choices=[('a', 'A'), ('b', 'B')])
+
+
+class FrozenTestCase(TestCase):
+
+    def test_frozen_schema(self):
+        schema = form_to_schema(FrozenTestForm(), frozen=True)
+        self.assertIsInstance(schema, FrozenDict)
+        self.assertIsInstance(schema['properties']['text_field'], FrozenDict)
+        self.assertIsInstance(schema['properties']['choice_field']['enum'], tuple)
+        self.assertEqual(thaw(schema)['properties']['text_field'],
+                         form_to_schema(FrozenTestForm())['properties']['text_field'])
+        self.assertEqual(encode_schema(schema), encode_schema(form_to_schema(FrozenTestForm())))
+
+    def test_read_only(self):
+        schema = form_to_schema(FrozenTestForm(), frozen=True)
+        properties = schema['properties']
+        self.assertRaises(TypeError, properties.__setitem__, 'other', {})
+        self.assertRaises(TypeError, properties.__delitem__, 'text_field')
+        self.assertRaises(TypeError, properties.update, {})
+        self.assertRaises(TypeError, properties.pop, 'text_field')
+        self.assertRaises(TypeError, properties.setdefault, 'other', {})
+        self.assertRaises(TypeError, properties.clear)
+
+        # In-place union, and initializing again
+        def union(mapping):
+            mapping |= {'other': {}}
+
+        self.assertRaises(TypeError, union, properties)
+        properties.__init__({'other': {}})
+        properties.__init__(other={})
+        self.assertEqual(sorted(properties), ['choice_field', 'text_field'])
+        self.assertEqual(FrozenDict([('a', 1)], b=2), {'a': 1, 'b': 2})
+
+    def test_shared(self):
+        schema = form_to_schema(FrozenTestForm(), frozen=True)
+        self.assertIs(copy(schema), schema)
+        self.assertIs(deepcopy(schema), schema)
+        self.assertEqual(hash(schema), hash(form_to_schema(FrozenTestForm(), frozen=True)))
+        self.assertEqual(len(set([schema, freeze(thaw(schema))])), 1)
+        self.assertEqual(pickle.loads(pickle.dumps(schema, 2)), schema)
+
+    def test_thaw(self):
+        schema = thaw(form_to_schema(FrozenTestForm(), frozen=True))
+        self.assertIs(type(schema['properties']), dict)
+        schema['properties']['text_field']['title'] = 'Changed'
+        self.assertIsInstance(schema['properties']['choice_field']['enum'], list)
+
+    def test_schema_to_form(self):
+        schema = form_to_schema(FrozenTestForm(), frozen=True)
+        form = schema_to_form(schema)
+        self.assertEqual(form.fields['text_field'].max_length, 100)
+        self.assertEqual(list(form.fields['choice_field'].choices), [('a', 'A'), ('b', 'B')])
+
+    def test_frozen_model_schema(self):
+        schema = model_to_schema(User, fields=['username'], frozen=True)
+        self.assertIs(model_to_schema(User, fields=['username'], frozen=True), schema)
+        self.assertEqual(thaw(schema), model_to_schema(User, fields=['username']))
+
+    def test_incremental_shares_field_schemas(self):
+        first = form_to_schema(FrozenTestForm(), incremental=True, frozen=True)
+        second = form_to_schema(FrozenTestForm(), incremental=True, frozen=True)
+        self.assertIs(second['properties']['text_field'], first['properties']['text_field'])
+        self.assertIsInstance(first['properties']['choice_field']['enum'], tuple)
+
+        # Schemas which are not frozen are still copies
+        schema = form_to_schema(FrozenTestForm(), incremental=True)
+        self.assertIs(type(schema['properties']['text_field']), dict)
+        self.assertIsNot(schema['properties']['text_field'],
+                         form_to_schema(FrozenTestForm(), incremental=True)['properties']['text_field'])
+
+    def test_formset_shares_items_schema(self):
+        formset_cls = formset_factory(FrozenTestForm)
+        schema = form_to_schema(formset_cls, frozen=True)
+        self.assertIs(form_to_schema(formset_cls(), frozen=True)['items'], schema['items'])
+        self.assertIs(type(form_to_schema(formset_cls)['items']), dict)
+
+    def test_cached_frozen_schema(self):
+        get_cache_backend().clear()
+        schema = cached_form_to_schema(FrozenTestForm(), frozen=True)
+        self.assertIsInstance(schema, FrozenDict)
+        self.assertIs(cached_form_to_schema(FrozenTestForm(), frozen=True), schema)
+        self.assertEqual(thaw(schema), cached_form_to_schema(FrozenTestForm()))
+
+        # Decoded schemas are kept by cache key, not by encoding
+        encoded = encode_schema(form_to_schema(FrozenTestForm()))
+        self.assertFalse(encoded in schemulator.cache._DECODED_SCHEMAS)
+        self.assertIs(schemulator.cache._DECODED_SCHEMAS[schema_key(
+            get_cache_backend(), form_fingerprint(FrozenTestForm()))], schema)
+        get_cache_backend().clear()
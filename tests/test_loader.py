@@ -0,0 +1,136 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from django.test import TestCase
+from django import forms
+
+from schemulator.loader import SchemaDirectory
+
+
+def schema(max_length):
+    return {
+        '$schema':'http://json-schema.org/draft-04/schema#',
+        'title':'JSON Schema',
+        'description':'This is a JSON Schema describing a form',
+        'properties':{
+            'name':{
+                'type': 'string',
+                'maxLength': max_length,
+            },
+        }
+    }
+
+
+class SchemaDirectoryTestCase(TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.write('first', schema(10))
+        self.write('second', schema(20))
+        with open(os.path.join(self.path, 'README'), 'w') as readme:
+            readme.write('Not a schema')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def write(self, name, content, mtime=None):
+        path = os.path.join(self.path, name + '.json')
+        with open(path, 'w') as schema_file:
+            json.dump(content, schema_file)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_load(self):
+        directory = SchemaDirectory(self.path)
+        self.assertEqual(sorted(directory), ['first', 'second'])
+        self.assertTrue(issubclass(directory['first'], forms.Form))
+        self.assertEqual(directory['second'].base_fields['name'].max_length, 20)
+        self.assertRaises(KeyError, lambda: directory['README'])
+
+    def test_incremental_reload(self):
+        directory = SchemaDirectory(self.path)
+        second = directory['second']
+
+        self.write('first', schema(30), mtime=1)
+        os.remove(os.path.join(self.path, 'second.json'))
+        self.write('third', schema(40))
+
+        self.assertEqual(directory.reload(), (['first', 'third'], ['second']))
+        self.assertEqual(directory['first'].base_fields['name'].max_length, 30)
+        self.assertNotIn('second', directory)
+        self.assertEqual(second.base_fields['name'].max_length, 20)
+
+    def test_touched_file_is_not_rebuilt(self):
+        directory = SchemaDirectory(self.path)
+        first = directory['first']
+        self.write('first', schema(10), mtime=1)
+
+        self.assertEqual(directory.reload(), ([], []))
+        self.assertIs(directory['first'], first)
+
+    def test_failed_reload_keeps_classes(self):
+        directory = SchemaDirectory(self.path)
+        with open(os.path.join(self.path, 'first.json'), 'w') as schema_file:
+            schema_file.write('{not json')
+        self.assertRaises(ValueError, directory.reload)
+        self.assertEqual(sorted(directory), ['first', 'second'])
+
+    def test_failed_reload_on_lookup(self):
+        directory = SchemaDirectory(self.path, interval=0)
+        first = directory['first']
+        with open(os.path.join(self.path, 'first.json'), 'w') as schema_file:
+            schema_file.write('{not json')
+
+        self.assertIs(directory['first'], first)
+        self.assertIsInstance(directory.last_error, ValueError)
+
+        # Failed attempts wait for the interval as successful ones do
+        directory.interval = 3600
+        self.write('first', schema(30))
+        self.assertIs(directory.get('first'), first)
+        self.assertIsInstance(directory.last_error, ValueError)
+
+        self.assertEqual(directory.reload(), (['first'], []))
+        self.assertIsNone(directory.last_error)
+        self.assertEqual(directory['first'].base_fields['name'].max_length, 30)
+
+    def test_concurrent_lookups_reload_once(self):
+        directory = SchemaDirectory(self.path, interval=3600)
+        reload = directory._reload
+        calls = []
+
+        def counting_reload():
+            calls.append(True)
+            return reload()
+
+        class GatheringLock(object):
+            # Lets threads in once all of them are waiting for the lock, so
+            # that each of them found the directory due for a reload
+            def __init__(self, count):
+                self.lock = threading.Lock()
+                self.waiting = []
+                self.gathered = threading.Event()
+                self.count = count
+
+            def __enter__(self):
+                self.waiting.append(True)
+                if len(self.waiting) >= self.count:
+                    self.gathered.set()
+                self.gathered.wait(5)
+                self.lock.acquire()
+
+            def __exit__(self, *exc_info):
+                self.lock.release()
+
+        directory._reload = counting_reload
+        directory._lock = GatheringLock(4)
+        directory._last_reload = 0
+        threads = [threading.Thread(target=directory.get, args=('first',)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,94 @@
+import json
+import socket
+import threading
+try:
+    from StringIO import StringIO
+except ImportError:
+    # Python 3
+    from io import StringIO
+
+from django.test import TestCase
+
+from tests.loadtest import (DEFAULT_MIX, PAYLOADS, parse_mix, percentile, report, run,
+                            spawn_server, stop_server)
+
+
+def truncating_server():
+    """
+    Returns a listening socket which answers each connection with a response
+    shorter than its Content-Length, then closes it.
+    """
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(8)
+
+    def serve():
+        while True:
+            try:
+                (connection, _) = listener.accept()
+            except socket.error:
+                return
+            connection.recv(4096)
+            connection.sendall(b'HTTP/1.0 200 OK\r\nContent-Length: 100\r\n\r\n{}')
+            connection.close()
+
+    thread = threading.Thread(target=serve)
+    thread.daemon = True
+    thread.start()
+    return listener
+
+
+class LoadTestEndpointsTestCase(TestCase):
+
+    def test_schema(self):
+        for endpoint in ('schema', 'cached'):
+            response = self.client.get('/%s/survey' % endpoint)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(json.loads(response.content.decode('utf-8'))['properties']), 200)
+        self.assertEqual(self.client.get('/schema/missing').status_code, 404)
+
+    def test_validate(self):
+        for (name, payload) in PAYLOADS.items():
+            response = self.client.post('/validate/%s' % name, json.dumps(payload),
+                                        content_type='application/json')
+            self.assertEqual(json.loads(response.content.decode('utf-8')),
+                             {'valid': True, 'errors': {}})
+
+        response = self.client.post('/validate/signup', json.dumps({'username': 'j'}),
+                                    content_type='application/json')
+        errors = json.loads(response.content.decode('utf-8'))['errors']
+        self.assertEqual(sorted(errors), ['country', 'email', 'username'])
+
+    def test_helpers(self):
+        self.assertEqual(parse_mix('schema=3,cached'), [('schema', 3.0), ('cached', 1.0)])
+        self.assertRaises(ValueError, parse_mix, 'other=1')
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+
+    def test_run(self):
+        (process, base_url) = spawn_server()
+        try:
+            (results, elapsed) = run(base_url, 2, 0.3, parse_mix(DEFAULT_MIX), sorted(PAYLOADS))
+        finally:
+            stop_server(process)
+
+        self.assertTrue(results)
+        self.assertTrue(all(succeeded for (_, _, succeeded) in results))
+
+        out = StringIO()
+        report(results, elapsed, out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0].split()[0], 'endpoint')
+        self.assertEqual(lines[-1].split()[:3], ['all', str(len(results)), '0'])
+
+    def test_failed_requests(self):
+        listener = truncating_server()
+        try:
+            (results, _) = run('http://127.0.0.1:%d' % listener.getsockname()[1], 1, 0.1,
+                               parse_mix('schema'), ['signup'], timeout=1)
+        finally:
+            listener.close()
+
+        self.assertTrue(results)
+        self.assertFalse(any(succeeded for (_, _, succeeded) in results))
@@ -0,0 +1,108 @@
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django import forms
+import wtforms
+
+from schemulator import form_to_schema, schema_to_form, schema_to_wtfield
+from schemulator import metrics
+from schemulator.views import metrics as metrics_view
+
+
+class MetricsTestForm(forms.Form):
+    text_field = forms.CharField(label="Text Field", max_length=100)
+    integer_field = forms.IntegerField(label="Integer Field", required=False)
+
+
+class MetricsTestWTForm(wtforms.Form):
+    text_field = wtforms.StringField(label="Text Field")
+
+
+class MetricsTestCase(TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        metrics.configure('fields')
+
+    def tearDown(self):
+        metrics.configure()
+        metrics.reset()
+
+    def test_conversions(self):
+        form_to_schema(MetricsTestForm())
+        form_to_schema(MetricsTestWTForm())
+        schema_to_form({'properties': {'text_field': {'type': 'string'},
+                                       'integer_field': {'type': 'integer'}}}, 'wtforms')
+
+        conversions = metrics.CONVERSIONS
+        self.assertEqual(conversions.value(('form_to_schema', 'django', '')), 1)
+        self.assertEqual(conversions.value(('form_to_schema', 'wtforms', '')), 1)
+        self.assertEqual(conversions.value(('field_to_spec', 'django', 'CharField')), 1)
+        self.assertEqual(conversions.value(('field_to_spec', 'django', 'IntegerField')), 1)
+        self.assertEqual(conversions.value(('field_to_spec', 'wtforms', 'StringField')), 1)
+        self.assertEqual(conversions.value(('schema_to_form', 'wtforms', '')), 1)
+        self.assertEqual(conversions.value(('schema_to_wtfield', 'wtforms', 'StringField')), 1)
+        self.assertEqual(conversions.value(('schema_to_wtfield', 'wtforms', 'IntegerField')), 1)
+        self.assertEqual(metrics.CONVERSION_DURATION.count(('form_to_schema', 'django', '')), 1)
+
+    def test_levels(self):
+        metrics.configure()
+        form_to_schema(MetricsTestForm())
+        self.assertEqual(metrics.CONVERSIONS.value(('form_to_schema', 'django', '')), 0)
+
+        metrics.configure('forms')
+        form_to_schema(MetricsTestForm())
+        self.assertEqual(metrics.CONVERSIONS.value(('form_to_schema', 'django', '')), 1)
+        self.assertEqual(metrics.CONVERSIONS.value(('field_to_spec', 'django', 'CharField')), 0)
+
+        with self.settings(SCHEMULATOR_METRICS=True):
+            self.assertEqual(metrics.configure(), metrics.LEVELS['forms'])
+        self.assertRaises(ValueError, metrics.configure, 'all')
+
+    def test_samples_while_updated(self):
+        counter = metrics.Counter('test_total', 'Test counter.', ('name',))
+        histogram = metrics.Histogram('test_seconds', 'Test histogram.', ('name',))
+        try:
+            counter.inc(('a',))
+            samples = counter.samples()
+            next(samples)
+            counter.inc(('b',))
+            self.assertEqual(list(samples), [])
+
+            histogram.observe(1, ('a',))
+            samples = histogram.samples()
+            next(samples)
+            histogram.observe(1, ('b',))
+            self.assertEqual(len(list(samples)), len(histogram.buckets) + 1)
+        finally:
+            del metrics.REGISTRY['test_total'], metrics.REGISTRY['test_seconds']
+
+    def test_errors(self):
+        self.assertRaises(Exception, schema_to_wtfield, {'type': 'string', '__wtforms_field_cls': 'Missing'})
+        self.assertEqual(metrics.CONVERSION_ERRORS.value(('schema_to_wtfield',)), 1)
+
+    def test_histogram(self):
+        histogram = metrics.Histogram('test_seconds', 'Test histogram.', ('name',), buckets=(0.1, 1))
+        try:
+            histogram.observe(0.05, ('a',))
+            histogram.observe(0.5, ('a',))
+            histogram.observe(5, ('a',))
+            self.assertEqual(histogram.render().split('\n'), [
+                '# HELP test_seconds Test histogram.',
+                '# TYPE test_seconds histogram',
+                'test_seconds_bucket{name="a",le="0.1"} 1',
+                'test_seconds_bucket{name="a",le="1"} 2',
+                'test_seconds_bucket{name="a",le="+Inf"} 3',
+                'test_seconds_sum{name="a"} 5.55',
+                'test_seconds_count{name="a"} 3',
+            ])
+        finally:
+            del metrics.REGISTRY['test_seconds']
+
+    def test_view(self):
+        form_to_schema(MetricsTestForm())
+        response = metrics_view(RequestFactory().get('/metrics'))
+        self.assertEqual(response['Content-Type'], metrics.CONTENT_TYPE)
+        content = response.content.decode('utf-8')
+        self.assertIn('# TYPE schemulator_conversions_total counter', content)
+        self.assertIn('schemulator_conversions_total{operation="form_to_schema",'
+                      'framework="django",field_type=""} 1', content)
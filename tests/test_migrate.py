@@ -0,0 +1,124 @@
+import json
+import os
+import shutil
+import tempfile
+try:
+    from StringIO import StringIO
+except ImportError:
+    # Python 3
+    from io import StringIO
+
+from django.test import TestCase
+
+from schemulator.__main__ import main, migrate, migrate_schema
+from schemulator.upgrades import UPGRADES, register, upgrade
+
+
+def old_schema(i):
+    return {
+        'title': 'Schema %d' % i,
+        'properties': {
+            'name': {'type': 'string', 'maxLength': 10 + i, 'required': True},
+            'comment': {'type': 'string', '__widget': 'django.forms.widgets.Textarea'},
+        },
+    }
+
+
+class UpgradeTestCase(TestCase):
+
+    def test_required_to_optional(self):
+        schema = upgrade(old_schema(0))
+        self.assertEqual(schema['properties']['name']['optional'], False)
+        self.assertNotIn('required', schema['properties']['name'])
+        self.assertNotIn('optional', schema['properties']['comment'])
+
+        schema = upgrade({'required': ['name'],
+                          'properties': {'name': {'type': 'string'}, 'age': {'type': 'integer'}}})
+        self.assertNotIn('required', schema)
+        self.assertEqual(schema['properties']['name']['optional'], False)
+        self.assertEqual(schema['properties']['age']['optional'], True)
+
+    def test_widget_names(self):
+        schema = upgrade(old_schema(0), ['widget-names'])
+        self.assertEqual(schema['properties']['comment']['__widget'], 'Textarea')
+        self.assertEqual(schema['properties']['name']['required'], True)
+
+    def test_registration_order(self):
+        applied = []
+        for name in ('test-first', 'test-second'):
+            register(name)(lambda schema, name=name: applied.append(name) or schema)
+        try:
+            upgrade({}, ['test-second', 'test-first'])
+        finally:
+            del UPGRADES['test-first'], UPGRADES['test-second']
+        self.assertEqual(applied, ['test-first', 'test-second'])
+
+    def test_idempotent(self):
+        schema = upgrade(old_schema(0))
+        self.assertEqual(upgrade(schema), schema)
+        self.assertEqual(old_schema(0)['properties']['name']['required'], True)
+
+
+class MigrateTestCase(TestCase):
+
+    def test_round_trip(self):
+        self.assertEqual(migrate_schema(old_schema(0)), upgrade(old_schema(0)))
+
+        # WTForms infers titles from names
+        schema = {'properties': {'name': {'type': 'string', 'maxLength': 10}}}
+        self.assertEqual(migrate_schema(schema, form_type='wtforms'), schema)
+
+        # Choice fields clean to strings
+        lossy = {'properties': {'size': {'type': 'integer', 'enum': [[1, 'S'], [2, 'M']]}}}
+        try:
+            migrate_schema(lossy)
+        except ValueError as error:
+            self.assertEqual(str(error), "Property 'size' does not survive a round trip "
+                                         "through a form: type changed")
+        else:
+            self.fail("ValueError not raised")
+        self.assertEqual(migrate_schema(lossy, validate=False), lossy)
+
+    def lines(self, count):
+        lines = [json.dumps(old_schema(i)) + '\n' for i in range(count)]
+        lines[5] = '{"properties": {"broken": {"type": "unknown"}}}\n'
+        lines.insert(7, '\n')
+        return lines
+
+    def check(self, output, count):
+        schemas = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(schemas), count - 1)
+        self.assertEqual([s['title'] for s in schemas],
+                         ['Schema %d' % i for i in range(count) if i != 5])
+        self.assertEqual(schemas[0]['properties']['name']['optional'], False)
+
+    def test_migrate(self):
+        (output, errors) = (StringIO(), StringIO())
+        counts = migrate(self.lines(20), output, processes=1, chunk_size=3, errors_file=errors)
+        self.assertEqual(counts, (19, 1))
+        self.assertTrue(errors.getvalue().startswith('line 6: '))
+        self.check(output, 20)
+
+    def test_migrate_processes(self):
+        (output, errors) = (StringIO(), StringIO())
+        counts = migrate(iter(self.lines(50)), output, processes=2, chunk_size=4,
+                         window=2, errors_file=errors)
+        self.assertEqual(counts, (49, 1))
+        self.check(output, 50)
+
+    def test_command(self):
+        path = tempfile.mkdtemp()
+        try:
+            (input_path, output_path) = (os.path.join(path, 'in.jsonl'), os.path.join(path, 'out.jsonl'))
+            with open(input_path, 'w') as input_file:
+                input_file.writelines(self.lines(10)[:5])
+
+            self.assertEqual(main(['migrate', input_path, output_path,
+                                   '--transforms', 'widget-names', '--processes', '1']), 0)
+            with open(output_path) as output_file:
+                schemas = [json.loads(line) for line in output_file]
+            self.assertEqual(len(schemas), 5)
+            self.assertEqual(schemas[0]['properties']['comment']['__widget'], 'Textarea')
+            self.assertEqual(schemas[0]['properties']['name']['required'], True)
+        finally:
+            shutil.rmtree(path)
@@ -0,0 +1,32 @@
+from django.test import TestCase
+from django import forms
+from django.contrib.auth.models import User
+
+from schemulator import form_to_schema, model_to_schema
+import schemulator
+
+
+class UserForm(forms.ModelForm):
+    class Meta:
+        model = User
+        fields = ['username', 'email', 'is_staff']
+
+
+class ModelToSchemaTestCase(TestCase):
+
+    def test_same_as_model_form(self):
+        schema = model_to_schema(User, fields=['username', 'email', 'is_staff'])
+        self.assertEqual(schema, form_to_schema(UserForm()))
+
+    def test_exclude(self):
+        schema = model_to_schema(User, fields=['username', 'email'], exclude=['email'])
+        self.assertEqual(list(schema['properties']), ['username'])
+
+    def test_cached_per_model(self):
+        model_to_schema(User, fields=['username'])
+        self.assertIn(User, schemulator._MODEL_SCHEMAS)
+
+        # Callers get their own copy of the cached schema
+        schema = model_to_schema(User, fields=['username'])
+        schema['properties'].clear()
+        self.assertIn('username', model_to_schema(User, fields=['username'])['properties'])
@@ -0,0 +1,86 @@
+from django.forms.formsets import formset_factory
+from django.test import TestCase
+from django import forms
+import wtforms
+
+from schemulator.openapi import forms_to_components, forms_to_components_json
+
+
+email_field = forms.EmailField(label="Email Field",
+                               help_text="This is an email field",
+                               max_length=100)
+
+
+class SignUpForm(forms.Form):
+    email = email_field
+    name = forms.CharField(label="Name", max_length=50, required=False)
+
+
+class NewsletterForm(forms.Form):
+    email = email_field
+    frequency = forms.ChoiceField(label="Frequency",
+                                  choices=[("d", "Daily"), ("w", "Weekly")])
+
+
+SignUpFormSet = formset_factory(SignUpForm, max_num=5, validate_max=True)
+
+
+class TagsWTForm(wtforms.Form):
+    tags = wtforms.FieldList(wtforms.StringField("Tag"), label="Tags", min_entries=1)
+
+
+class OpenAPITestCase(TestCase):
+
+    def setUp(self):
+        self.schemas = forms_to_components([SignUpForm(), NewsletterForm()])['components']['schemas']
+
+    def test_form_schemas(self):
+        sign_up = self.schemas['SignUpForm']
+        self.assertEqual(sign_up['type'], 'object')
+        self.assertEqual(sign_up['required'], ['email'])
+        self.assertNotIn('$schema', sign_up)
+        self.assertEqual(sign_up['properties']['name']['maxLength'], 50)
+        self.assertNotIn('optional', sign_up['properties']['name'])
+        self.assertNotIn('__widget', sign_up['properties']['name'])
+
+    def test_shared_field_schema(self):
+        ref = self.schemas['SignUpForm']['properties']['email']
+        self.assertEqual(ref, self.schemas['NewsletterForm']['properties']['email'])
+
+        shared = self.schemas[ref['$ref'].split('/')[-1]]
+        self.assertEqual(shared['format'], 'email')
+        self.assertEqual(shared['maxLength'], 100)
+
+    def test_enum_values(self):
+        frequency = self.schemas['NewsletterForm']['properties']['frequency']
+        self.assertEqual(frequency['enum'], ['d', 'w'])
+
+    def test_named_forms(self):
+        schemas = forms_to_components({'SignUp': SignUpForm})['components']['schemas']
+        self.assertEqual(list(schemas.keys()), ['SignUp'])
+
+    def test_json(self):
+        encoded = forms_to_components_json([SignUpForm(), NewsletterForm()])
+        self.assertEqual(encoded, forms_to_components_json([NewsletterForm(), SignUpForm()]))
+
+    def test_formset(self):
+        schemas = forms_to_components([SignUpFormSet, NewsletterForm])['components']['schemas']
+        formset = schemas['SignUpFormFormSet']
+        self.assertEqual(formset['type'], 'array')
+        self.assertEqual(formset['maxItems'], 5)
+        self.assertNotIn('title', formset)
+        self.assertEqual(formset['items']['type'], 'object')
+        self.assertEqual(formset['items']['required'], ['email'])
+
+        # Fields of formset forms are shared too
+        ref = formset['items']['properties']['email']
+        self.assertEqual(ref, schemas['NewsletterForm']['properties']['email'])
+
+        hinted = forms_to_components([SignUpFormSet], hints=True)['components']['schemas']
+        self.assertEqual(hinted['SignUpFormFormSet']['x-formset']['max_num'], 5)
+
+    def test_field_list_items(self):
+        tags = forms_to_components([TagsWTForm])['components']['schemas']['TagsWTForm']['properties']['tags']
+        self.assertEqual(tags['type'], 'array')
+        self.assertEqual(tags['minItems'], 1)
+        self.assertEqual((tags['items']['type'], tags['items']['title']), ('string', 'Tag'))
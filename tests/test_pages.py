@@ -0,0 +1,107 @@
+from collections import OrderedDict
+import json
+
+from django.http import Http404
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django import forms
+
+from schemulator import form_to_schema
+from schemulator.pages import join_pages, paginate_form, paginate_schema
+from schemulator.views import schema_pages
+
+
+def survey_schema(count, skip=None):
+    properties = OrderedDict()
+    for i in range(count):
+        if i != skip:
+            properties['question_%d' % i] = {'type': 'string', 'title': 'Question %d' % i}
+    return {'title': 'Survey', 'properties': properties}
+
+
+class SchemaPagesTestCase(TestCase):
+
+    def test_round_trip(self):
+        schema = survey_schema(500)
+        pages = paginate_schema(schema)
+        self.assertTrue(1 < len(pages) < 500)
+        self.assertEqual(pages.header['title'], 'Survey')
+        self.assertEqual(pages.header['pages'], list(pages.pages))
+
+        joined = join_pages(json.loads(pages.encoded_header),
+                            [pages.page(fp) for fp in pages.header['pages']])
+        self.assertEqual(list(joined['properties']), list(schema['properties']))
+        self.assertEqual(joined, schema)
+
+    def test_page_sizes(self):
+        pages = paginate_schema(survey_schema(500), average_size=8, min_size=4, max_size=16)
+        for encoded in pages.pages.values():
+            self.assertTrue(len(json.loads(encoded)['order']) <= 16)
+
+    def test_stable_pages(self):
+        pages = paginate_schema(survey_schema(500))
+        changed = paginate_schema(survey_schema(500, skip=250))
+        self.assertNotEqual(pages.fingerprint, changed.fingerprint)
+        # Only the page which held the removed property changes
+        self.assertEqual(len(set(pages.pages) - set(changed.pages)), 1)
+        self.assertEqual(len(set(changed.pages) - set(pages.pages)), 1)
+
+    def test_form(self):
+        class SmallForm(forms.Form):
+            name = forms.CharField()
+            age = forms.IntegerField()
+
+        form = SmallForm()
+        pages = paginate_form(form)
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(join_pages(pages.header, pages.pages.values()), form_to_schema(form))
+
+    def test_order(self):
+        schema = survey_schema(200)
+        plain = dict(schema, properties=dict(schema['properties']))
+        names = list(schema['properties'])
+
+        self.assertEqual(paginate_schema(plain).fingerprint,
+                         paginate_schema(dict(schema, properties=OrderedDict(
+                             sorted(schema['properties'].items())))).fingerprint)
+        self.assertEqual(paginate_schema(plain, order=names).fingerprint,
+                         paginate_schema(schema).fingerprint)
+        self.assertRaises(ValueError, paginate_schema, plain, order=names[1:])
+
+        class SmallForm(forms.Form):
+            name = forms.CharField()
+            age = forms.IntegerField()
+            email = forms.EmailField()
+
+        pages = paginate_form(SmallForm)
+        page = json.loads(pages.page(pages.header['pages'][0]))
+        self.assertEqual(page['order'], ['name', 'age', 'email'])
+
+    def test_arrays(self):
+        class SmallForm(forms.Form):
+            name = forms.CharField()
+
+        formset = forms.formsets.formset_factory(SmallForm)()
+        self.assertRaises(ValueError, paginate_form, formset)
+        self.assertRaises(ValueError, paginate_schema, {'type': 'array', 'items': {}})
+
+    def test_view(self):
+        pages = paginate_schema(survey_schema(100))
+        factory = RequestFactory()
+
+        response = schema_pages(factory.get('/'), pages)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response['ETag'], '"%s"' % pages.fingerprint)
+        self.assertEqual(json.loads(response.content.decode('utf-8')), pages.header)
+
+        fingerprint = pages.header['pages'][0]
+        response = schema_pages(factory.get('/'), pages, fingerprint)
+        self.assertEqual(response.content.decode('utf-8'), pages.page(fingerprint))
+        self.assertIn('max-age', response['Cache-Control'])
+
+        response = schema_pages(factory.get('/', HTTP_IF_NONE_MATCH='"%s"' % fingerprint),
+                                pages, fingerprint)
+        self.assertEqual(response.status_code, 304)
+
+        self.assertRaises(Http404, schema_pages, factory.get('/'), pages, 'missing')
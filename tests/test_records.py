@@ -0,0 +1,114 @@
+import datetime
+import decimal
+import gc
+import pickle
+
+from django import forms
+from django.test import TestCase
+import wtforms
+
+from schemulator import form_to_schema
+from schemulator import records
+from schemulator.records import Record, bind_records, schema_to_record
+
+
+schema = {
+    'title': 'Reading',
+    'properties': {
+        'sensor': {'type': 'string', 'maxLength': 10},
+        'value': {'type': 'number'},
+        'count': {'type': 'integer', 'optional': True},
+        'taken': {'type': 'string', 'format': 'date-time', 'optional': True},
+    },
+}
+
+
+class RecordTestCase(TestCase):
+
+    def test_record_class(self):
+        record_cls = schema_to_record(schema, 'Reading')
+        self.assertTrue(issubclass(record_cls, Record))
+        self.assertEqual(record_cls.__name__, 'Reading')
+        self.assertEqual(sorted(record_cls._fields), ['count', 'sensor', 'taken', 'value'])
+        self.assertEqual(record_cls._types['value'], float)
+        self.assertEqual(record_cls._types['count'], int)
+        self.assertEqual(record_cls._types['taken'], datetime.datetime)
+        self.assertIs(schema_to_record(dict(schema), 'Reading'), record_cls)
+
+    def test_record(self):
+        record_cls = schema_to_record(schema)
+        record = record_cls(sensor='a', value=1.5)
+        self.assertEqual(record.sensor, 'a')
+        self.assertIsNone(record.count)
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertRaises(AttributeError, setattr, record, 'other', 1)
+
+        made = record_cls._make({'sensor': 'a', 'value': 1.5, 'extra': True})
+        self.assertEqual(made, record)
+        self.assertEqual(made._asdict(), dict(sensor='a', value=1.5, count=None, taken=None))
+        self.assertEqual(pickle.loads(pickle.dumps(made, 2)), made)
+
+    def test_pickle(self):
+        record_cls = schema_to_record(schema, 'Reading')
+        record = record_cls(sensor='a', value=1.5)
+        pickled = pickle.dumps(record, 2)
+        self.assertNotIn(b'maxLength', pickled)
+        self.assertEqual(pickle.loads(pickled), record)
+
+        other = {'properties': {'unpickled': {'type': 'string'}}}
+        pickled = pickle.dumps(schema_to_record(other)(unpickled='a'), 2)
+        records._RECORD_CLASSES.clear()
+        gc.collect()
+        self.assertRaises(pickle.UnpicklingError, pickle.loads, pickled)
+        # Once the class is built again, its records unpickle
+        record_cls = schema_to_record(other)
+        self.assertEqual(pickle.loads(pickled), record_cls(unpickled='a'))
+
+    def test_field_types(self):
+        class TypedForm(forms.Form):
+            price = forms.DecimalField()
+            day = forms.DateField()
+            hour = forms.TimeField()
+            moment = forms.DateTimeField()
+            name = forms.CharField()
+
+        class TypedWTForm(wtforms.Form):
+            price = wtforms.DecimalField()
+            day = wtforms.DateField()
+            moment = wtforms.DateTimeField()
+            count = wtforms.IntegerField()
+
+        types = schema_to_record(form_to_schema(TypedForm))._types
+        self.assertEqual(types['price'], decimal.Decimal)
+        self.assertEqual(types['day'], datetime.date)
+        self.assertEqual(types['hour'], datetime.time)
+        self.assertEqual(types['moment'], datetime.datetime)
+        self.assertEqual(types['name'], type(u''))
+
+        types = schema_to_record(form_to_schema(TypedWTForm))._types
+        self.assertEqual(types['price'], decimal.Decimal)
+        self.assertEqual(types['day'], datetime.date)
+        self.assertEqual(types['moment'], datetime.datetime)
+        self.assertEqual(types['count'], int)
+
+    def test_bounded(self):
+        for i in range(records.MAX_RECORD_CLASSES + 10):
+            schema_to_record({'properties': {'field_%d' % i: {'type': 'string'}}})
+        self.assertEqual(len(records._RECORD_CLASSES), records.MAX_RECORD_CLASSES)
+
+    def test_invalid_names(self):
+        self.assertRaises(ValueError, schema_to_record, schema, 'Not a name')
+        self.assertRaises(ValueError, schema_to_record,
+                          {'properties': {'_fields': {'type': 'string'}}})
+        self.assertEqual(schema_to_record({'properties': {}})()._asdict(), {})
+
+    def test_bind_records(self):
+        payloads = [{'sensor': 'a', 'value': '2.5', 'count': '3'}, {'sensor': 'b'}]
+        for form_type in (None, 'wtforms'):
+            (record, errors) = next(bind_records(schema, payloads, form_type))
+            self.assertEqual((record.sensor, record.value, record.count), ('a', 2.5, 3))
+            self.assertFalse(errors)
+
+        (record, errors) = list(bind_records(schema, payloads))[1]
+        self.assertIsNone(record)
+        self.assertIn('value', errors)
@@ -0,0 +1,93 @@
+from django.test import TestCase
+from django.utils import translation
+from django import forms
+
+from schemulator import schema_to_form, schema_to_form_class
+from schemulator import render as schema_render
+from schemulator.cache import get_cache_backend
+from schemulator.metrics import CACHE_REQUESTS
+
+
+SCHEMA = {
+    'title': 'Contact',
+    'properties': {
+        'name': {'type': 'string', 'maxLength': 20, 'title': 'Name'},
+        'email': {'type': 'string', 'format': 'email', 'title': 'Email'},
+        'age': {'type': 'integer', 'title': 'Age', 'optional': True},
+    },
+}
+
+
+class HiddenTestForm(forms.Form):
+    name = forms.CharField(max_length=20)
+    token = forms.CharField(widget=forms.HiddenInput)
+
+    def clean(self):
+        raise forms.ValidationError("Something went wrong")
+
+
+class RenderTestCase(TestCase):
+
+    def setUp(self):
+        self.cache = get_cache_backend()
+        self.cache.clear()
+        self.calls = []
+        self.compute = schema_render._compute
+
+        def counting_compute(form, method):
+            self.calls.append(method)
+            return self.compute(form, method)
+
+        schema_render._compute = counting_compute
+
+    def tearDown(self):
+        schema_render._compute = self.compute
+        self.cache.clear()
+
+    def test_unbound(self):
+        form = schema_to_form(SCHEMA)
+        for method in schema_render.RENDER_METHODS:
+            html = schema_render.render_form(form, method)
+            self.assertEqual(html, getattr(form, method)())
+
+        CACHE_REQUESTS.reset()
+        schema_render.render_form(schema_to_form(SCHEMA))
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual(CACHE_REQUESTS.value(('html', 'hit')), 1)
+        self.assertEqual(CACHE_REQUESTS.value(('django', 'hit')), 0)
+
+        self.assertRaises(ValueError, schema_render.render_form, form, 'as_div')
+
+    def test_key(self):
+        schema_render.render_form(schema_to_form(SCHEMA))
+        form = schema_to_form(SCHEMA)
+        form.fields['name'].widget.attrs['class'] = 'wide'
+        self.assertIn('class="wide"', schema_render.render_form(form))
+        schema_render.render_form(schema_to_form(SCHEMA), 'as_p')
+        with translation.override('fr'):
+            schema_render.render_form(schema_to_form(SCHEMA))
+        self.assertEqual(len(self.calls), 3)
+
+    def test_bound(self):
+        form_cls = schema_to_form_class(SCHEMA)
+        form = form_cls({'name': 'Jane', 'email': 'not an email'})
+        html = schema_render.render_form(form)
+        self.assertEqual(html, form.as_p())
+        self.assertIn('value="Jane"', html)
+        self.assertEqual(self.calls, [])
+        self.assertRaises(ValueError, schema_render.get_rendered_form, form)
+
+        html = schema_render.render_form(HiddenTestForm({'name': 'Jane'}), 'as_ul')
+        self.assertEqual(html, HiddenTestForm({'name': 'Jane'}).as_ul())
+
+    def test_initial(self):
+        form_cls = schema_to_form_class(SCHEMA)
+        schema_render.render_form(form_cls())
+        for name in ('Jane', 'John'):
+            form = form_cls(initial={'name': name})
+            html = schema_render.render_form(form)
+            self.assertEqual(html, form.as_p())
+            self.assertIn('value="%s"' % name, html)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(schema_render.render_key(form, 'as_p'),
+                         schema_render.render_key(form_cls(), 'as_p'))
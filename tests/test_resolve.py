@@ -0,0 +1,93 @@
+from django.test import TestCase
+from django import forms
+
+import schemulator
+from schemulator import (compile_pattern, field_to_schema, resolve_class,
+                         schema_to_field, schema_to_wtfield)
+
+
+class CustomWidget(forms.widgets.TextInput):
+    pass
+
+
+class ResolveTestCase(TestCase):
+
+    def test_resolve_class(self):
+        self.assertIs(resolve_class('Textarea', 'django.forms.widgets'),
+                      forms.widgets.Textarea)
+        self.assertIs(resolve_class('tests.test_resolve.CustomWidget', 'django.forms.widgets'),
+                      CustomWidget)
+
+    def test_unexpected_classes(self):
+        self.assertRaises(ValueError, resolve_class, 'os.system', 'django.forms.widgets')
+        self.assertRaises(ValueError, resolve_class, 'collections.OrderedDict', 'django.forms')
+        self.assertRaises(ValueError, resolve_class, 'django.forms.CharField', 'django.forms.widgets')
+        self.assertRaises(ValueError, resolve_class, 'wtforms.widgets.TextInput', 'wtforms')
+        self.assertRaises(ValueError, resolve_class, 'HTMLString', 'wtforms.widgets')
+        self.assertFalse(('django.forms', 'collections.OrderedDict') in schemulator._RESOLVED)
+
+        self.assertRaises(ValueError, schema_to_field,
+                          {'type': 'string', '__django_form_field_cls': 'subprocess.Popen'})
+        self.assertRaises(ValueError, schema_to_field,
+                          {'type': 'string', '__widget': 'tests.test_resolve.ResolveTestCase'})
+        self.assertRaises(ValueError, schema_to_wtfield,
+                          {'type': 'string', '__wtforms_field_cls': 'subprocess.Popen'})
+        self.assertRaises(ValueError, schema_to_wtfield,
+                          {'type': 'string', '__widget': 'collections.OrderedDict'})
+        self.assertFalse('collections.OrderedDict' in schemulator._WTFORMS_WIDGETS)
+
+    def test_custom_widget_round_trip(self):
+        field = forms.CharField(widget=CustomWidget)
+        schema = field_to_schema(field)
+        self.assertEqual(schema['__widget'], 'tests.test_resolve.CustomWidget')
+        self.assertIsInstance(schema_to_field(schema).widget, CustomWidget)
+
+    def test_builtin_widget_name(self):
+        schema = field_to_schema(forms.CharField(widget=forms.widgets.Textarea))
+        self.assertEqual(schema['__widget'], 'Textarea')
+
+    def test_shared_wtforms_widget(self):
+        schema = {'type': 'string', '__widget': 'TextArea'}
+        first = schema_to_wtfield(schema).kwargs['widget']
+        second = schema_to_wtfield(schema).kwargs['widget']
+        self.assertIs(first, second)
+
+    def test_shared_wtforms_validators(self):
+        schema = {'type': 'string', 'minLength': 2, 'maxLength': 10, 'pattern': '^[a-z]+$'}
+        first = schema_to_wtfield(schema).kwargs['validators']
+        second = schema_to_wtfield(dict(schema, title='Other')).kwargs['validators']
+        self.assertEqual([v.__class__.__name__ for v in first], ['Length', 'Regexp'])
+        self.assertIs(first[0], second[0])
+        self.assertIs(first[1], second[1])
+        self.assertEqual((first[0].min, first[0].max), (2, 10))
+        self.assertIs(first[1].regex, compile_pattern('^[a-z]+$'))
+
+        other = schema_to_wtfield(dict(schema, maxLength=20)).kwargs['validators']
+        self.assertIsNot(first[0], other[0])
+        self.assertIs(first[1], other[1])
+
+    def test_bounded_shared_caches(self):
+        (max_patterns, max_validators) = (schemulator.MAX_PATTERNS, schemulator.MAX_WTFORMS_VALIDATORS)
+        schemulator.MAX_PATTERNS = schemulator.MAX_WTFORMS_VALIDATORS = 2
+        try:
+            first = compile_pattern('^a$')
+            compile_pattern('^b$')
+            self.assertIs(compile_pattern('^a$'), first)
+            compile_pattern('^c$')
+            self.assertEqual(list(schemulator._PATTERNS), ['^a$', '^c$'])
+            self.assertIs(compile_pattern('^a$'), first)
+
+            for length in range(5):
+                schema_to_wtfield({'type': 'string', 'maxLength': length})
+            self.assertEqual(len(schemulator._WTFORMS_VALIDATORS), 2)
+        finally:
+            (schemulator.MAX_PATTERNS, schemulator.MAX_WTFORMS_VALIDATORS) = (max_patterns, max_validators)
+
+    def test_merged_number_range(self):
+        schema = {'type': 'integer', 'minimum': 0, 'maximum': 10}
+        field = schema_to_wtfield(schema)
+        validators = field.kwargs['validators']
+        self.assertEqual(len(validators), 1)
+        self.assertEqual((validators[0].min, validators[0].max), (0, 10))
+        self.assertIsNot(validators[0],
+                         schema_to_wtfield({'type': 'number', 'minimum': 0.0, 'maximum': 10}).kwargs['validators'][0])
@@ -0,0 +1,118 @@
+import os
+import shutil
+import tempfile
+
+from django.forms.formsets import formset_factory
+from django.test import TestCase
+from django import forms
+
+from schemulator import form_to_schema
+from schemulator.shm import SharedSchemaStore
+from schemulator.utils import encode_schema, form_fingerprint
+
+
+class SharedTestForm(forms.Form):
+    text_field = forms.CharField(label="Text Field",
+                                 help_text="This is a text field",
+                                 max_length=100)
+    boolean_field = forms.BooleanField(label="Boolean Field",
+                                       required=False)
+
+
+class SharedSchemaStoreTestCase(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'schemas.shm')
+        self.store = SharedSchemaStore(self.path, slots=4, data_size=1024)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.dir)
+
+    def test_put_get(self):
+        self.assertEqual(self.store.get('missing'), None)
+        self.assertTrue(self.store.put('first', '{"a":1}'))
+        self.assertTrue(self.store.put('second', b'{"b":2}'))
+        self.assertEqual(bytes(self.store.get('first')), b'{"a":1}')
+        self.assertEqual(bytes(self.store.get('second')), b'{"b":2}')
+
+    def test_shared(self):
+        self.store.put('first', '{"a":1}')
+        other = SharedSchemaStore(self.path)
+        try:
+            self.assertEqual(other.slots, 4)
+            self.assertEqual(bytes(other.get('first')), b'{"a":1}')
+            other.put('second', '{"b":2}')
+        finally:
+            other.close()
+        self.assertEqual(bytes(self.store.get('second')), b'{"b":2}')
+
+    def test_full(self):
+        self.assertFalse(self.store.put('large', b'x' * 2048))
+        for i in range(4):
+            self.assertTrue(self.store.put('key%d' % i, b'{}'))
+        # Full stores are emptied to make room
+        self.assertTrue(self.store.put('key4', b'{}'))
+        self.assertEqual(self.store.get('key4'), b'{}')
+        self.assertEqual([self.store.get('key%d' % i) for i in range(4)], [None] * 4)
+
+        self.assertTrue(self.store.put('first', b'x' * 600))
+        self.assertTrue(self.store.put('second', b'y' * 600))
+        self.assertEqual(self.store.get('first'), None)
+        self.assertEqual(self.store.get('second'), b'y' * 600)
+
+    def test_emptied_while_reading(self):
+        self.store.put('first', b'{"a":1}')
+        lookup = self.store._lookup
+
+        def emptying_lookup(digest):
+            encoded = lookup(digest)
+            self.store._reset()
+            return encoded
+
+        self.store._lookup = emptying_lookup
+        self.assertEqual(self.store.get('first'), None)
+
+    def test_close(self):
+        self.store.put('first', b'{"a":1}')
+        encoded = self.store.get('first')
+        self.store.close()
+        self.assertEqual(encoded, b'{"a":1}')
+        self.store = SharedSchemaStore(self.path)
+
+    def test_not_a_store(self):
+        path = os.path.join(self.dir, 'other')
+        with open(path, 'wb') as other:
+            other.write(b'x' * 100)
+        self.assertRaises(ValueError, SharedSchemaStore, path)
+
+    def test_encoded_schema(self):
+        form = SharedTestForm()
+        encoded = encode_schema(form_to_schema(form)).encode('utf-8')
+        self.assertEqual(bytes(self.store.get_encoded_schema(form)), encoded)
+        self.assertEqual(bytes(self.store.get(form_fingerprint(form))), encoded)
+
+        self.store.warm([SharedTestForm()])
+        self.assertEqual(bytes(self.store.get_encoded_schema(form)), encoded)
+
+    def test_encoded_schema_type(self):
+        form = SharedTestForm()
+        miss = self.store.get_encoded_schema(form)
+        hit = self.store.get_encoded_schema(form)
+        self.assertIs(type(miss), bytes)
+        self.assertIs(type(hit), bytes)
+
+        # Schemas which do not fit are returned all the same
+        store = SharedSchemaStore(os.path.join(self.dir, 'small.shm'), slots=4, data_size=16)
+        try:
+            encoded = store.get_encoded_schema(form)
+            self.assertEqual(encoded, miss)
+            self.assertIsNone(store.get(form_fingerprint(form)))
+        finally:
+            store.close()
+
+    def test_encoded_formset_schema(self):
+        formset = formset_factory(SharedTestForm)()
+        encoded = encode_schema(form_to_schema(formset)).encode('utf-8')
+        self.assertEqual(bytes(self.store.get_encoded_schema(formset)), encoded)
@@ -0,0 +1,70 @@
+from django.test import TestCase
+from django import forms
+
+from schemulator import field_to_spec, field_to_schema, schema_to_field, schema_to_wtfield
+from schemulator.spec import FieldSpec
+
+
+text_field_js = {
+    '__django_form_field_cls': 'CharField',
+    '__widget': 'Textarea',
+    'type': 'string',
+    'title': 'Text Field',
+    'description': 'This is a text field',
+    'optional': True,
+    'maxLength': 100,
+    'null': False,
+    'x-custom': 'kept',
+}
+
+
+class FieldSpecTestCase(TestCase):
+
+    def test_schema_round_trip(self):
+        spec = FieldSpec.from_schema(text_field_js)
+        self.assertEqual(spec.to_schema(), text_field_js)
+        self.assertEqual(spec.max_length, 100)
+        self.assertEqual(spec.extra, {'x-custom': 'kept'})
+
+    def test_no_instance_dict(self):
+        spec = FieldSpec.from_schema(text_field_js)
+        self.assertFalse(hasattr(spec, '__dict__'))
+
+    def test_reads_like_a_schema(self):
+        spec = FieldSpec.from_schema(text_field_js)
+        self.assertIn('maxLength', spec)
+        self.assertNotIn('minLength', spec)
+        self.assertEqual(spec['__widget'], 'Textarea')
+        self.assertEqual(spec.get('x-custom'), 'kept')
+        self.assertIsNone(spec.get('minimum'))
+        self.assertRaises(KeyError, lambda: spec['minimum'])
+
+    def test_set_keywords(self):
+        spec = FieldSpec()
+        spec['minLength'] = 2
+        spec['x-custom'] = 'kept'
+        self.assertEqual(spec.min_length, 2)
+        self.assertEqual(spec.to_schema(), {'minLength': 2, 'x-custom': 'kept'})
+        self.assertEqual(spec.pop('minLength'), 2)
+        self.assertNotIn('minLength', spec)
+
+    def test_unset_attributes_left_out(self):
+        schema = field_to_schema(forms.CharField(label="Text Field"))
+        self.assertNotIn('maxLength', schema)
+        self.assertNotIn('minLength', schema)
+        self.assertEqual(schema['type'], 'string')
+        self.assertEqual(schema['optional'], False)
+
+    def test_both_directions(self):
+        field = forms.CharField(label="Text Field", max_length=100,
+                                widget=forms.widgets.Textarea)
+        spec = field_to_spec(field)
+        self.assertEqual(spec.to_schema(), field_to_schema(field))
+
+        recovered = schema_to_field(spec)
+        self.assertIsInstance(recovered, forms.CharField)
+        self.assertIsInstance(recovered.widget, forms.widgets.Textarea)
+        self.assertEqual(recovered.max_length, 100)
+
+        wtfield = schema_to_wtfield(FieldSpec(type='string', max_length=100))
+        self.assertEqual(wtfield.field_class.__name__, 'StringField')
@@ -0,0 +1,114 @@
+import gc
+
+from django.test import TestCase
+from django import forms
+import wtforms
+
+from schemulator import translate
+from schemulator.translate import translate_form
+
+
+class DjangoTestForm(forms.Form):
+    text_field = forms.CharField(label="Text Field",
+                                 help_text="This is a text field",
+                                 required=False,
+                                 max_length=100,
+                                 min_length=20)
+    text_area_field = forms.CharField(label="Text Area Field",
+                                      widget=forms.widgets.Textarea)
+    email_field = forms.EmailField(label="Email Field",
+                                   initial="email@example.com")
+    integer_field = forms.IntegerField(label="Integer Field",
+                                       max_value=50,
+                                       min_value=10)
+    choice_field = forms.ChoiceField(label="Choice Field",
+                                     choices=[("1", "One"), ("2", "Two")])
+
+
+class WTFormsTestForm(wtforms.Form):
+    string_field = wtforms.StringField("String Field",
+                                       description="This is a string field",
+                                       validators=[wtforms.validators.Length(min=10, max=50),
+                                                   wtforms.validators.Optional()])
+    radio_field = wtforms.RadioField("Radio Field",
+                                     choices=[("1", "One"), ("2", "Two")])
+    ip_field = wtforms.StringField("IP Field",
+                                   validators=[wtforms.validators.IPAddress(ipv6=True, ipv4=False)])
+    float_field = wtforms.FloatField("Float Field",
+                                     default=10.5,
+                                     validators=[wtforms.validators.NumberRange(min=0)])
+
+
+class StrictTestForm(forms.Form):
+    name = forms.CharField(required=False, max_length=10)
+
+    def __init__(self, strict=False, *args, **kwargs):
+        super(StrictTestForm, self).__init__(*args, **kwargs)
+        if strict:
+            self.fields['name'].required = True
+            self.fields['name'].max_length = 5
+
+
+class TranslateFormTestCase(TestCase):
+
+    def test_django_to_wtforms(self):
+        form = translate_form(DjangoTestForm(), target='wtforms')
+        self.assertIsInstance(form, wtforms.Form)
+
+        self.assertEqual(form.text_field.type, 'StringField')
+        self.assertEqual(form.text_field.label.text, 'Text Field')
+        self.assertEqual(form.text_field.description, 'This is a text field')
+        validators = [v.__class__.__name__ for v in form.text_field.validators]
+        self.assertEqual(validators, ['Optional', 'Length'])
+        self.assertEqual(form.text_field.validators[1].min, 20)
+        self.assertEqual(form.text_field.validators[1].max, 100)
+
+        self.assertEqual(form.text_area_field.type, 'TextAreaField')
+        self.assertEqual(form.email_field.default, 'email@example.com')
+        self.assertEqual(form.integer_field.validators[0].min, 10)
+        self.assertEqual(form.choice_field.type, 'SelectField')
+
+    def test_wtforms_to_django(self):
+        form = translate_form(WTFormsTestForm(), target='django')
+        self.assertIsInstance(form, forms.Form)
+
+        string_field = form.fields['string_field']
+        self.assertIsInstance(string_field, forms.CharField)
+        self.assertFalse(string_field.required)
+        self.assertEqual(string_field.min_length, 10)
+        self.assertEqual(string_field.max_length, 50)
+
+        self.assertIsInstance(form.fields['radio_field'], forms.ChoiceField)
+        self.assertIsInstance(form.fields['radio_field'].widget, forms.RadioSelect)
+        self.assertIsInstance(form.fields['ip_field'], forms.GenericIPAddressField)
+        self.assertEqual(form.fields['float_field'].min_value, 0)
+        self.assertEqual(form.fields['float_field'].initial, 10.5)
+
+    def test_translated_class_is_cached(self):
+        first = translate_form(DjangoTestForm(), target='wtforms')
+        second = translate_form(DjangoTestForm(), target='wtforms')
+        self.assertIs(first.__class__, second.__class__)
+
+    def test_fields_changed_on_instantiation(self):
+        lenient = translate_form(StrictTestForm(), target='wtforms')
+        strict = translate_form(StrictTestForm(strict=True), target='wtforms')
+        self.assertIsNot(lenient.__class__, strict.__class__)
+        self.assertEqual([v.__class__.__name__ for v in strict.name.validators], ['Length'])
+        self.assertEqual(strict.name.validators[0].max, 5)
+        self.assertEqual([v.__class__.__name__ for v in lenient.name.validators],
+                         ['Optional', 'Length'])
+        self.assertIs(translate_form(StrictTestForm(strict=True), target='wtforms').__class__,
+                      strict.__class__)
+
+    def test_translated_classes_are_not_kept_alive(self):
+        form_cls = type('DynamicForm', (forms.Form,), {'name': forms.CharField()})
+        translate_form(form_cls(), target='wtforms')
+        self.assertIn(form_cls, translate._TRANSLATED)
+        count = len(translate._TRANSLATED)
+        del form_cls
+        gc.collect()
+        self.assertEqual(len(translate._TRANSLATED), count - 1)
+
+    def test_same_framework(self):
+        form = DjangoTestForm()
+        self.assertIs(translate_form(form, target='django'), form)
@@ -5,6 +5,7 @@ import wtforms
 from jsonschema import validate, Draft4Validator, ValidationError
 
 from schemulator import form_to_schema, field_to_schema, schema_to_form, schema_to_wtfield
+from schemulator.utils import form_fingerprint
 
 
 # These are FIELDS to test within the form and their equivalent representation
@@ -304,6 +305,29 @@ class FormToSchemaTestCase(TestCase):
         schema = form_to_schema(test_form)
         self.assertIsNone(Draft4Validator.check_schema(schema))
 
+    def test_form_class(self):
+        class TestFormCopy(TestForm):
+            pass
+
+        self.assertIsNone(TestFormCopy._unbound_fields)
+        schema = form_to_schema(TestFormCopy)
+        self.assertEqual(schema, form_to_schema(test_form))
+        self.assertEqual(form_fingerprint(TestFormCopy), form_fingerprint(TestFormCopy()))
+
+        class LabelledForm(wtforms.Form):
+            first_name = wtforms.StringField()
+            last_name = wtforms.StringField('')
+
+        schema = form_to_schema(LabelledForm)
+        self.assertEqual(schema['properties']['first_name']['title'], 'First Name')
+        self.assertEqual(schema['properties']['last_name']['title'], '')
+        self.assertEqual(schema, form_to_schema(LabelledForm()))
+
+    def test_projection(self):
+        schema = form_to_schema(test_form, exclude=['boolean_field'])
+        self.assertNotIn('boolean_field', schema['properties'])
+        self.assertEqual(len(schema['properties']), len(test_form._fields) - 1)
+
     def test_boolean_field(self):
         field_schema = field_to_schema(test_form.boolean_field)
         self.assertTrue(dict_in_dict(field_schema, boolean_field_js))
@@ -474,6 +498,22 @@ class SchemaToFormTestCase(TestCase):
         tffi = [i[1].type for i in sorted(test_form._fields.items())]
         self.assertEquals(rffi, tffi)
 
+    def test_minified_form_to_schema_to_form(self):
+        """
+        Translates a form to a minified schema and back to a form and checks
+        that nothing was lost on the way.
+        """
+        schema = form_to_schema(test_form)
+        minified_schema = form_to_schema(test_form, minify=True)
+        self.assertLess(len(str(minified_schema)), len(str(schema)))
+        for prop in minified_schema['properties'].values():
+            self.assertNotIn('null', prop)
+            self.assertNotEqual(prop.get('optional'), False)
+        self.assertNotIn('__wtforms_field_cls', minified_schema['properties']['integer_field'])
+
+        recovered_form = schema_to_form(minified_schema, form_type='wtforms')
+        self.assertEqual(form_to_schema(recovered_form), schema)
+
     def test_boolean_field(self):
         schema = self.schema 
         schema['properties']['boolean_field'] = boolean_field_js
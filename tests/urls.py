@@ -0,0 +1,12 @@
+from django.conf.urls import url
+
+from schemulator.views import metrics
+from tests import views
+
+
+urlpatterns = [
+    url(r'^schema/(?P<name>\w+)$', views.schema),
+    url(r'^cached/(?P<name>\w+)$', views.cached),
+    url(r'^validate/(?P<name>\w+)$', views.validate),
+    url(r'^metrics$', metrics),
+]
@@ -0,0 +1,71 @@
+import json
+
+from django.http import Http404, HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from django import forms
+
+from schemulator import form_to_schema, schema_to_form_class
+from schemulator.utils import encode_schema
+from schemulator.views import JSON_CONTENT_TYPE, cached_schema
+
+
+"""
+Schema endpoints of the test project, as exercised by tests/loadtest.py.
+"""
+
+
+class SignupForm(forms.Form):
+    username = forms.CharField(label="Username", max_length=30, min_length=3)
+    email = forms.EmailField(label="Email")
+    age = forms.IntegerField(label="Age", min_value=13, required=False)
+    newsletter = forms.BooleanField(label="Newsletter", required=False)
+    country = forms.ChoiceField(label="Country",
+                                choices=[('fr', 'France'), ('es', 'Spain'), ('uk', 'United Kingdom')])
+
+
+# A survey with many questions, as the largest forms served
+SurveyForm = type('SurveyForm', (forms.Form,), dict(
+    ('question_%d' % i, forms.CharField(label="Question %d" % i, max_length=200, required=False))
+    for i in range(200)))
+
+FORMS = {
+    'signup': SignupForm,
+    'survey': SurveyForm,
+}
+
+
+def _form_cls(name):
+    try:
+        return FORMS[name]
+    except KeyError:
+        raise Http404("No such form")
+
+
+def _json_response(value):
+    return HttpResponse(encode_schema(value), content_type=JSON_CONTENT_TYPE)
+
+
+def schema(request, name):
+    """
+    Converts the form on every request.
+    """
+    return _json_response(form_to_schema(_form_cls(name)))
+
+
+def cached(request, name):
+    """
+    Serves the form schema from the cache, compressed if possible.
+    """
+    return cached_schema(request, _form_cls(name))
+
+
+@csrf_exempt
+@require_POST
+def validate(request, name):
+    """
+    Validates a JSON payload with the form built back from the form schema.
+    """
+    form_cls = schema_to_form_class(form_to_schema(_form_cls(name)))
+    form = form_cls(data=json.loads(request.body.decode('utf-8')))
+    return _json_response({'valid': form.is_valid(), 'errors': form.errors})